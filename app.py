@@ -16,6 +16,7 @@ from pathlib import Path
 from services.document_processor import DocumentProcessor, DocumentProcessingError, UnsupportedFormatError
 from services.nlp_analyzer import NLPAnalyzer
 from services.compliance_checker import ComplianceChecker
+from services.incremental_analyzer import IncrementalAnalyzer
 from services.recommendation_engine import RecommendationEngine
 from services.export_service import ExportService
 from services.google_sheets_service import GoogleSheetsError
@@ -77,6 +78,15 @@ def get_compliance_checker():
     logger.info("Initializing ComplianceChecker...")
     return ComplianceChecker()
 
+def get_incremental_analyzer():
+    """Get this session's incremental analyzer (it keeps the previous run's clause results)."""
+    if 'incremental_analyzer' not in st.session_state:
+        st.session_state.incremental_analyzer = IncrementalAnalyzer(
+            nlp_analyzer=get_nlp_analyzer(),
+            compliance_checker=get_compliance_checker()
+        )
+    return st.session_state.incremental_analyzer
+
 @st.cache_resource
 def get_recommendation_engine():
     """Initialize and cache recommendation engine."""
@@ -505,26 +515,27 @@ with tab1:
                 with st.spinner("Analyzing contract for compliance..."):
                     try:
                         # Get services
-                        nlp_analyzer = get_nlp_analyzer()
-                        compliance_checker = get_compliance_checker()
+                        incremental_analyzer = get_incremental_analyzer()
                         recommendation_engine = get_recommendation_engine()
                         
-                        # Step 1: NLP Analysis
+                        # Steps 1-2: NLP Analysis and Compliance Checking
+                        # (clauses unchanged since the last analysis are reused)
                         st.info("🔍 Step 1/3: Analyzing clauses...")
-                        clause_analyses = nlp_analyzer.analyze_clauses(
-                            st.session_state.processed_document.clauses
-                        )
-                        st.session_state.analysis_results = clause_analyses
-                        
-                        # Step 2: Compliance Checking
                         st.info("⚖️ Step 2/3: Checking compliance...")
-                        compliance_report = compliance_checker.check_compliance(
-                            clause_analyses,
-                            st.session_state.selected_frameworks,
-                            st.session_state.processed_document.document_id
+                        clause_analyses, compliance_report = incremental_analyzer.analyze(
+                            st.session_state.processed_document,
+                            st.session_state.selected_frameworks
                         )
+                        st.session_state.analysis_results = clause_analyses
                         st.session_state.compliance_report = compliance_report
                         
+                        clause_diff = incremental_analyzer.last_diff
+                        if clause_diff and clause_diff.reused_clauses:
+                            st.info(
+                                f"♻️ Reused results for {clause_diff.reused_clauses} unchanged clauses, "
+                                f"analyzed {clause_diff.analyzed_clauses} new or edited clauses"
+                            )
+                        
                         # Step 3: Generate Recommendations
                         st.info("💡 Step 3/3: Generating recommendations...")
                         recommendations = recommendation_engine.generate_recommendations(
@@ -1405,6 +1416,63 @@ with tab4:
                     except Exception as e:
                         st.error(f"❌ Error creating rewritten contract: {e}")
                         logger.error(f"Document creation error: {e}", exc_info=True)
+            
+            if st.button("🔄 Re-analyze Rewritten Contract", use_container_width=True):
+                with st.spinner("Re-analyzing rewritten contract..."):
+                    try:
+                        original_document = st.session_state.processed_document
+                        updated_text = updater.create_updated_text(
+                            original_text=original_document.extracted_text,
+                            generated_clauses=generated
+                        )
+                        updated_document = get_document_processor().process_text(
+                            updated_text,
+                            filename=f"{Path(original_document.original_filename).stem}_rewritten.txt"
+                        )
+                        
+                        # Only the inserted clauses are new; the rest reuse the last analysis
+                        incremental_analyzer = get_incremental_analyzer()
+                        clause_analyses, updated_report = incremental_analyzer.analyze(
+                            updated_document,
+                            st.session_state.selected_frameworks
+                        )
+                        
+                        previous_score = report.overall_score
+                        st.session_state.processed_document = updated_document
+                        st.session_state.analysis_results = clause_analyses
+                        st.session_state.compliance_report = updated_report
+                        st.session_state.recommendations = get_recommendation_engine().generate_recommendations(
+                            updated_report
+                        )
+                        st.session_state.generated_clauses = None
+                        
+                        st.success("✅ Rewritten contract analyzed and set as the current contract!")
+                        
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            st.metric(
+                                "Compliance Score",
+                                f"{updated_report.overall_score:.0f}%",
+                                delta=f"{updated_report.overall_score - previous_score:+.0f}%"
+                            )
+                        with col2:
+                            st.metric(
+                                "Missing Clauses",
+                                len(updated_report.missing_requirements),
+                                delta=len(updated_report.missing_requirements) - len(missing_reqs),
+                                delta_color="inverse"
+                            )
+                        
+                        clause_diff = incremental_analyzer.last_diff
+                        if clause_diff and clause_diff.reused_clauses:
+                            st.info(
+                                f"♻️ Reused results for {clause_diff.reused_clauses} unchanged clauses, "
+                                f"analyzed {clause_diff.analyzed_clauses} new or edited clauses"
+                            )
+                    
+                    except Exception as e:
+                        st.error(f"❌ Error re-analyzing rewritten contract: {e}")
+                        logger.error(f"Re-analysis error: {e}", exc_info=True)
     
     else:
         # No missing clauses
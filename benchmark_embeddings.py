@@ -0,0 +1,120 @@
+"""
+Benchmark the sentence embedding backends.
+
+Segments the sample and CUAD contracts into clauses, embeds them with the
+PyTorch SentenceTransformer and with the ONNX Runtime backend (fp32 and
+int8), and reports throughput and cosine drift against the PyTorch output.
+
+Usage:
+    python benchmark_embeddings.py [--limit 2000] [--threads 4] [--batch-size 32]
+"""
+import argparse
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from config.settings import config
+from services.clause_segmenter import ClauseSegmenter
+from services.onnx_embedding_backend import (
+    FP32_MIN_COSINE,
+    INT8_MIN_COSINE,
+    OnnxSentenceEncoder,
+    available_cpus,
+    default_model_dir,
+)
+
+CONTRACT_DIRS = ["sample_contracts", "cuad_contracts_txt"]
+
+
+def load_clauses(dirs: List[str], limit: int) -> List[str]:
+    """
+    Segment contract text files into distinct clause texts.
+
+    Args:
+        dirs: Directories to read *.txt contracts from
+        limit: Maximum number of clauses
+
+    Returns:
+        List of clause texts
+    """
+    segmenter = ClauseSegmenter()
+    clauses = {}
+
+    for directory in dirs:
+        for path in sorted(Path(directory).glob("*.txt")):
+            text = path.read_text(encoding="utf-8", errors="ignore")
+            for clause in segmenter.segment(text):
+                clauses.setdefault(clause.text, None)
+                if len(clauses) >= limit:
+                    return list(clauses)
+
+    return list(clauses)
+
+
+def time_encode(model, texts: List[str], batch_size: int) -> tuple:
+    """Encode texts after a warm-up call; return (embeddings, seconds)."""
+    model.encode(texts[:batch_size], batch_size=batch_size, convert_to_numpy=True)
+    start = time.perf_counter()
+    embeddings = model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
+    return np.asarray(embeddings, dtype=np.float32), time.perf_counter() - start
+
+
+def cosine_rows(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise cosine similarity of two embedding matrices."""
+    norms = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+    return (a * b).sum(axis=1) / np.clip(norms, 1e-12, None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default=config.models.sentence_transformer_model)
+    parser.add_argument("--limit", type=int, default=2000, help="maximum clauses to embed")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--threads", type=int, default=config.models.onnx_threads,
+                        help="torch and onnxruntime threads (default: usable CPUs)")
+    parser.add_argument("--model-dir", default=config.models.onnx_model_dir,
+                        help="ONNX export directory (exported on first run)")
+    parser.add_argument("--dirs", nargs="+", default=CONTRACT_DIRS)
+    args = parser.parse_args()
+
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    texts = load_clauses(args.dirs, args.limit)
+    if not texts:
+        parser.error(f"no .txt contracts found in {', '.join(args.dirs)}")
+    threads = args.threads or available_cpus()
+    print(f"{len(texts)} clauses from {', '.join(args.dirs)}, {threads} threads")
+
+    torch.set_num_threads(threads)
+    reference, seconds = time_encode(SentenceTransformer(args.model, device="cpu"), texts, args.batch_size)
+
+    rows = [("torch fp32", len(texts) / seconds, None)]
+    model_dir = args.model_dir or default_model_dir(config.models.cache_dir, args.model)
+
+    for quantized, tolerance in ((False, FP32_MIN_COSINE), (True, INT8_MIN_COSINE)):
+        encoder = OnnxSentenceEncoder.load_or_export(
+            args.model, model_dir, quantized=quantized, num_threads=threads
+        )
+        embeddings, seconds = time_encode(encoder, texts, args.batch_size)
+        cosines = cosine_rows(reference, embeddings)
+        rows.append((f"onnx {'int8' if quantized else 'fp32'}", len(texts) / seconds, (cosines, tolerance)))
+
+    print(f"\n{'backend':<12} {'texts/s':>9} {'speedup':>8} {'cos mean':>9} {'cos p1':>9} {'cos min':>9}  tolerance")
+    baseline = rows[0][1]
+    for name, throughput, drift in rows:
+        line = f"{name:<12} {throughput:>9.1f} {throughput / baseline:>7.2f}x"
+        if drift is not None:
+            cosines, tolerance = drift
+            status = "ok" if cosines.min() >= tolerance else "EXCEEDED"
+            line += (
+                f" {cosines.mean():>9.6f} {np.percentile(cosines, 1):>9.6f} "
+                f"{cosines.min():>9.6f}  >= {tolerance} {status}"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,15 @@ class ModelConfig:
     cache_dir: str = "./models_cache"
     use_gpu: bool = True
     max_length: int = 512
+    embedding_store_path: Optional[str] = None  # SQLite file for persistent embeddings
+    embedding_cache_max_entries: int = 50000  # per in-memory embedding cache
+    embedding_cache_max_mb: int = 256  # per in-memory embedding cache
+    inference_batch_size: int = 16  # texts per LegalBERT forward pass
+    inference_threads: Optional[int] = None  # torch CPU threads, process-mode batch workers only (None = torch default)
+    embedding_backend: str = 'torch'  # 'torch' or 'onnx'
+    onnx_quantize: bool = True  # int8 dynamic quantization for the ONNX backend
+    onnx_threads: Optional[int] = None  # onnxruntime intra-op threads (None = usable CPUs)
+    onnx_model_dir: Optional[str] = None  # defaults to <cache_dir>/onnx/<model>
 
 
 @dataclass
@@ -30,6 +39,20 @@ class ProcessingConfig:
     ocr_language: str = 'eng'
     confidence_threshold: float = 0.75
     processing_timeout: int = 300  # seconds
+    pdf_max_workers: Optional[int] = None  # defaults to CPU count
+    pdf_parallel_min_pages: int = 16  # shard page extraction from this many pages
+    pdf_stream_segmentation: bool = True  # segment text PDFs page by page as pages are extracted
+    ocr_max_workers: Optional[int] = None  # defaults to CPU count
+    ocr_initial_dpi: int = 200  # first OCR pass; pages below min confidence are redone
+    ocr_max_dpi: int = 300
+    ocr_thread_limit: int = 1  # Tesseract OMP_THREAD_LIMIT in batch worker processes (0 = leave unset)
+    extraction_cache_enabled: bool = True
+    extraction_cache_dir: Optional[str] = None  # defaults to temp/extraction_cache
+    extraction_cache_max_mb: int = 512
+    kb_load_workers: Optional[int] = None  # knowledge base JSONL parse processes (None = CPU count)
+    kb_parallel_min_mb: int = 16  # parse JSONL files this large across processes
+    kb_snapshot_enabled: bool = True  # reuse a binary snapshot of parsed JSONL files
+    kb_snapshot_dir: Optional[str] = None  # defaults to temp/kb_snapshots
 
 
 @dataclass
@@ -39,6 +62,11 @@ class ComplianceConfig:
     risk_tolerance: str = 'Medium'  # Low, Medium, High
     similarity_threshold: float = 0.50  # Lowered from 0.75 for better clause matching
     min_clause_length: int = 20
+    rule_pack_dir: Optional[str] = None  # defaults to data/ (*_rules.json, *_rules.yaml)
+    report_cache_enabled: bool = True
+    report_cache_dir: Optional[str] = None  # defaults to temp/report_cache
+    report_cache_max_mb: int = 256
+    report_cache_ttl_hours: float = 24.0
 
 
 @dataclass
@@ -127,6 +155,15 @@ class AppConfig:
                 'cache_dir': self.models.cache_dir,
                 'use_gpu': self.models.use_gpu,
                 'max_length': self.models.max_length,
+                'embedding_store_path': self.models.embedding_store_path,
+                'embedding_cache_max_entries': self.models.embedding_cache_max_entries,
+                'embedding_cache_max_mb': self.models.embedding_cache_max_mb,
+                'inference_batch_size': self.models.inference_batch_size,
+                'inference_threads': self.models.inference_threads,
+                'embedding_backend': self.models.embedding_backend,
+                'onnx_quantize': self.models.onnx_quantize,
+                'onnx_threads': self.models.onnx_threads,
+                'onnx_model_dir': self.models.onnx_model_dir,
             },
             'processing': {
                 'max_file_size_mb': self.processing.max_file_size_mb,
@@ -134,12 +171,31 @@ class AppConfig:
                 'ocr_language': self.processing.ocr_language,
                 'confidence_threshold': self.processing.confidence_threshold,
                 'processing_timeout': self.processing.processing_timeout,
+                'pdf_max_workers': self.processing.pdf_max_workers,
+                'pdf_parallel_min_pages': self.processing.pdf_parallel_min_pages,
+                'pdf_stream_segmentation': self.processing.pdf_stream_segmentation,
+                'ocr_max_workers': self.processing.ocr_max_workers,
+                'ocr_initial_dpi': self.processing.ocr_initial_dpi,
+                'ocr_max_dpi': self.processing.ocr_max_dpi,
+                'ocr_thread_limit': self.processing.ocr_thread_limit,
+                'extraction_cache_enabled': self.processing.extraction_cache_enabled,
+                'extraction_cache_dir': self.processing.extraction_cache_dir,
+                'extraction_cache_max_mb': self.processing.extraction_cache_max_mb,
+                'kb_load_workers': self.processing.kb_load_workers,
+                'kb_parallel_min_mb': self.processing.kb_parallel_min_mb,
+                'kb_snapshot_enabled': self.processing.kb_snapshot_enabled,
+                'kb_snapshot_dir': self.processing.kb_snapshot_dir,
             },
             'compliance': {
                 'enabled_frameworks': self.compliance.enabled_frameworks,
                 'risk_tolerance': self.compliance.risk_tolerance,
                 'similarity_threshold': self.compliance.similarity_threshold,
                 'min_clause_length': self.compliance.min_clause_length,
+                'rule_pack_dir': self.compliance.rule_pack_dir,
+                'report_cache_enabled': self.compliance.report_cache_enabled,
+                'report_cache_dir': self.compliance.report_cache_dir,
+                'report_cache_max_mb': self.compliance.report_cache_max_mb,
+                'report_cache_ttl_hours': self.compliance.report_cache_ttl_hours,
             },
             'llm': {
                 'max_tokens': self.llm.max_tokens,
@@ -170,6 +226,75 @@ class AppConfig:
         if os.getenv('USE_GPU'):
             config.models.use_gpu = os.getenv('USE_GPU').lower() == 'true'
         
+        if os.getenv('EMBEDDING_STORE_PATH'):
+            config.models.embedding_store_path = os.getenv('EMBEDDING_STORE_PATH')
+        
+        if os.getenv('EMBEDDING_CACHE_MAX_ENTRIES'):
+            config.models.embedding_cache_max_entries = int(os.getenv('EMBEDDING_CACHE_MAX_ENTRIES'))
+        
+        if os.getenv('EMBEDDING_CACHE_MAX_MB'):
+            config.models.embedding_cache_max_mb = int(os.getenv('EMBEDDING_CACHE_MAX_MB'))
+        
+        if os.getenv('INFERENCE_BATCH_SIZE'):
+            config.models.inference_batch_size = int(os.getenv('INFERENCE_BATCH_SIZE'))
+        
+        if os.getenv('INFERENCE_THREADS'):
+            config.models.inference_threads = int(os.getenv('INFERENCE_THREADS'))
+        
+        if os.getenv('EMBEDDING_BACKEND'):
+            config.models.embedding_backend = os.getenv('EMBEDDING_BACKEND').lower()
+        
+        if os.getenv('ONNX_QUANTIZE'):
+            config.models.onnx_quantize = os.getenv('ONNX_QUANTIZE').lower() == 'true'
+        
+        if os.getenv('ONNX_THREADS'):
+            config.models.onnx_threads = int(os.getenv('ONNX_THREADS'))
+        
+        if os.getenv('ONNX_MODEL_DIR'):
+            config.models.onnx_model_dir = os.getenv('ONNX_MODEL_DIR')
+        
+        if os.getenv('PDF_STREAM_SEGMENTATION'):
+            config.processing.pdf_stream_segmentation = os.getenv('PDF_STREAM_SEGMENTATION').lower() == 'true'
+        
+        if os.getenv('OCR_THREAD_LIMIT'):
+            config.processing.ocr_thread_limit = int(os.getenv('OCR_THREAD_LIMIT'))
+        
+        if os.getenv('EXTRACTION_CACHE_ENABLED'):
+            config.processing.extraction_cache_enabled = os.getenv('EXTRACTION_CACHE_ENABLED').lower() == 'true'
+        
+        if os.getenv('EXTRACTION_CACHE_DIR'):
+            config.processing.extraction_cache_dir = os.getenv('EXTRACTION_CACHE_DIR')
+        
+        if os.getenv('EXTRACTION_CACHE_MAX_MB'):
+            config.processing.extraction_cache_max_mb = int(os.getenv('EXTRACTION_CACHE_MAX_MB'))
+        
+        if os.getenv('KB_LOAD_WORKERS'):
+            config.processing.kb_load_workers = int(os.getenv('KB_LOAD_WORKERS'))
+        
+        if os.getenv('KB_PARALLEL_MIN_MB'):
+            config.processing.kb_parallel_min_mb = int(os.getenv('KB_PARALLEL_MIN_MB'))
+        
+        if os.getenv('KB_SNAPSHOT_ENABLED'):
+            config.processing.kb_snapshot_enabled = os.getenv('KB_SNAPSHOT_ENABLED').lower() == 'true'
+        
+        if os.getenv('KB_SNAPSHOT_DIR'):
+            config.processing.kb_snapshot_dir = os.getenv('KB_SNAPSHOT_DIR')
+        
+        if os.getenv('RULE_PACK_DIR'):
+            config.compliance.rule_pack_dir = os.getenv('RULE_PACK_DIR')
+        
+        if os.getenv('REPORT_CACHE_ENABLED'):
+            config.compliance.report_cache_enabled = os.getenv('REPORT_CACHE_ENABLED').lower() == 'true'
+        
+        if os.getenv('REPORT_CACHE_DIR'):
+            config.compliance.report_cache_dir = os.getenv('REPORT_CACHE_DIR')
+        
+        if os.getenv('REPORT_CACHE_MAX_MB'):
+            config.compliance.report_cache_max_mb = int(os.getenv('REPORT_CACHE_MAX_MB'))
+        
+        if os.getenv('REPORT_CACHE_TTL_HOURS'):
+            config.compliance.report_cache_ttl_hours = float(os.getenv('REPORT_CACHE_TTL_HOURS'))
+        
         return config
 
 
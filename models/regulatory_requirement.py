@@ -3,7 +3,7 @@ Data models for regulatory requirements and compliance checking.
 """
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 import numpy as np
 
 
@@ -83,6 +83,75 @@ class ClauseComplianceResult:
         }
 
 
+@dataclass
+class RequirementMatchPlan:
+    """
+    Ranked requirement matches for every clause of a document, per framework.
+    
+    Computed once per compliance check and shared by clause assessment and
+    missing-requirement detection.
+    """
+    document_id: str
+    clause_ids: List[str]
+    top_k: int
+    matches: Dict[str, List[List[Tuple[RegulatoryRequirement, float]]]] = field(default_factory=dict)
+    
+    @property
+    def frameworks(self) -> List[str]:
+        """Frameworks included in the plan."""
+        return list(self.matches.keys())
+    
+    def has_framework(self, framework: str) -> bool:
+        """Check whether matches were computed for a framework."""
+        return framework.upper() in self.matches
+    
+    def get_framework_matches(
+        self,
+        framework: str,
+        top_k: Optional[int] = None
+    ) -> List[List[Tuple[RegulatoryRequirement, float]]]:
+        """
+        Get ranked matches for every clause in a framework.
+        
+        Args:
+            framework: Framework name
+            top_k: Optional cut-off (must not exceed the plan's top_k)
+            
+        Returns:
+            One list of (requirement, similarity_score) tuples per clause
+        """
+        framework_matches = self.matches.get(framework.upper(), [])
+        if top_k is None or top_k >= self.top_k:
+            return framework_matches
+        return [clause_matches[:top_k] for clause_matches in framework_matches]
+    
+    def covered_requirement_ids(self, framework: str) -> Set[str]:
+        """Get IDs of requirements matched by at least one clause."""
+        return {
+            req.requirement_id
+            for clause_matches in self.matches.get(framework.upper(), [])
+            for req, _ in clause_matches
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert plan to dictionary of requirement IDs and scores."""
+        return {
+            'document_id': self.document_id,
+            'clause_ids': self.clause_ids,
+            'top_k': self.top_k,
+            'matches': {
+                framework: [
+                    [
+                        {'requirement_id': req.requirement_id, 'score': score}
+                        for req, score in clause_matches
+                    ]
+                    for clause_matches in framework_matches
+                ]
+                for framework, framework_matches in self.matches.items()
+            }
+        }
+
+
 @dataclass
 class ComplianceSummary:
     """
@@ -121,9 +190,10 @@ class ComplianceReport:
     missing_requirements: List[RegulatoryRequirement] = field(default_factory=list)
     high_risk_items: List[ClauseComplianceResult] = field(default_factory=list)
     summary: Optional[ComplianceSummary] = None
+    match_plan: Optional[RequirementMatchPlan] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert report to dictionary."""
+        """Convert report to dictionary (excluding the match plan)."""
         return {
             'document_id': self.document_id,
             'frameworks_checked': self.frameworks_checked,
@@ -0,0 +1,130 @@
+"""
+Data models for declarative compliance rule packs.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from models.regulatory_requirement import RegulatoryRequirement, RiskLevel
+
+
+# Issue templates a rule pack may define; {elements} and {description} are filled in
+ISSUE_TEMPLATE_FIELDS = (
+    'partial_few_missing',  # partial match, at most missing_ratio of elements missing
+    'partial_missing',  # partial match with missing elements
+    'non_compliant',  # similarity below the partial threshold
+    'non_compliant_missing'  # added after non_compliant when elements are missing
+)
+
+
+@dataclass
+class RuleCheck:
+    """
+    A clause-type specific check: the clause passes when at least min_count
+    of its keywords occur in, or its regex patterns match, the lowercased
+    clause text; otherwise issue is reported.
+    """
+    issue: str
+    keywords: List[str] = field(default_factory=list)
+    patterns: List[str] = field(default_factory=list)
+    min_count: int = 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert check to dictionary."""
+        return {
+            'issue': self.issue,
+            'keywords': self.keywords,
+            'patterns': self.patterns,
+            'min_count': self.min_count
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RuleCheck':
+        """Create from dictionary."""
+        return cls(
+            issue=data['issue'],
+            keywords=[keyword.lower() for keyword in data.get('keywords', [])],
+            patterns=list(data.get('patterns', [])),
+            min_count=int(data.get('min_count', 1))
+        )
+
+
+@dataclass
+class RulePack:
+    """
+    Compliance rules of one regulatory framework, defined as data.
+    """
+    framework: str
+    compliant_threshold: float = 0.85
+    partial_threshold: float = 0.75
+    missing_ratio: Optional[float] = None  # None: partial matches are not graded by missing elements
+    issue_templates: Dict[str, Optional[str]] = field(default_factory=dict)
+    risk_levels: Dict[str, RiskLevel] = field(default_factory=lambda: {
+        'compliant': RiskLevel.LOW,
+        'partial': RiskLevel.MEDIUM,
+        'non_compliant': RiskLevel.HIGH
+    })
+    checks: Dict[str, List[RuleCheck]] = field(default_factory=dict)  # by requirement clause type
+    element_keywords: Dict[str, List[str]] = field(default_factory=dict)  # overrides by element text
+    requirements: List[RegulatoryRequirement] = field(default_factory=list)
+    source: str = ''
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert rule pack to dictionary (the rule pack file format)."""
+        return {
+            'framework': self.framework,
+            'thresholds': {
+                'compliant': self.compliant_threshold,
+                'partial': self.partial_threshold,
+                'missing_ratio': self.missing_ratio
+            },
+            'issue_templates': self.issue_templates,
+            'risk_levels': {outcome: risk.value for outcome, risk in self.risk_levels.items()},
+            'checks': {
+                clause_type: [check.to_dict() for check in checks]
+                for clause_type, checks in self.checks.items()
+            },
+            'element_keywords': self.element_keywords,
+            'requirements': [requirement.to_dict() for requirement in self.requirements]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], source: str = '') -> 'RulePack':
+        """Create from dictionary."""
+        framework = data['framework'].upper()
+        thresholds = data.get('thresholds', {})
+        risk_levels = {
+            outcome: RiskLevel(value)
+            for outcome, value in data.get('risk_levels', {}).items()
+        }
+        
+        return cls(
+            framework=framework,
+            compliant_threshold=float(thresholds.get('compliant', 0.85)),
+            partial_threshold=float(thresholds.get('partial', 0.75)),
+            missing_ratio=thresholds.get('missing_ratio'),
+            issue_templates=dict(data.get('issue_templates', {})),
+            risk_levels={**cls.__dataclass_fields__['risk_levels'].default_factory(), **risk_levels},
+            checks={
+                clause_type: [RuleCheck.from_dict(check) for check in checks]
+                for clause_type, checks in data.get('checks', {}).items()
+            },
+            element_keywords={
+                element: [keyword.lower() for keyword in keywords]
+                for element, keywords in data.get('element_keywords', {}).items()
+            },
+            requirements=[
+                RegulatoryRequirement(
+                    requirement_id=item['requirement_id'],
+                    framework=item.get('framework', framework),
+                    article_reference=item.get('article_reference', ''),
+                    clause_type=item['clause_type'],
+                    description=item['description'],
+                    mandatory=item.get('mandatory', True),
+                    keywords=item.get('keywords', []),
+                    mandatory_elements=item.get('mandatory_elements', []),
+                    risk_level=RiskLevel(item.get('risk_level', RiskLevel.HIGH.value))
+                )
+                for item in data.get('requirements', [])
+            ],
+            source=source
+        )
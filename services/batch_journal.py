@@ -0,0 +1,184 @@
+"""
+Batch Journal - append-only checkpoint log for resumable batch runs.
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BatchJournal:
+    """
+    Append-only JSONL journal of completed batch files.
+    
+    Each line records one finished file with its content hash, the framework
+    it was checked against, status, compliance score and timing. Lines are flushed and fsynced as they are
+    written, so a crash loses at most the file in progress.
+    """
+    
+    def __init__(self, journal_path: str):
+        """
+        Initialize batch journal.
+        
+        Args:
+            journal_path: Path to the JSONL journal file (created if missing)
+        """
+        self.journal_path = Path(journal_path)
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._torn_tail = self._has_torn_tail()
+    
+    @staticmethod
+    def hash_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+        """
+        Compute the SHA-256 content hash of a file.
+        
+        Args:
+            file_path: Path to the file
+            chunk_size: Read size in bytes
+        
+        Returns:
+            Hex digest of the file contents
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def record(
+        self,
+        result: Any,
+        file_path: str,
+        content_hash: str,
+        framework: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Append a finished file to the journal.
+        
+        Args:
+            result: BatchResult for the file
+            file_path: Path the file was read from
+            content_hash: SHA-256 of the file contents
+            framework: Compliance framework the file was checked against
+        
+        Returns:
+            The journal entry that was written
+        """
+        comp = result.compliance_results or {}
+        missing_clauses = comp.get('missing_clauses', [])
+        
+        entry = {
+            'file_path': str(file_path),
+            'filename': result.filename,
+            'content_hash': content_hash,
+            'framework': framework,
+            'status': 'success' if result.success else 'failed',
+            'score': comp.get('overall_score') if result.success and comp else None,
+            'processing_time': result.processing_time,
+            'missing_clauses_count': len(missing_clauses),
+            'missing_risk_levels': [c.get('risk_level', '') for c in missing_clauses],
+            'error': result.error,
+            'completed_at': datetime.now().isoformat()
+        }
+        
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                # Keep a torn line from a crashed run from swallowing this entry
+                if self._torn_tail:
+                    f.write('\n')
+                    self._torn_tail = False
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        
+        return entry
+    
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over journal entries in write order.
+        
+        A torn final line from an interrupted write is skipped.
+        
+        Yields:
+            Journal entry dictionaries
+        """
+        if not self.journal_path.exists():
+            return
+        
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable journal line {line_num} in {self.journal_path}")
+    
+    def completed_hashes(self, framework: Optional[str] = None) -> Set[str]:
+        """
+        Get content hashes of files the journal records as processed successfully
+        against a framework.
+        
+        Failed files are left out so a resumed run retries them.
+        
+        Args:
+            framework: Framework the files must have been checked against
+        
+        Returns:
+            Set of SHA-256 hex digests
+        """
+        return {
+            entry['content_hash'] for entry in self.iter_entries()
+            if 'content_hash' in entry
+            and entry.get('status') == 'success'
+            and entry.get('framework') == framework
+        }
+    
+    def latest_entries(self) -> List[Dict[str, Any]]:
+        """
+        Get the most recent entry for each file path and framework.
+        
+        Returns:
+            List of journal entries, one per file and framework it was checked against
+        """
+        latest: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+        for entry in self.iter_entries():
+            latest[(entry.get('file_path'), entry.get('framework'))] = entry
+        return list(latest.values())
+    
+    def clear(self):
+        """Delete the journal file."""
+        with self._lock:
+            if self.journal_path.exists():
+                self.journal_path.unlink()
+        logger.info(f"Batch journal cleared: {self.journal_path}")
+    
+    def __len__(self) -> int:
+        """Get the number of entries in the journal."""
+        return sum(1 for _ in self.iter_entries())
+    
+    def _has_torn_tail(self) -> bool:
+        """Check whether the journal ends mid-line (interrupted write)."""
+        if not self.journal_path.exists() or self.journal_path.stat().st_size == 0:
+            return False
+        with open(self.journal_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b'\n'
+
+
+def get_entry_time(entry: Dict[str, Any]) -> Optional[datetime]:
+    """Parse the completion timestamp of a journal entry."""
+    try:
+        return datetime.fromisoformat(entry['completed_at'])
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -2,22 +2,33 @@
 Batch Processor Service - Handle multiple contract files simultaneously.
 """
 import concurrent.futures
-from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures.process import BrokenProcessPool
+from collections import deque
+import json
+import os
+import sys
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator
 from pathlib import Path
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
+from config.settings import config
 from services.document_processor import DocumentProcessor, DocumentProcessingError
 from services.nlp_analyzer import NLPAnalyzer
 from services.compliance_checker import ComplianceChecker
+from services.embedding_generator import EmbeddingStats
 from services.recommendation_engine import RecommendationEngine
 from services.slack_notifier import SlackNotifier
+from services.batch_journal import BatchJournal, get_entry_time
 from models.processed_document import ProcessedDocument
+from models.regulatory_requirement import ComplianceReport
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+EXECUTION_MODES = ('thread', 'process')
+
 
 @dataclass
 class BatchResult:
@@ -30,6 +41,101 @@ class BatchResult:
     recommendations: Optional[List[Dict[str, Any]]] = None
     error: Optional[str] = None
     processing_time: float = 0.0
+    embedding_stats: Optional[EmbeddingStats] = None
+
+
+@dataclass
+class BatchMetrics:
+    """Running aggregate of batch results, updated as each file completes."""
+    total_files: int = 0
+    successful: int = 0
+    failed: int = 0
+    total_processing_time: float = 0.0
+    files_analyzed: int = 0
+    score_sum: float = 0.0
+    min_score: Optional[float] = None
+    max_score: Optional[float] = None
+    total_issues: int = 0
+    high_risk_count: int = 0
+    medium_risk_count: int = 0
+    low_risk_count: int = 0
+    embedding_stats: EmbeddingStats = field(default_factory=EmbeddingStats)
+    
+    def add_result(self, result: BatchResult):
+        """Fold one file result into the aggregate."""
+        if result.embedding_stats is not None:
+            self.embedding_stats.add(result.embedding_stats)
+        
+        comp = result.compliance_results
+        self.add_outcome(
+            success=result.success,
+            processing_time=result.processing_time,
+            score=comp.get('overall_score', 0) if comp else None,
+            missing_risk_levels=[c.get('risk_level', '') for c in comp.get('missing_clauses', [])] if comp else []
+        )
+    
+    def add_outcome(
+        self,
+        success: bool,
+        processing_time: float,
+        score: Optional[float] = None,
+        missing_risk_levels: Optional[List[str]] = None
+    ):
+        """
+        Fold one file outcome into the aggregate.
+        
+        Args:
+            success: Whether the file was processed successfully
+            processing_time: Seconds spent on the file
+            score: Compliance score, or None if no compliance results
+            missing_risk_levels: Risk level of each missing clause
+        """
+        self.total_files += 1
+        self.total_processing_time += processing_time
+        
+        if not success:
+            self.failed += 1
+            return
+        
+        self.successful += 1
+        if score is None:
+            return
+        
+        self.files_analyzed += 1
+        self.score_sum += score
+        self.min_score = score if self.min_score is None else min(self.min_score, score)
+        self.max_score = score if self.max_score is None else max(self.max_score, score)
+        
+        missing_risk_levels = missing_risk_levels or []
+        self.total_issues += len(missing_risk_levels)
+        
+        # Count issues by risk level
+        for risk_level in missing_risk_levels:
+            risk = risk_level.lower()
+            if risk == 'high':
+                self.high_risk_count += 1
+            elif risk == 'medium':
+                self.medium_risk_count += 1
+            elif risk == 'low':
+                self.low_risk_count += 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the aggregated compliance metrics dictionary."""
+        average = self.score_sum / self.files_analyzed if self.files_analyzed else 0.0
+        return {
+            'overall_score': average,
+            'average_score': average,
+            'min_score': self.min_score or 0.0,
+            'max_score': self.max_score or 0.0,
+            'total_issues': self.total_issues,
+            'high_risk_count': self.high_risk_count,
+            'medium_risk_count': self.medium_risk_count,
+            'low_risk_count': self.low_risk_count,
+            'files_analyzed': self.files_analyzed,
+            'embedding_texts': self.embedding_stats.texts,
+            'embeddings_encoded': self.embedding_stats.encoded,
+            'embedding_hit_ratio': self.embedding_stats.hit_ratio
+        }
 
 
 @dataclass
@@ -43,6 +149,199 @@ class BatchSummary:
     results: List[BatchResult]
     started_at: datetime
     completed_at: datetime
+    metrics: Optional[BatchMetrics] = None
+
+
+def iter_contract_files(directory: str, recursive: bool = True) -> Iterator[str]:
+    """
+    Lazily yield supported contract files under a directory.
+    
+    Args:
+        directory: Directory to walk (e.g. cuad_contracts_txt)
+        recursive: Include subdirectories
+        
+    Yields:
+        File paths with a supported extension
+    """
+    extensions = {
+        ext for exts in DocumentProcessor.SUPPORTED_FORMATS.values() for ext in exts
+    }
+    pattern = '**/*' if recursive else '*'
+    
+    for path in Path(directory).glob(pattern):
+        if path.is_file() and path.suffix.lower() in extensions:
+            yield str(path)
+
+
+def summarize_compliance_report(report: ComplianceReport) -> Dict[str, Any]:
+    """
+    Reduce a ComplianceReport to the compact, picklable form kept per batch file.
+    
+    Args:
+        report: Full compliance report
+        
+    Returns:
+        Dictionary with overall score, summary counts and missing clauses
+    """
+    return {
+        'document_id': report.document_id,
+        'frameworks_checked': report.frameworks_checked,
+        'overall_score': report.overall_score,
+        'summary': report.summary.to_dict() if report.summary else None,
+        'missing_clauses': [
+            {
+                'requirement_id': req.requirement_id,
+                'framework': req.framework,
+                'article_reference': req.article_reference,
+                'clause_type': req.clause_type,
+                'risk_level': req.risk_level.value
+            }
+            for req in report.missing_requirements
+        ]
+    }
+
+
+def run_file_pipeline(
+    file_path: str,
+    framework: str,
+    doc_processor: DocumentProcessor,
+    nlp_analyzer: NLPAnalyzer,
+    compliance_checker: ComplianceChecker,
+    recommendation_engine: Optional[RecommendationEngine] = None,
+    progress_callback: Optional[Callable[[str, float], None]] = None,
+    keep_document: bool = True
+) -> BatchResult:
+    """
+    Run extraction, analysis, compliance checking and recommendations for one file.
+    
+    Args:
+        file_path: Path to the contract file
+        framework: Compliance framework to check against
+        doc_processor: Document processor
+        nlp_analyzer: NLP analyzer
+        compliance_checker: Compliance checker
+        recommendation_engine: Recommendation engine (optional)
+        progress_callback: Optional callback for progress updates
+        keep_document: Keep the full ProcessedDocument on the result
+        
+    Returns:
+        BatchResult with processing outcome
+    """
+    filename = Path(file_path).name
+    start_time = time.time()
+    
+    try:
+        logger.info(f"Processing file: {filename}")
+        
+        if progress_callback:
+            progress_callback(filename, 0.1)
+        
+        # Step 1: Extract and process document
+        processed_doc = doc_processor.process_document(file_path)
+        
+        if progress_callback:
+            progress_callback(filename, 0.3)
+        
+        # Step 2: NLP analysis
+        embedding_stats = EmbeddingStats()
+        clause_analyses = nlp_analyzer.analyze_clauses(
+            processed_doc.clauses,
+            embedding_stats=embedding_stats
+        )
+        analysis_results = nlp_analyzer.get_analysis_summary(clause_analyses)
+        
+        if progress_callback:
+            progress_callback(filename, 0.6)
+        
+        # Step 3: Compliance checking
+        report = compliance_checker.check_compliance(
+            clause_analyses,
+            [framework],
+            processed_doc.document_id
+        )
+        compliance_results = summarize_compliance_report(report)
+        
+        if progress_callback:
+            progress_callback(filename, 0.8)
+        
+        # Step 4: Generate recommendations
+        recommendations = None
+        if recommendation_engine is not None:
+            recommendations = [
+                rec.to_dict()
+                for rec in recommendation_engine.generate_recommendations(report)
+            ]
+        
+        if progress_callback:
+            progress_callback(filename, 1.0)
+        
+        processing_time = time.time() - start_time
+        
+        logger.info(f"Successfully processed {filename} in {processing_time:.2f}s")
+        
+        return BatchResult(
+            filename=filename,
+            success=True,
+            processed_document=processed_doc if keep_document else None,
+            analysis_results=analysis_results,
+            compliance_results=compliance_results,
+            recommendations=recommendations,
+            processing_time=processing_time,
+            embedding_stats=embedding_stats
+        )
+        
+    except Exception as e:
+        processing_time = time.time() - start_time
+        error_msg = f"Error processing {filename}: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        
+        return BatchResult(
+            filename=filename,
+            success=False,
+            error=error_msg,
+            processing_time=processing_time
+        )
+
+
+# Services owned by the current worker process (process execution mode)
+_worker_services: Dict[str, Any] = {}
+
+
+def _init_worker(enable_recommendations: bool):
+    """Create the heavy services once per worker process."""
+    # The worker owns its process, so it may set torch's process-wide thread count
+    if config.models.inference_threads:
+        try:
+            import torch
+            torch.set_num_threads(config.models.inference_threads)
+        except ImportError:
+            pass
+    
+    # Tesseract's own OpenMP threads would oversubscribe the cores shared by the workers
+    if config.processing.ocr_thread_limit:
+        os.environ.setdefault('OMP_THREAD_LIMIT', str(config.processing.ocr_thread_limit))
+    
+    # Files already run in parallel across workers, so each extracts its pages sequentially
+    _worker_services['doc_processor'] = DocumentProcessor(extraction_workers=1)
+    _worker_services['nlp_analyzer'] = NLPAnalyzer()
+    _worker_services['compliance_checker'] = ComplianceChecker()
+    _worker_services['recommendation_engine'] = (
+        RecommendationEngine(use_llama=False) if enable_recommendations else None
+    )
+    logger.info("Batch worker process initialized")
+
+
+def _process_file_in_worker(file_path: str, framework: str) -> BatchResult:
+    """Process one file with the worker's services and return a compact result."""
+    return run_file_pipeline(
+        file_path,
+        framework,
+        _worker_services['doc_processor'],
+        _worker_services['nlp_analyzer'],
+        _worker_services['compliance_checker'],
+        _worker_services['recommendation_engine'],
+        keep_document=False
+    )
 
 
 class BatchProcessor:
@@ -53,7 +352,11 @@ class BatchProcessor:
         max_workers: int = 4,
         max_files: int = 10,
         enable_slack: bool = True,
-        slack_channel: Optional[str] = None
+        slack_channel: Optional[str] = None,
+        execution_mode: str = 'thread',
+        max_tasks_per_child: Optional[int] = None,
+        max_crash_retries: int = 1,
+        journal_path: Optional[str] = None
     ):
         """
         Initialize batch processor.
@@ -63,20 +366,69 @@ class BatchProcessor:
             max_files: Maximum number of files to process in one batch
             enable_slack: Enable Slack notifications
             slack_channel: Slack channel for notifications
+            execution_mode: 'thread' (shared services) or 'process' (one set of
+                services per worker process, compact results)
+            max_tasks_per_child: Files a worker process handles before it is
+                replaced (process mode, Python 3.11+)
+            max_crash_retries: Times a file that crashed its worker process is
+                rerun on a fresh pool before it is reported as failed (process mode)
+            journal_path: Append-only checkpoint journal of completed files
+                (enables resume and journal-based export)
         """
+        if execution_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Invalid execution mode '{execution_mode}'. Supported: {', '.join(EXECUTION_MODES)}"
+            )
+        
         self.max_workers = max_workers
         self.max_files = max_files
+        self.execution_mode = execution_mode
+        self.max_tasks_per_child = max_tasks_per_child
+        self.max_crash_retries = max_crash_retries
+        self.journal = BatchJournal(journal_path) if journal_path else None
         
-        # Initialize services
-        self.doc_processor = DocumentProcessor()
-        self.nlp_analyzer = NLPAnalyzer()
-        self.compliance_checker = ComplianceChecker()
-        self.recommendation_engine = RecommendationEngine(use_llama=False)
+        # Services are created on first use; process mode builds them in the workers
+        self._doc_processor = None
+        self._nlp_analyzer = None
+        self._compliance_checker = None
+        self._recommendation_engine = None
         
         # Initialize Slack notifier
         self.slack_notifier = SlackNotifier(default_channel=slack_channel or "#compliance-alerts") if enable_slack else None
         
-        logger.info(f"BatchProcessor initialized (max_workers={max_workers}, max_files={max_files}, slack={enable_slack})")
+        logger.info(
+            f"BatchProcessor initialized (max_workers={max_workers}, max_files={max_files}, "
+            f"mode={execution_mode}, slack={enable_slack})"
+        )
+    
+    @property
+    def doc_processor(self) -> DocumentProcessor:
+        """Lazy initialization of document processor."""
+        if self._doc_processor is None:
+            # Files already run in parallel across workers, so each extracts its pages sequentially
+            self._doc_processor = DocumentProcessor(extraction_workers=1)
+        return self._doc_processor
+    
+    @property
+    def nlp_analyzer(self) -> NLPAnalyzer:
+        """Lazy initialization of NLP analyzer."""
+        if self._nlp_analyzer is None:
+            self._nlp_analyzer = NLPAnalyzer()
+        return self._nlp_analyzer
+    
+    @property
+    def compliance_checker(self) -> ComplianceChecker:
+        """Lazy initialization of compliance checker."""
+        if self._compliance_checker is None:
+            self._compliance_checker = ComplianceChecker()
+        return self._compliance_checker
+    
+    @property
+    def recommendation_engine(self) -> RecommendationEngine:
+        """Lazy initialization of recommendation engine."""
+        if self._recommendation_engine is None:
+            self._recommendation_engine = RecommendationEngine(use_llama=False)
+        return self._recommendation_engine
     
     def process_file(
         self,
@@ -95,76 +447,22 @@ class BatchProcessor:
         Returns:
             BatchResult with processing outcome
         """
-        filename = Path(file_path).name
-        start_time = time.time()
-        
-        try:
-            logger.info(f"Processing file: {filename}")
-            
-            if progress_callback:
-                progress_callback(filename, 0.1)
-            
-            # Step 1: Extract and process document
-            processed_doc = self.doc_processor.process_document(file_path)
-            
-            if progress_callback:
-                progress_callback(filename, 0.3)
-            
-            # Step 2: NLP analysis
-            analysis_results = self.nlp_analyzer.analyze_document(processed_doc)
-            
-            if progress_callback:
-                progress_callback(filename, 0.6)
-            
-            # Step 3: Compliance checking
-            compliance_results = self.compliance_checker.check_compliance(
-                processed_doc,
-                framework
-            )
-            
-            if progress_callback:
-                progress_callback(filename, 0.8)
-            
-            # Step 4: Generate recommendations
-            recommendations = self.recommendation_engine.generate_recommendations(
-                processed_doc,
-                compliance_results
-            )
-            
-            if progress_callback:
-                progress_callback(filename, 1.0)
-            
-            processing_time = time.time() - start_time
-            
-            logger.info(f"Successfully processed {filename} in {processing_time:.2f}s")
-            
-            return BatchResult(
-                filename=filename,
-                success=True,
-                processed_document=processed_doc,
-                analysis_results=analysis_results,
-                compliance_results=compliance_results,
-                recommendations=recommendations,
-                processing_time=processing_time
-            )
-            
-        except Exception as e:
-            processing_time = time.time() - start_time
-            error_msg = f"Error processing {filename}: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            
-            return BatchResult(
-                filename=filename,
-                success=False,
-                error=error_msg,
-                processing_time=processing_time
-            )
+        return run_file_pipeline(
+            file_path,
+            framework,
+            self.doc_processor,
+            self.nlp_analyzer,
+            self.compliance_checker,
+            self.recommendation_engine,
+            progress_callback=progress_callback
+        )
     
     def process_batch(
         self,
         file_paths: List[str],
         framework: str = "GDPR",
-        progress_callback: Optional[Callable[[str, float], None]] = None
+        progress_callback: Optional[Callable[[str, float], None]] = None,
+        resume: bool = False
     ) -> BatchSummary:
         """
         Process multiple contract files in parallel.
@@ -173,6 +471,9 @@ class BatchProcessor:
             file_paths: List of file paths to process
             framework: Compliance framework to check against
             progress_callback: Optional callback for progress updates
+                (process mode reports completion only)
+            resume: Skip files the journal records as successful for this
+                framework (failures are retried)
             
         Returns:
             BatchSummary with all results
@@ -183,42 +484,22 @@ class BatchProcessor:
         started_at = datetime.now()
         logger.info(f"Starting batch processing of {len(file_paths)} files")
         
-        results = []
-        
-        # Process files in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(
-                    self.process_file,
-                    file_path,
-                    framework,
-                    progress_callback
-                ): file_path
-                for file_path in file_paths
-            }
-            
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_file):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    file_path = future_to_file[future]
-                    filename = Path(file_path).name
-                    logger.error(f"Exception processing {filename}: {e}")
-                    results.append(BatchResult(
-                        filename=filename,
-                        success=False,
-                        error=str(e)
-                    ))
+        metrics = BatchMetrics()
+        results = list(self.iter_process(
+            file_paths,
+            framework,
+            progress_callback,
+            max_in_flight=len(file_paths) or None,
+            metrics=metrics,
+            resume=resume
+        ))
         
         completed_at = datetime.now()
         total_time = (completed_at - started_at).total_seconds()
         
         # Calculate summary statistics
-        successful = sum(1 for r in results if r.success)
-        failed = len(results) - successful
+        successful = metrics.successful
+        failed = metrics.failed
         avg_time = total_time / len(results) if results else 0
         
         summary = BatchSummary(
@@ -229,12 +510,14 @@ class BatchProcessor:
             avg_time_per_file=avg_time,
             results=results,
             started_at=started_at,
-            completed_at=completed_at
+            completed_at=completed_at,
+            metrics=metrics
         )
         
         logger.info(
             f"Batch processing complete: {successful}/{len(file_paths)} successful "
-            f"in {total_time:.2f}s (avg {avg_time:.2f}s/file)"
+            f"in {total_time:.2f}s (avg {avg_time:.2f}s/file, "
+            f"embedding hit ratio {metrics.embedding_stats.hit_ratio:.1%})"
         )
         
         # Send Slack notification if enabled
@@ -251,6 +534,214 @@ class BatchProcessor:
         
         return summary
     
+    def iter_process(
+        self,
+        file_paths: Iterable[str],
+        framework: str = "GDPR",
+        progress_callback: Optional[Callable[[str, float], None]] = None,
+        max_in_flight: Optional[int] = None,
+        metrics: Optional[BatchMetrics] = None,
+        resume: bool = False
+    ) -> Iterator[BatchResult]:
+        """
+        Process an unbounded stream of files, yielding results as they finish.
+        
+        Paths are pulled from the iterable lazily and at most max_in_flight
+        files are submitted at a time, so memory stays flat regardless of
+        corpus size. Results arrive in completion order. With a journal
+        configured, each result is recorded as it lands.
+        
+        A crashed worker process fails every file in flight, so after a pool
+        break the affected files are rerun one at a time on a fresh pool. Only
+        a file that crashes while running alone is charged a crash retry.
+        
+        Args:
+            file_paths: Iterable of file paths (e.g. iter_contract_files(...))
+            framework: Compliance framework to check against
+            progress_callback: Optional callback for progress updates
+                (process mode reports completion only)
+            max_in_flight: Maximum files submitted at once (default 2 x max_workers)
+            metrics: Optional BatchMetrics updated as each result lands
+            resume: Skip files whose content hash the journal records as
+                successful for this framework
+            
+        Yields:
+            BatchResult for each file
+        """
+        window = max_in_flight or self.max_workers * 2
+        paths = iter(file_paths)
+        retry_queue: deque = deque()
+        attempts: Dict[str, int] = {}
+        in_flight: Dict[concurrent.futures.Future, str] = {}
+        suspects: set = set()
+        content_hashes: Dict[str, str] = {}
+        
+        if resume and self.journal is None:
+            logger.warning("resume=True has no effect without a journal_path")
+        completed_hashes = self.journal.completed_hashes(framework) if resume and self.journal else set()
+        if completed_hashes:
+            logger.info(
+                f"Resuming batch: {len(completed_hashes)} files already completed "
+                f"for {framework} in journal"
+            )
+        
+        executor = self._create_executor()
+        
+        try:
+            while True:
+                # Top up the in-flight window, retried files first; files caught
+                # in a pool break run alone until the culprit is found
+                while len(in_flight) < (1 if suspects else window):
+                    if retry_queue:
+                        file_path = retry_queue.popleft()
+                    else:
+                        file_path = next(paths, None)
+                        if file_path is None:
+                            break
+                        
+                        if self.journal is not None:
+                            content_hash = self._hash_file(file_path)
+                            if content_hash in completed_hashes:
+                                logger.debug(f"Skipping {Path(file_path).name} (already completed in journal)")
+                                continue
+                            content_hashes[file_path] = content_hash
+                    
+                    future = self._submit(executor, file_path, framework, progress_callback)
+                    in_flight[future] = file_path
+                
+                if not in_flight:
+                    break
+                
+                done, _ = concurrent.futures.wait(
+                    in_flight,
+                    return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                
+                crash_known = False
+                if any(isinstance(f.exception(), BrokenProcessPool) for f in done):
+                    # A dead worker fails every pending task, so the crash can only be
+                    # pinned on a file that was running alone: drain, then start a fresh pool
+                    crash_known = len(in_flight) == 1
+                    done, _ = concurrent.futures.wait(in_flight)
+                    executor.shutdown(wait=True)
+                    executor = self._create_executor()
+                
+                for future in done:
+                    file_path = in_flight.pop(future)
+                    result = self._collect_result(future, file_path, attempts, retry_queue, crash_known)
+                    if result is None:
+                        suspects.add(file_path)
+                        continue
+                    suspects.discard(file_path)
+                    
+                    if self.journal is not None:
+                        content_hash = content_hashes.pop(file_path, None)
+                        if content_hash:
+                            self.journal.record(result, file_path, content_hash, framework)
+                    
+                    if metrics is not None:
+                        metrics.add_result(result)
+                    if progress_callback and self.execution_mode == 'process':
+                        progress_callback(result.filename, 1.0)
+                    
+                    yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    @staticmethod
+    def _hash_file(file_path: str) -> Optional[str]:
+        """Hash a file for the journal; unreadable files are left to the pipeline to report."""
+        try:
+            return BatchJournal.hash_file(file_path)
+        except OSError as e:
+            logger.warning(f"Could not hash {file_path}: {e}")
+            return None
+    
+    def _create_executor(self) -> concurrent.futures.Executor:
+        """Create the executor for the configured execution mode."""
+        if self.execution_mode == 'process':
+            return self._create_process_pool()
+        return concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+    
+    def _submit(
+        self,
+        executor: concurrent.futures.Executor,
+        file_path: str,
+        framework: str,
+        progress_callback: Optional[Callable[[str, float], None]]
+    ) -> concurrent.futures.Future:
+        """Submit one file to the executor."""
+        if self.execution_mode == 'process':
+            return executor.submit(_process_file_in_worker, file_path, framework)
+        return executor.submit(self.process_file, file_path, framework, progress_callback)
+    
+    def _collect_result(
+        self,
+        future: concurrent.futures.Future,
+        file_path: str,
+        attempts: Dict[str, int],
+        retry_queue: deque,
+        crash_known: bool = True
+    ) -> Optional[BatchResult]:
+        """
+        Turn a finished future into a BatchResult.
+        
+        Files lost to a crashed worker are queued for retry and None is
+        returned for those. A file is only charged an attempt when it is
+        known to have caused the crash (crash_known), and fails after
+        max_crash_retries charged attempts.
+        """
+        filename = Path(file_path).name
+        
+        try:
+            return future.result()
+        
+        except BrokenProcessPool:
+            if not crash_known:
+                logger.warning(f"Worker process crashed; rerunning {filename} in isolation")
+                retry_queue.append(file_path)
+                return None
+            
+            attempts[file_path] = attempts.get(file_path, 0) + 1
+            if attempts[file_path] <= self.max_crash_retries:
+                logger.warning(
+                    f"Worker process crashed; resubmitting {filename} "
+                    f"(retry {attempts[file_path]}/{self.max_crash_retries})"
+                )
+                retry_queue.append(file_path)
+                return None
+            
+            logger.error(f"Worker process crashed while processing {filename}")
+            return BatchResult(
+                filename=filename,
+                success=False,
+                error=f"Worker process crashed while processing {filename}"
+            )
+        
+        except Exception as e:
+            logger.error(f"Exception processing {filename}: {e}")
+            return BatchResult(
+                filename=filename,
+                success=False,
+                error=str(e)
+            )
+    
+    def _create_process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Create a process pool whose workers initialize their own services."""
+        pool_kwargs = {
+            'max_workers': self.max_workers,
+            'initializer': _init_worker,
+            'initargs': (True,)
+        }
+        
+        if self.max_tasks_per_child:
+            if sys.version_info >= (3, 11):
+                pool_kwargs['max_tasks_per_child'] = self.max_tasks_per_child
+            else:
+                logger.warning("max_tasks_per_child requires Python 3.11+, ignoring")
+        
+        return concurrent.futures.ProcessPoolExecutor(**pool_kwargs)
+    
     def get_aggregated_compliance_score(self, summary: BatchSummary) -> Dict[str, Any]:
         """
         Calculate aggregated compliance metrics across all files.
@@ -261,68 +752,54 @@ class BatchProcessor:
         Returns:
             Dictionary with aggregated metrics
         """
-        successful_results = [r for r in summary.results if r.success and r.compliance_results]
-        
-        if not successful_results:
-            return {
-                'overall_score': 0.0,
-                'average_score': 0.0,
-                'min_score': 0.0,
-                'max_score': 0.0,
-                'total_issues': 0,
-                'high_risk_count': 0,
-                'medium_risk_count': 0,
-                'low_risk_count': 0
-            }
-        
-        scores = []
-        total_issues = 0
-        risk_counts = {'high': 0, 'medium': 0, 'low': 0}
+        if summary.metrics is not None:
+            return summary.metrics.to_dict()
         
-        for result in successful_results:
-            comp = result.compliance_results
-            scores.append(comp.get('overall_score', 0))
-            total_issues += len(comp.get('missing_clauses', []))
-            
-            # Count issues by risk level
-            for clause in comp.get('missing_clauses', []):
-                risk = clause.get('risk_level', '').lower()
-                if risk in risk_counts:
-                    risk_counts[risk] += 1
-        
-        return {
-            'overall_score': sum(scores) / len(scores) if scores else 0.0,
-            'average_score': sum(scores) / len(scores) if scores else 0.0,
-            'min_score': min(scores) if scores else 0.0,
-            'max_score': max(scores) if scores else 0.0,
-            'total_issues': total_issues,
-            'high_risk_count': risk_counts['high'],
-            'medium_risk_count': risk_counts['medium'],
-            'low_risk_count': risk_counts['low'],
-            'files_analyzed': len(successful_results)
-        }
+        metrics = BatchMetrics()
+        for result in summary.results:
+            metrics.add_result(result)
+        return metrics.to_dict()
     
     def export_batch_results(
         self,
-        summary: BatchSummary,
+        summary: Optional[BatchSummary] = None,
         output_format: str = 'json'
     ) -> str:
         """
         Export batch results to file.
         
         Args:
-            summary: BatchSummary to export
+            summary: BatchSummary to export (default: rebuild from the journal)
             output_format: 'json' or 'csv'
             
         Returns:
             Path to exported file
         """
-        from services.export_service import ExportService
-        
-        export_service = ExportService()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        Path("reports").mkdir(exist_ok=True)
         
-        # Prepare data for export
+        if summary is None:
+            if self.journal is None:
+                raise ValueError("No summary given and no batch journal configured")
+            export_data = self._build_export_data_from_journal()
+        else:
+            export_data = self._build_export_data(summary)
+        
+        if output_format == 'json':
+            output_path = f"reports/batch_results_{timestamp}.json"
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, default=str)
+        else:
+            import pandas as pd
+            df = pd.DataFrame(export_data['results'])
+            output_path = f"reports/batch_results_{timestamp}.csv"
+            df.to_csv(output_path, index=False)
+        
+        logger.info(f"Batch results exported to: {output_path}")
+        return output_path
+    
+    def _build_export_data(self, summary: BatchSummary) -> Dict[str, Any]:
+        """Build the export payload from an in-memory BatchSummary."""
         export_data = {
             'summary': {
                 'total_files': summary.total_files,
@@ -358,15 +835,58 @@ class BatchProcessor:
             
             export_data['results'].append(file_data)
         
-        # Export using ExportService
-        if output_format == 'json':
-            output_path = f"reports/batch_results_{timestamp}.json"
-            export_service._write_json(export_data, output_path)
-        else:
-            import pandas as pd
-            df = pd.DataFrame(export_data['results'])
-            output_path = f"reports/batch_results_{timestamp}.csv"
-            df.to_csv(output_path, index=False)
+        return export_data
+    
+    def _build_export_data_from_journal(self) -> Dict[str, Any]:
+        """Rebuild the export payload from the journal alone (latest entry per file and framework)."""
+        entries = self.journal.latest_entries()
+        metrics = BatchMetrics()
+        results = []
         
-        logger.info(f"Batch results exported to: {output_path}")
-        return output_path
+        for entry in entries:
+            success = entry.get('status') == 'success'
+            missing_risk_levels = entry.get('missing_risk_levels', [])
+            metrics.add_outcome(
+                success=success,
+                processing_time=entry.get('processing_time', 0.0),
+                score=entry.get('score'),
+                missing_risk_levels=missing_risk_levels
+            )
+            
+            file_data = {
+                'filename': entry.get('filename'),
+                'framework': entry.get('framework'),
+                'success': success,
+                'processing_time': entry.get('processing_time', 0.0),
+                'error': entry.get('error')
+            }
+            
+            if success and entry.get('score') is not None:
+                file_data.update({
+                    'compliance_score': entry['score'],
+                    'missing_clauses_count': entry.get('missing_clauses_count', 0),
+                    'high_risk_issues': sum(
+                        1 for risk in missing_risk_levels if risk.lower() == 'high'
+                    )
+                })
+            
+            results.append(file_data)
+        
+        timestamps = [t for t in (get_entry_time(e) for e in entries) if t is not None]
+        
+        return {
+            'summary': {
+                'total_files': metrics.total_files,
+                'successful': metrics.successful,
+                'failed': metrics.failed,
+                'total_time': metrics.total_processing_time,
+                'avg_time_per_file': (
+                    metrics.total_processing_time / metrics.total_files
+                    if metrics.total_files else 0
+                ),
+                'started_at': min(timestamps).isoformat() if timestamps else None,
+                'completed_at': max(timestamps).isoformat() if timestamps else None
+            },
+            'aggregated_metrics': metrics.to_dict(),
+            'results': results
+        }
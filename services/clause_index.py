@@ -0,0 +1,269 @@
+"""
+Clause Index - approximate nearest-neighbor search over clause embeddings.
+"""
+import os
+import uuid
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the on-disk layout changes so old index files are rebuilt
+INDEX_FORMAT_VERSION = 1
+
+DEFAULT_N_PROBE = 8
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """
+    Scale rows to unit length (zero rows are left as zeros).
+    
+    Args:
+        vectors: Matrix of shape (n, dim)
+    
+    Returns:
+        float32 matrix of unit rows
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+class IVFFlatIndex:
+    """
+    Inverted-file (IVF-flat) index for cosine similarity over unit vectors.
+    
+    Vectors are clustered with spherical k-means into n_lists inverted lists.
+    A query scores the centroids, then scans only the n_probe closest lists.
+    Each list's vectors are stored contiguously, so scanning a list is a single
+    matrix-vector product. Filtered searches whose allowed set is small enough
+    are answered exactly from the allowed rows instead.
+    """
+    
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        vectors: np.ndarray,
+        ids: np.ndarray,
+        offsets: np.ndarray,
+        fingerprint: str = ''
+    ):
+        """
+        Initialize index from its arrays (see build() and load()).
+        
+        Args:
+            centroids: Unit centroid of each list, shape (n_lists, dim)
+            vectors: Unit vectors grouped by list, shape (n, dim)
+            ids: Original row id of each entry in vectors
+            offsets: Start of each list in vectors, plus the total (n_lists + 1)
+            fingerprint: Identifier of the data the index was built from
+        """
+        self.centroids = centroids
+        self.vectors = vectors
+        self.ids = ids
+        self.offsets = offsets
+        self.fingerprint = fingerprint
+        
+        # Position in vectors of each original row id
+        self._positions = np.empty(len(ids), dtype=np.int64)
+        self._positions[ids] = np.arange(len(ids))
+    
+    @classmethod
+    def build(
+        cls,
+        vectors: np.ndarray,
+        n_lists: Optional[int] = None,
+        n_iter: int = 10,
+        sample_size: Optional[int] = None,
+        seed: int = 0,
+        fingerprint: str = ''
+    ) -> 'IVFFlatIndex':
+        """
+        Cluster vectors and build the index.
+        
+        Args:
+            vectors: Embeddings of shape (n, dim); row i gets id i
+            n_lists: Number of inverted lists (default: about sqrt(n))
+            n_iter: k-means iterations
+            sample_size: Vectors used to train centroids (default: 64 per list)
+            seed: Random seed for centroid initialization and sampling
+            fingerprint: Identifier of the data, checked when reloading
+        
+        Returns:
+            Built IVFFlatIndex
+        """
+        vectors = normalize_rows(vectors)
+        n = len(vectors)
+        if n == 0:
+            raise ValueError("Cannot build an index over zero vectors")
+        
+        n_lists = max(1, min(n_lists or int(np.sqrt(n)), n))
+        rng = np.random.default_rng(seed)
+        
+        sample_size = min(n, sample_size or 64 * n_lists)
+        sample = vectors[rng.choice(n, sample_size, replace=False)] if sample_size < n else vectors
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        
+        for _ in range(n_iter):
+            assignments = cls._assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            counts = np.bincount(assignments, minlength=n_lists)
+            
+            # Re-seed empty lists with random sample vectors
+            empty = np.flatnonzero(counts == 0)
+            if len(empty):
+                sums[empty] = sample[rng.choice(len(sample), len(empty), replace=False)]
+            centroids = normalize_rows(sums)
+        
+        assignments = cls._assign(vectors, centroids)
+        ids = np.argsort(assignments, kind='stable')
+        offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(assignments, minlength=n_lists))
+        
+        logger.info(f"Built IVF index over {n} vectors ({n_lists} lists)")
+        return cls(centroids, np.ascontiguousarray(vectors[ids]), ids, offsets, fingerprint)
+    
+    @staticmethod
+    def _assign(vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+        """Assign each vector to its most similar centroid."""
+        assignments = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), chunk_size):
+            chunk = vectors[start:start + chunk_size]
+            assignments[start:start + chunk_size] = np.argmax(chunk @ centroids.T, axis=1)
+        return assignments
+    
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        n_probe: int = DEFAULT_N_PROBE,
+        allowed: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k most similar vectors to a query.
+        
+        Args:
+            query: Query embedding of shape (dim,)
+            k: Number of results
+            n_probe: Inverted lists to scan (more is slower but more exact)
+            allowed: Optional boolean mask over row ids; other rows are skipped
+        
+        Returns:
+            Tuple of (row ids, cosine similarities), best first
+        """
+        query = normalize_rows(np.asarray(query).reshape(1, -1))[0]
+        n_lists = len(self.centroids)
+        
+        if allowed is not None:
+            allowed_ids = np.flatnonzero(allowed)
+            # A selective filter is cheaper to scan exactly than to probe
+            expected_scan = n_probe * len(self) / n_lists
+            if len(allowed_ids) <= expected_scan:
+                positions = self._positions[allowed_ids]
+                return self._top_k(allowed_ids, self.vectors[positions] @ query, k)
+        
+        list_order = np.argsort(-(self.centroids @ query))
+        probe = min(n_probe, n_lists)
+        
+        while True:
+            # Lists are contiguous, so each is scored in place without gathering rows
+            spans = [(self.offsets[i], self.offsets[i + 1]) for i in list_order[:probe]]
+            candidate_ids = np.concatenate([self.ids[start:end] for start, end in spans])
+            scores = np.concatenate([self.vectors[start:end] @ query for start, end in spans])
+            
+            if allowed is not None:
+                keep = allowed[candidate_ids]
+                candidate_ids = candidate_ids[keep]
+                scores = scores[keep]
+            
+            # Widen the probe until enough filtered candidates are found
+            if len(candidate_ids) >= k or probe >= n_lists:
+                break
+            probe = min(probe * 2, n_lists)
+        
+        return self._top_k(candidate_ids, scores, k)
+    
+    @staticmethod
+    def _top_k(ids: np.ndarray, scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Select the k best (id, score) pairs, best first."""
+        if len(scores) > k:
+            best = np.argpartition(-scores, k - 1)[:k]
+            ids, scores = ids[best], scores[best]
+        order = np.argsort(-scores, kind='stable')
+        return ids[order], scores[order]
+    
+    def save(self, path: Union[str, Path]):
+        """
+        Write the index to an .npz file (atomically).
+        
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp.npz")
+        
+        try:
+            np.savez(
+                tmp_path,
+                version=np.array(INDEX_FORMAT_VERSION),
+                fingerprint=np.array(self.fingerprint),
+                centroids=self.centroids,
+                vectors=self.vectors,
+                ids=self.ids,
+                offsets=self.offsets
+            )
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        
+        logger.info(f"Saved IVF index to {path}")
+    
+    @classmethod
+    def load(cls, path: Union[str, Path], fingerprint: Optional[str] = None) -> Optional['IVFFlatIndex']:
+        """
+        Load an index written by save().
+        
+        Args:
+            path: Index file
+            fingerprint: Expected data fingerprint (None to accept any)
+        
+        Returns:
+            Loaded IVFFlatIndex, or None if missing, stale or unreadable
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+        
+        try:
+            with np.load(path) as data:
+                if int(data['version']) != INDEX_FORMAT_VERSION:
+                    logger.info(f"Ignoring IVF index with old format: {path}")
+                    return None
+                stored_fingerprint = str(data['fingerprint'])
+                if fingerprint is not None and stored_fingerprint != fingerprint:
+                    logger.info(f"Ignoring stale IVF index: {path}")
+                    return None
+                index = cls(
+                    data['centroids'],
+                    data['vectors'],
+                    data['ids'],
+                    data['offsets'],
+                    stored_fingerprint
+                )
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Could not load IVF index from {path}: {e}")
+            return None
+        
+        logger.info(f"Loaded IVF index from {path} ({len(index)} vectors)")
+        return index
+    
+    def __len__(self) -> int:
+        """Get the number of indexed vectors."""
+        return len(self.ids)
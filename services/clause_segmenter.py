@@ -2,7 +2,7 @@
 
 import logging
 import re
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 from models.clause import Clause
@@ -10,6 +10,25 @@ from models.clause import Clause
 logger = logging.getLogger(__name__)
 
 
+# One match per non-blank line; 'body' is the line with surrounding whitespace stripped
+_LINE_RE = re.compile(r'^[^\S\n]*(?P<body>[^\n]*\S)', re.MULTILINE)
+
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+
+_CONCLUDING_PHRASES = (
+    'shall be',
+    'agrees to',
+    'is required to',
+    'must',
+    'will',
+    'hereby',
+    'notwithstanding',
+    'provided that',
+    'subject to'
+)
+_MAX_PHRASE_LENGTH = max(len(phrase) for phrase in _CONCLUDING_PHRASES)
+
+
 @dataclass
 class SegmentationResult:
     """Result of clause segmentation."""
@@ -18,6 +37,15 @@ class SegmentationResult:
     confidence: float
 
 
+@dataclass
+class DocumentScan:
+    """Boundaries for every segmentation strategy, collected in one pass over the text."""
+    structure: SegmentationResult
+    paragraphs: List[Tuple[int, int]]  # (start, end) of each stripped paragraph
+    leading_gap: bool  # text opens with a blank-line separator
+    trailing_gap: bool  # text closes with a blank-line separator
+
+
 class ClauseSegmenter:
     """Segment contract text into individual clauses."""
     
@@ -31,6 +59,9 @@ class ClauseSegmenter:
         r'^\s*§\s*(\d+)',  # § 1, § 2, etc.
     ]
     
+    # Inserted between pages by segment_stream(), so a page break also ends a paragraph
+    PAGE_SEPARATOR = '\n\n'
+    
     # Heading patterns (all caps or title case followed by colon or newline)
     HEADING_PATTERNS = [
         r'^([A-Z][A-Z\s]+):\s*',  # ALL CAPS HEADING:
@@ -48,6 +79,33 @@ class ClauseSegmenter:
         self.logger = logging.getLogger(__name__)
         self.min_clause_length = min_clause_length
         self.max_clause_length = max_clause_length
+        self._marker_re, self._heading_groups = self._compile_marker_pattern()
+    
+    @classmethod
+    def _compile_marker_pattern(cls) -> Tuple[re.Pattern, List[int]]:
+        """
+        Combine all section and heading patterns into one regex.
+        
+        Each family sits in an optional lookahead, so a single match at the
+        start of a line reports both the section number and the heading.
+        Alternatives are tried in list order, as the individual patterns were.
+        
+        Returns:
+            Tuple of (compiled pattern, group index of each heading's text)
+        """
+        sections = '|'.join(pattern.lstrip('^') for pattern in cls.SECTION_PATTERNS)
+        headings = '|'.join(
+            f'(?P<heading_{i}>{pattern.lstrip("^")})'
+            for i, pattern in enumerate(cls.HEADING_PATTERNS)
+        )
+        marker_re = re.compile(f'(?:(?=(?P<section>{sections})))?(?:(?=(?:{headings})))?')
+        
+        # The heading text is the first group inside each heading pattern
+        heading_groups = [
+            marker_re.groupindex[f'heading_{i}'] + 1
+            for i in range(len(cls.HEADING_PATTERNS))
+        ]
+        return marker_re, heading_groups
     
     def segment(self, text: str) -> List[Clause]:
         """
@@ -63,8 +121,10 @@ class ClauseSegmenter:
             self.logger.warning("Empty text provided for segmentation")
             return []
         
+        scan = self.scan(text)
+        
         # Try structure-based segmentation first
-        result = self.segment_by_structure(text)
+        result = scan.structure
         
         if result.confidence > 0.7 and len(result.clauses) >= 3:
             self.logger.info(
@@ -74,46 +134,50 @@ class ClauseSegmenter:
             return result.clauses
         
         # Fallback to semantic segmentation
-        result = self.segment_by_semantics(text)
+        result = self.segment_by_semantics(text, scan)
         self.logger.info(
             f"Semantic segmentation: {len(result.clauses)} clauses, "
             f"{result.confidence:.2%} confidence"
         )
         return result.clauses
     
-    def segment_by_structure(self, text: str) -> SegmentationResult:
+    def scan(self, text: str) -> DocumentScan:
         """
-        Segment text using document structure (headings, numbering).
+        Scan text once, collecting structural clauses and paragraph boundaries.
         
         Args:
-            text: Contract text to segment
-            
+            text: Contract text to scan
+        
         Returns:
-            SegmentationResult with clauses and confidence
+            DocumentScan with the structure-based result and paragraph spans
         """
-        lines = text.split('\n')
         clauses = []
         current_clause_lines = []
         current_section = None
         current_heading = None
         current_start = 0
-        char_position = 0
         
         section_count = 0
         heading_count = 0
         
-        for line in lines:
-            line_stripped = line.strip()
-            
-            if not line_stripped:
-                char_position += len(line) + 1
-                continue
+        paragraphs = []
+        paragraph_start = None
+        paragraph_end = 0
+        
+        for line_match in _LINE_RE.finditer(text):
+            body_start, body_end = line_match.span('body')
             
-            # Check for section number
-            section_match = self._match_section_number(line_stripped)
+            # Only whitespace separates consecutive content lines, so a blank
+            # line lies between them exactly when there are two newlines
+            if paragraph_start is None:
+                paragraph_start = body_start
+            elif text.count('\n', paragraph_end, body_start) >= 2:
+                paragraphs.append((paragraph_start, paragraph_end))
+                paragraph_start = body_start
+            paragraph_end = body_end
             
-            # Check for heading
-            heading_match = self._match_heading(line_stripped)
+            line_stripped = text[body_start:body_end]
+            section_match, heading_match = self._match_markers(text, body_start, body_end)
             
             # If we found a new section or heading, save previous clause
             if section_match or heading_match:
@@ -125,7 +189,7 @@ class ClauseSegmenter:
                             clause_id=f"clause_{len(clauses) + 1}",
                             text=clause_text,
                             start_position=current_start,
-                            end_position=char_position,
+                            end_position=line_match.start(),
                             section_number=current_section,
                             heading=current_heading
                         )
@@ -133,7 +197,7 @@ class ClauseSegmenter:
                 
                 # Start new clause
                 current_clause_lines = [line_stripped]
-                current_start = char_position
+                current_start = line_match.start()
                 
                 if section_match:
                     current_section = section_match
@@ -144,8 +208,9 @@ class ClauseSegmenter:
                     heading_count += 1
             else:
                 current_clause_lines.append(line_stripped)
-            
-            char_position += len(line) + 1
+        
+        if paragraph_start is not None:
+            paragraphs.append((paragraph_start, paragraph_end))
         
         # Add final clause
         if current_clause_lines:
@@ -155,7 +220,7 @@ class ClauseSegmenter:
                     clause_id=f"clause_{len(clauses) + 1}",
                     text=clause_text,
                     start_position=current_start,
-                    end_position=char_position,
+                    end_position=len(text) + 1,
                     section_number=current_section,
                     heading=current_heading
                 )
@@ -165,52 +230,224 @@ class ClauseSegmenter:
         total_markers = section_count + heading_count
         confidence = min(1.0, total_markers / max(len(clauses), 1) * 0.8)
         
-        return SegmentationResult(
-            clauses=clauses,
-            method_used="structure",
-            confidence=confidence
+        # Two or more newlines around the content form a paragraph separator
+        # of their own; semantic positions count these as empty paragraphs
+        return DocumentScan(
+            structure=SegmentationResult(
+                clauses=clauses,
+                method_used="structure",
+                confidence=confidence
+            ),
+            paragraphs=paragraphs,
+            leading_gap=bool(paragraphs) and text.count('\n', 0, paragraphs[0][0]) >= 2,
+            trailing_gap=bool(paragraphs) and text.count('\n', paragraphs[-1][1]) >= 2
         )
     
-    def segment_by_semantics(self, text: str) -> SegmentationResult:
+    def segment_stream(self, pages: Iterable[str]) -> Iterator[Clause]:
+        """
+        Segment text that arrives page by page, yielding each clause once it ends.
+        
+        PAGE_SEPARATOR is inserted between consecutive pages, so the last
+        paragraph of a page never runs into the first of the next, and
+        positions are offsets into PAGE_SEPARATOR.join(pages). Passing that
+        joined text as a single page gives the same clauses. Only the current
+        clause and an unfinished line are held in memory.
+        
+        A clause ends at a section number or heading line, as in structure
+        segmentation. Until the first such marker is seen, paragraph breaks
+        also end clauses using the semantic rules. Any clause is closed once
+        it reaches max_clause_length.
+        
+        Args:
+            pages: Iterable of page texts (e.g. PDFExtractor.iter_pages())
+        
+        Yields:
+            Clause objects in document order
+        """
+        clause_count = 0
+        current_lines: List[str] = []
+        current_length = 0  # length of '\n'.join(current_lines)
+        current_start = 0
+        current_section = None
+        current_heading = None
+        current_end = 0
+        
+        structured = False
+        paragraph_break = False
+        paragraph_first_line = None
+        paragraph_last_line = None
+        paragraph_lines = 0
+        
+        for line_start, line in self._iter_stream_lines(self._separate_pages(pages)):
+            line_stripped = line.strip()
+            
+            if not line_stripped:
+                paragraph_break = paragraph_first_line is not None
+                continue
+            
+            section_match, heading_match = self._match_markers(line_stripped, 0, len(line_stripped))
+            is_marker = bool(section_match or heading_match)
+            
+            if is_marker:
+                boundary = True
+            elif current_length >= self.max_clause_length:
+                boundary = current_length >= self.min_clause_length
+            elif paragraph_break and not structured:
+                # Only the start and end of a paragraph matter to the boundary test
+                paragraph_edges = (
+                    paragraph_first_line if paragraph_lines == 1
+                    else f"{paragraph_first_line}\n{paragraph_last_line}"
+                )
+                boundary = current_length >= self.min_clause_length and (
+                    current_length >= self.min_clause_length * 2 or
+                    self._is_semantic_boundary(paragraph_edges)
+                )
+            else:
+                boundary = False
+            
+            if boundary and current_lines:
+                clause_text = '\n'.join(current_lines)
+                if len(clause_text) >= self.min_clause_length:
+                    clause_count += 1
+                    yield Clause(
+                        clause_id=f"clause_{clause_count}",
+                        text=clause_text,
+                        start_position=current_start,
+                        end_position=line_start,
+                        section_number=current_section,
+                        heading=current_heading
+                    )
+                current_lines = []
+                current_length = 0
+            
+            if not current_lines:
+                current_start = line_start
+            
+            if section_match:
+                current_section = section_match
+            if heading_match:
+                current_heading = heading_match
+            structured = structured or is_marker
+            
+            current_length += len(line_stripped) + (1 if current_lines else 0)
+            current_lines.append(line_stripped)
+            current_end = line_start + len(line)
+            
+            if paragraph_break or paragraph_first_line is None:
+                paragraph_first_line = line_stripped
+                paragraph_lines = 0
+            paragraph_last_line = line_stripped
+            paragraph_lines += 1
+            paragraph_break = False
+        
+        # Add final clause
+        if current_lines and current_length >= self.min_clause_length:
+            clause_count += 1
+            yield Clause(
+                clause_id=f"clause_{clause_count}",
+                text='\n'.join(current_lines),
+                start_position=current_start,
+                end_position=current_end,
+                section_number=current_section,
+                heading=current_heading
+            )
+    
+    @classmethod
+    def _separate_pages(cls, pages: Iterable[str]) -> Iterator[str]:
+        """Yield the pages with PAGE_SEPARATOR between consecutive ones."""
+        for page_index, page in enumerate(pages):
+            if page_index:
+                yield cls.PAGE_SEPARATOR
+            yield page
+    
+    @staticmethod
+    def _iter_stream_lines(chunks: Iterable[str]) -> Iterator[Tuple[int, str]]:
+        """
+        Reassemble lines from text chunks.
+        
+        Args:
+            chunks: Iterable of text chunks
+        
+        Yields:
+            Tuple of (offset of the line in the concatenated text, line)
+        """
+        offset = 0
+        partial: List[str] = []
+        
+        for chunk in chunks:
+            if '\n' not in chunk:
+                if chunk:
+                    partial.append(chunk)
+                continue
+            
+            lines = chunk.split('\n')
+            if partial:
+                partial.append(lines[0])
+                lines[0] = ''.join(partial)
+                partial = []
+            
+            last = lines.pop()
+            for line in lines:
+                yield offset, line
+                offset += len(line) + 1
+            
+            if last:
+                partial.append(last)
+        
+        if partial:
+            yield offset, ''.join(partial)
+    
+    def segment_by_structure(self, text: str, scan: Optional[DocumentScan] = None) -> SegmentationResult:
+        """
+        Segment text using document structure (headings, numbering).
+        
+        Args:
+            text: Contract text to segment
+            scan: Existing scan of the text, if already computed
+        
+        Returns:
+            SegmentationResult with clauses and confidence
+        """
+        return (scan or self.scan(text)).structure
+    
+    def segment_by_semantics(self, text: str, scan: Optional[DocumentScan] = None) -> SegmentationResult:
         """
         Segment text using semantic boundaries (paragraphs, sentences).
         
         Args:
             text: Contract text to segment
-            
+            scan: Existing scan of the text, if already computed
+        
         Returns:
             SegmentationResult with clauses and confidence
         """
-        # Split by double newlines (paragraphs)
-        paragraphs = re.split(r'\n\s*\n', text)
+        if scan is None:
+            scan = self.scan(text)
         
         clauses = []
-        char_position = 0
+        char_position = 2 if scan.leading_gap else 0  # Account for double newline
         current_clause_text = []
+        current_length = 0
         current_start = 0
         
-        for para in paragraphs:
-            para = para.strip()
-            
-            if not para:
-                char_position += 2  # Account for double newline
-                continue
+        for para_start, para_end in scan.paragraphs:
+            para = text[para_start:para_end]
             
-            # Add paragraph to current clause
+            # Add paragraph to current clause, tracking the joined length
             current_clause_text.append(para)
-            combined_text = '\n\n'.join(current_clause_text)
+            current_length += len(para) + (2 if len(current_clause_text) > 1 else 0)
             
             # Check if we should split here
             should_split = (
-                len(combined_text) >= self.min_clause_length * 2 or
-                len(combined_text) >= self.max_clause_length or
+                current_length >= self.min_clause_length * 2 or
+                current_length >= self.max_clause_length or
                 self._is_semantic_boundary(para)
             )
             
-            if should_split and len(combined_text) >= self.min_clause_length:
+            if should_split and current_length >= self.min_clause_length:
                 clause = Clause(
                     clause_id=f"clause_{len(clauses) + 1}",
-                    text=combined_text.strip(),
+                    text='\n\n'.join(current_clause_text),
                     start_position=current_start,
                     end_position=char_position + len(para)
                 )
@@ -218,21 +455,23 @@ class ClauseSegmenter:
                 
                 # Reset for next clause
                 current_clause_text = []
+                current_length = 0
                 current_start = char_position + len(para) + 2
             
             char_position += len(para) + 2
         
+        if scan.trailing_gap:
+            char_position += 2
+        
         # Add final clause
-        if current_clause_text:
-            combined_text = '\n\n'.join(current_clause_text).strip()
-            if len(combined_text) >= self.min_clause_length:
-                clause = Clause(
-                    clause_id=f"clause_{len(clauses) + 1}",
-                    text=combined_text,
-                    start_position=current_start,
-                    end_position=char_position
-                )
-                clauses.append(clause)
+        if current_clause_text and current_length >= self.min_clause_length:
+            clause = Clause(
+                clause_id=f"clause_{len(clauses) + 1}",
+                text='\n\n'.join(current_clause_text),
+                start_position=current_start,
+                end_position=char_position
+            )
+            clauses.append(clause)
         
         # If we got very few clauses, try sentence-based splitting
         if len(clauses) < 3:
@@ -257,27 +496,29 @@ class ClauseSegmenter:
             List of clauses
         """
         # Simple sentence splitting
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENTENCE_BOUNDARY_RE.split(text)
         
         clauses = []
         current_sentences = []
+        current_length = 0
         current_start = 0
         char_position = 0
         
         for sentence in sentences:
             current_sentences.append(sentence)
-            combined = ' '.join(current_sentences)
+            current_length += len(sentence) + (1 if len(current_sentences) > 1 else 0)
             
-            if len(combined) >= self.min_clause_length:
+            if current_length >= self.min_clause_length:
                 clause = Clause(
                     clause_id=f"clause_{len(clauses) + 1}",
-                    text=combined.strip(),
+                    text=' '.join(current_sentences).strip(),
                     start_position=current_start,
                     end_position=char_position + len(sentence)
                 )
                 clauses.append(clause)
                 
                 current_sentences = []
+                current_length = 0
                 current_start = char_position + len(sentence) + 1
             
             char_position += len(sentence) + 1
@@ -296,6 +537,40 @@ class ClauseSegmenter:
         
         return clauses
     
+    def _match_markers(self, text: str, start: int, end: int) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Match section number and heading patterns against one stripped line.
+        
+        Args:
+            text: Full document text
+            start: Start offset of the stripped line
+            end: End offset of the stripped line
+        
+        Returns:
+            Tuple of (section_number, heading), each None if not found
+        """
+        match = self._marker_re.match(text, start, end)
+        
+        section = match.group('section')
+        if section is not None:
+            section = section.strip()
+        
+        # Check if line is short enough to be a heading
+        if end - start > 100:
+            return section, None
+        
+        for group in self._heading_groups:
+            heading = match.group(group)
+            if heading is not None:
+                return section, heading.strip()
+        
+        # Check if entire line is uppercase (common for headings)
+        line = text[start:end]
+        if line.isupper() and len(line.split()) <= 10:
+            return section, line
+        
+        return section, None
+    
     def _match_section_number(self, line: str) -> Optional[str]:
         """
         Check if line starts with a section number.
@@ -306,11 +581,8 @@ class ClauseSegmenter:
         Returns:
             Section number if found, None otherwise
         """
-        for pattern in self.SECTION_PATTERNS:
-            match = re.match(pattern, line)
-            if match:
-                return match.group(0).strip()
-        return None
+        line = line.strip()
+        return self._match_markers(line, 0, len(line))[0]
     
     def _match_heading(self, line: str) -> Optional[str]:
         """
@@ -322,20 +594,8 @@ class ClauseSegmenter:
         Returns:
             Heading text if found, None otherwise
         """
-        # Check if line is short enough to be a heading
-        if len(line) > 100:
-            return None
-        
-        for pattern in self.HEADING_PATTERNS:
-            match = re.match(pattern, line)
-            if match:
-                return match.group(1).strip()
-        
-        # Check if entire line is uppercase (common for headings)
-        if line.isupper() and len(line.split()) <= 10:
-            return line.strip()
-        
-        return None
+        line = line.strip()
+        return self._match_markers(line, 0, len(line))[1]
     
     def _is_semantic_boundary(self, paragraph: str) -> bool:
         """
@@ -347,25 +607,9 @@ class ClauseSegmenter:
         Returns:
             True if this is likely a clause boundary
         """
-        # Check for concluding phrases
-        concluding_phrases = [
-            'shall be',
-            'agrees to',
-            'is required to',
-            'must',
-            'will',
-            'hereby',
-            'notwithstanding',
-            'provided that',
-            'subject to'
-        ]
-        
-        para_lower = paragraph.lower()
-        
         # If paragraph starts with a concluding phrase, it's likely a new clause
-        for phrase in concluding_phrases:
-            if para_lower.startswith(phrase):
-                return True
+        if paragraph[:_MAX_PHRASE_LENGTH].lower().startswith(_CONCLUDING_PHRASES):
+            return True
         
         # If paragraph ends with a period and next would start new topic
         if paragraph.endswith('.'):
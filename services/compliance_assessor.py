@@ -2,11 +2,12 @@
 Compliance Assessor service.
 Assesses individual clauses against regulatory requirements.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from models.clause_analysis import ClauseAnalysis
 from models.regulatory_requirement import (
     RegulatoryRequirement,
+    RequirementMatchPlan,
     ClauseComplianceResult,
     ComplianceStatus,
     RiskLevel
@@ -38,6 +39,7 @@ class ComplianceAssessor:
         """
         self.knowledge_base = knowledge_base
         self.rule_engine = rule_engine or ComplianceRuleEngine()
+        self.rule_engine.compile_requirements(self.knowledge_base.get_all_requirements())
         logger.info("Compliance Assessor initialized")
     
     def assess_clause_compliance(
@@ -67,6 +69,33 @@ class ComplianceAssessor:
                 top_k=3  # Get top 3 matches
             )
             
+            return self.assess_clause_with_matches(clause, framework, matches)
+            
+        except Exception as e:
+            logger.error(f"Error assessing clause compliance: {e}", exc_info=True)
+            return self._create_error_result(clause, framework, e)
+    
+    def assess_clause_with_matches(
+        self,
+        clause: ClauseAnalysis,
+        framework: str,
+        matches: List[Tuple[RegulatoryRequirement, float]],
+        evaluation: Optional[Tuple[ComplianceStatus, RiskLevel, List[str]]] = None
+    ) -> ClauseComplianceResult:
+        """
+        Assess a clause given its already-ranked requirement matches.
+        
+        Args:
+            clause: Analyzed clause
+            framework: Regulatory framework the matches belong to
+            matches: (requirement, similarity_score) tuples, best first
+            evaluation: Rule engine result for the best match, if already
+                computed (see assess_multiple_clauses)
+            
+        Returns:
+            ClauseComplianceResult with compliance status, risk level, and issues
+        """
+        try:
             if not matches:
                 # No matching requirements found
                 logger.warning(
@@ -89,11 +118,13 @@ class ComplianceAssessor:
             best_requirement, best_similarity = matches[0]
             
             # Evaluate compliance using rule engine
-            status, risk, issues = self.rule_engine.evaluate_compliance(
-                clause,
-                best_requirement,
-                best_similarity
-            )
+            if evaluation is None:
+                evaluation = self.rule_engine.evaluate_compliance(
+                    clause,
+                    best_requirement,
+                    best_similarity
+                )
+            status, risk, issues = evaluation
             
             # Collect all matched requirements
             matched_requirements = [req for req, _ in matches]
@@ -120,23 +151,13 @@ class ComplianceAssessor:
             
         except Exception as e:
             logger.error(f"Error assessing clause compliance: {e}", exc_info=True)
-            # Return a safe default result
-            return ClauseComplianceResult(
-                clause_id=clause.clause_id,
-                clause_text=clause.clause_text,
-                clause_type=clause.clause_type,
-                framework=framework,
-                compliance_status=ComplianceStatus.NOT_APPLICABLE,
-                risk_level=RiskLevel.MEDIUM,
-                matched_requirements=[],
-                confidence=0.0,
-                issues=[f"Error during assessment: {str(e)}"]
-            )
+            return self._create_error_result(clause, framework, e)
     
     def assess_multiple_clauses(
         self,
         clauses: List[ClauseAnalysis],
-        framework: str
+        framework: str,
+        match_plan: Optional[RequirementMatchPlan] = None
     ) -> List[ClauseComplianceResult]:
         """
         Assess multiple clauses against a framework.
@@ -144,6 +165,7 @@ class ComplianceAssessor:
         Args:
             clauses: List of analyzed clauses
             framework: Regulatory framework to check against
+            match_plan: Precomputed matches to reuse (optional)
             
         Returns:
             List of compliance results
@@ -152,9 +174,17 @@ class ComplianceAssessor:
             f"Assessing {len(clauses)} clauses against {framework}"
         )
         
+        all_matches = self._get_framework_matches(clauses, framework, match_plan)
+        evaluations = self._evaluate_best_matches(clauses, {framework: all_matches})
+        
         results = []
-        for clause in clauses:
-            result = self.assess_clause_compliance(clause, framework)
+        for idx, (clause, matches) in enumerate(zip(clauses, all_matches)):
+            result = self.assess_clause_with_matches(
+                clause,
+                framework,
+                matches,
+                evaluation=evaluations.get((framework, idx))
+            )
             results.append(result)
         
         logger.info(
@@ -163,6 +193,118 @@ class ComplianceAssessor:
         
         return results
     
+    def assess_frameworks(
+        self,
+        clauses: List[ClauseAnalysis],
+        frameworks: List[str],
+        match_plan: Optional[RequirementMatchPlan] = None
+    ) -> Dict[str, List[ClauseComplianceResult]]:
+        """
+        Assess multiple clauses against several frameworks in one pass.
+        
+        Each clause is lowercased and scanned for the rules of all frameworks'
+        best-matching requirements once, instead of once per framework.
+        Results equal assess_multiple_clauses() for each framework.
+        
+        Args:
+            clauses: List of analyzed clauses
+            frameworks: Regulatory frameworks to check against
+            match_plan: Precomputed matches to reuse (optional)
+            
+        Returns:
+            Dictionary mapping each framework to its compliance results, in clause order
+        """
+        logger.info(
+            f"Assessing {len(clauses)} clauses against {', '.join(frameworks)}"
+        )
+        
+        framework_matches = {
+            framework: self._get_framework_matches(clauses, framework, match_plan)
+            for framework in frameworks
+        }
+        evaluations = self._evaluate_best_matches(clauses, framework_matches)
+        
+        results: Dict[str, List[ClauseComplianceResult]] = {}
+        for framework, all_matches in framework_matches.items():
+            results[framework] = [
+                self.assess_clause_with_matches(
+                    clause,
+                    framework,
+                    matches,
+                    evaluation=evaluations.get((framework, idx))
+                )
+                for idx, (clause, matches) in enumerate(zip(clauses, all_matches))
+            ]
+        
+        logger.info(
+            f"Completed assessment of {len(clauses)} clauses for {len(frameworks)} frameworks"
+        )
+        
+        return results
+    
+    def _get_framework_matches(
+        self,
+        clauses: List[ClauseAnalysis],
+        framework: str,
+        match_plan: Optional[RequirementMatchPlan] = None
+    ) -> List[List[Tuple[RegulatoryRequirement, float]]]:
+        """
+        Get each clause's top 3 requirement matches in a framework.
+        
+        Args:
+            clauses: Analyzed clauses
+            framework: Regulatory framework
+            match_plan: Precomputed matches to reuse (optional)
+            
+        Returns:
+            Ranked (requirement, similarity) matches per clause
+        """
+        if match_plan is not None and match_plan.has_framework(framework):
+            return match_plan.get_framework_matches(framework, top_k=3)
+        
+        # Score every clause against the framework in one matrix product
+        return self.knowledge_base.match_clauses_to_requirements(
+            clauses,
+            framework,
+            top_k=3
+        )
+    
+    def _evaluate_best_matches(
+        self,
+        clauses: List[ClauseAnalysis],
+        framework_matches: Dict[str, List[List[Tuple[RegulatoryRequirement, float]]]]
+    ) -> Dict[Tuple[str, int], Tuple[ComplianceStatus, RiskLevel, List[str]]]:
+        """
+        Run the rule engine on each clause's best match in each framework.
+        
+        All pairs go to the rule engine together, which scans each clause
+        once for every framework's rules.
+        
+        Args:
+            clauses: Analyzed clauses
+            framework_matches: Ranked matches per clause, by framework
+            
+        Returns:
+            Dictionary mapping (framework, clause index) to (status, risk, issues);
+            empty if batch evaluation fails (clauses are then evaluated one by one)
+        """
+        keys: List[Tuple[str, int]] = []
+        pairs: List[Tuple[int, RegulatoryRequirement, float]] = []
+        for framework, all_matches in framework_matches.items():
+            for idx, matches in enumerate(all_matches):
+                if matches:
+                    requirement, similarity = matches[0]
+                    keys.append((framework, idx))
+                    pairs.append((idx, requirement, similarity))
+        
+        try:
+            evaluations = self.rule_engine.evaluate_pairs(clauses, pairs)
+        except Exception as e:
+            logger.warning(f"Batch rule evaluation failed, evaluating clauses individually: {e}")
+            return {}
+        
+        return dict(zip(keys, evaluations))
+    
     def assess_clause_against_multiple_frameworks(
         self,
         clause: ClauseAnalysis,
@@ -287,3 +429,32 @@ class ComplianceAssessor:
             List of non-compliant results
         """
         return self.filter_results_by_status(results, ComplianceStatus.NON_COMPLIANT)
+    
+    @staticmethod
+    def _create_error_result(
+        clause: ClauseAnalysis,
+        framework: str,
+        error: Exception
+    ) -> ClauseComplianceResult:
+        """
+        Create a safe default result for a failed assessment.
+        
+        Args:
+            clause: Clause being assessed
+            framework: Framework being checked
+            error: Exception raised during assessment
+            
+        Returns:
+            ClauseComplianceResult flagged with the error
+        """
+        return ClauseComplianceResult(
+            clause_id=clause.clause_id,
+            clause_text=clause.clause_text,
+            clause_type=clause.clause_type,
+            framework=framework,
+            compliance_status=ComplianceStatus.NOT_APPLICABLE,
+            risk_level=RiskLevel.MEDIUM,
+            matched_requirements=[],
+            confidence=0.0,
+            issues=[f"Error during assessment: {str(error)}"]
+        )
@@ -5,6 +5,7 @@ Main orchestrator for compliance checking across multiple frameworks.
 from typing import List, Optional, Dict
 import time
 
+from config.settings import config
 from models.clause_analysis import ClauseAnalysis
 from models.regulatory_requirement import (
     ComplianceReport,
@@ -16,6 +17,7 @@ from services.compliance_rule_engine import ComplianceRuleEngine
 from services.compliance_assessor import ComplianceAssessor
 from services.compliance_scorer import ComplianceScorer
 from services.embedding_generator import EmbeddingGenerator
+from services.report_cache import ReportCache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -32,7 +34,8 @@ class ComplianceChecker:
         knowledge_base: Optional[RegulatoryKnowledgeBase] = None,
         rule_engine: Optional[ComplianceRuleEngine] = None,
         assessor: Optional[ComplianceAssessor] = None,
-        scorer: Optional[ComplianceScorer] = None
+        scorer: Optional[ComplianceScorer] = None,
+        report_cache: Optional[ReportCache] = None
     ):
         """
         Initialize Compliance Checker.
@@ -42,6 +45,7 @@ class ComplianceChecker:
             rule_engine: Compliance rule engine (optional)
             assessor: Compliance assessor (optional)
             scorer: Compliance scorer (optional)
+            report_cache: Report cache (optional, opened from config if not provided)
         """
         logger.info("Initializing Compliance Checker...")
         
@@ -55,6 +59,7 @@ class ComplianceChecker:
             self.rule_engine
         )
         self.scorer = scorer or ComplianceScorer()
+        self.report_cache = report_cache or self._open_report_cache()
         
         # Precompute embeddings for better performance
         try:
@@ -103,18 +108,36 @@ class ComplianceChecker:
             if not valid_frameworks:
                 logger.error(f"No valid frameworks found in: {frameworks}")
                 raise ValueError(
-                    f"Invalid frameworks. Supported: GDPR, HIPAA, CCPA, SOX"
+                    f"Invalid frameworks. Supported: {', '.join(self.get_supported_frameworks())}"
                 )
             
-            # Assess each clause against each framework
+            # Reuse the report of an identical earlier check
+            cache_key = self._report_cache_key(clauses, valid_frameworks)
+            if cache_key is not None:
+                cached_report = self.report_cache.get(
+                    cache_key,
+                    self.knowledge_base.get_all_requirements()
+                )
+                if cached_report is not None:
+                    logger.info(f"Compliance report for document {document_id} served from cache")
+                    return self._adapt_cached_report(cached_report, document_id, valid_frameworks)
+            
+            # Match every clause against every framework once
+            match_plan = self.knowledge_base.build_match_plan(
+                clauses,
+                valid_frameworks,
+                document_id=document_id
+            )
+            
+            # Assess each clause against all frameworks in one pass
+            framework_results = self.assessor.assess_frameworks(
+                clauses,
+                valid_frameworks,
+                match_plan=match_plan
+            )
             all_results = []
             for framework in valid_frameworks:
-                logger.info(f"Assessing clauses against {framework}...")
-                framework_results = self.assessor.assess_multiple_clauses(
-                    clauses,
-                    framework
-                )
-                all_results.extend(framework_results)
+                all_results.extend(framework_results[framework])
             
             logger.info(f"Generated {len(all_results)} compliance assessments")
             
@@ -124,7 +147,8 @@ class ComplianceChecker:
                 logger.info(f"Identifying missing requirements for {framework}...")
                 missing = self.knowledge_base.find_missing_requirements(
                     clauses,
-                    framework
+                    framework,
+                    match_plan=match_plan
                 )
                 all_missing_requirements.extend(missing)
             
@@ -139,6 +163,10 @@ class ComplianceChecker:
                 clause_results=all_results,
                 missing_requirements=all_missing_requirements
             )
+            report.match_plan = match_plan
+            
+            if cache_key is not None:
+                self.report_cache.put(cache_key, report)
             
             elapsed_time = time.time() - start_time
             logger.info(
@@ -193,14 +221,26 @@ class ComplianceChecker:
             valid_frameworks = self._validate_frameworks(frameworks)
             scores = {}
             
+            match_plan = self.knowledge_base.build_match_plan(
+                clauses,
+                valid_frameworks
+            )
+            
+            # Assess clauses
+            framework_results = self.assessor.assess_frameworks(
+                clauses,
+                valid_frameworks,
+                match_plan=match_plan
+            )
+            
             for framework in valid_frameworks:
-                # Assess clauses
-                results = self.assessor.assess_multiple_clauses(clauses, framework)
+                results = framework_results[framework]
                 
                 # Find missing requirements
                 missing = self.knowledge_base.find_missing_requirements(
                     clauses,
-                    framework
+                    framework,
+                    match_plan=match_plan
                 )
                 
                 # Calculate score
@@ -253,7 +293,7 @@ class ComplianceChecker:
             
             # Calculate similarity
             clause_embedding = clause.embeddings
-            req_embedding = self.knowledge_base.get_requirement_embedding(requirement)
+            req_embedding = self.knowledge_base.get_requirement_vector(requirement_id)
             
             similarity = self.knowledge_base._cosine_similarity(
                 clause_embedding,
@@ -330,6 +370,98 @@ class ComplianceChecker:
     
     # Private helper methods
     
+    def _open_report_cache(self) -> Optional[ReportCache]:
+        """Open the configured report cache, or None if disabled."""
+        if not config.compliance.report_cache_enabled:
+            return None
+        
+        cache_dir = config.compliance.report_cache_dir or (config.temp_dir / "report_cache")
+        try:
+            return ReportCache(
+                cache_dir,
+                max_bytes=config.compliance.report_cache_max_mb * 1024 * 1024,
+                ttl_seconds=config.compliance.report_cache_ttl_hours * 3600
+            )
+        except Exception as e:
+            logger.warning(f"Report cache unavailable, continuing without it: {e}")
+            return None
+    
+    def _report_cache_key(
+        self,
+        clauses: List[ClauseAnalysis],
+        frameworks: List[str]
+    ) -> Optional[str]:
+        """
+        Compute the report cache key of a check.
+        
+        The key covers everything the report depends on besides the clauses and
+        frameworks, so edited requirements, rule packs, thresholds or a different
+        embedding model never hit reports computed before the change.
+        
+        Args:
+            clauses: Analyzed clauses
+            frameworks: Validated framework names
+            
+        Returns:
+            Cache key, or None if caching is disabled or the key cannot be computed
+        """
+        if self.report_cache is None:
+            return None
+        
+        try:
+            embedding_generator = self.knowledge_base.embedding_generator
+            return ReportCache.make_key(clauses, frameworks, {
+                'similarity_threshold': self.knowledge_base.similarity_threshold,
+                'embedding_model': getattr(
+                    embedding_generator,
+                    'store_model_name',
+                    getattr(embedding_generator, 'model_name', type(embedding_generator).__name__)
+                ),
+                'requirements_version': self.knowledge_base.get_requirements_version(),
+                'rule_packs_version': self.assessor.rule_engine.get_rule_packs_version()
+            })
+        except Exception as e:
+            logger.warning(f"Could not compute report cache key, checking without cache: {e}")
+            return None
+    
+    def _adapt_cached_report(
+        self,
+        report: ComplianceReport,
+        document_id: str,
+        frameworks: List[str]
+    ) -> ComplianceReport:
+        """
+        Fit a cached report to the current check.
+        
+        Args:
+            report: Report from the report cache
+            document_id: Document identifier of the current check
+            frameworks: Validated framework names, in the requested order
+            
+        Returns:
+            Report for the current document with results in framework order
+        """
+        report.document_id = document_id
+        if report.match_plan is not None:
+            report.match_plan.document_id = document_id
+        
+        if report.frameworks_checked == frameworks:
+            return report
+        
+        # Cached for the same frameworks in another order
+        order = {framework: i for i, framework in enumerate(frameworks)}
+        reordered = self.scorer.generate_compliance_report(
+            document_id=document_id,
+            frameworks_checked=frameworks,
+            clause_results=sorted(report.clause_results, key=lambda r: order[r.framework]),
+            missing_requirements=sorted(
+                report.missing_requirements,
+                key=lambda req: order.get(req.framework.upper(), len(order))
+            )
+        )
+        reordered.match_plan = report.match_plan
+        return reordered
+    
     def _validate_frameworks(self, frameworks: List[str]) -> List[str]:
         """
         Validate and normalize framework names.
@@ -340,7 +472,7 @@ class ComplianceChecker:
         Returns:
             List of valid, normalized framework names
         """
-        valid_frameworks = {'GDPR', 'HIPAA', 'CCPA', 'SOX'}
+        valid_frameworks = set(self.get_supported_frameworks())
         normalized = []
         
         for framework in frameworks:
@@ -430,10 +562,15 @@ class ComplianceChecker:
         """
         Get list of supported regulatory frameworks.
         
+        A framework is supported when it has both requirements and a rule pack.
+        
         Returns:
             List of supported framework names
         """
-        return ['GDPR', 'HIPAA', 'CCPA', 'SOX']
+        return [
+            framework for framework in self.knowledge_base.framework_requirements
+            if framework in self.rule_engine.rule_packs
+        ]
     
     def clear_cache(self):
         """Clear all caches to free memory."""
@@ -1,30 +1,567 @@
 """
 Compliance Rule Engine service.
 Evaluates clauses against framework-specific compliance rules.
+
+Framework rules (thresholds, issue templates and clause-type checks) come
+from declarative rule packs, see services/rule_pack_loader.py.
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+import hashlib
+import json
 import re
 
+import numpy as np
+
+from config.settings import config
 from models.regulatory_requirement import (
     RegulatoryRequirement,
     ComplianceStatus,
     RiskLevel
 )
 from models.clause_analysis import ClauseAnalysis
+from models.rule_pack import RulePack
+from services.rule_pack_loader import load_rule_packs
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Words ignored when turning a mandatory element into search keywords
+_ELEMENT_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'of', 'to', 'in', 'for', 'on', 'with'})
+
+# Bound on cached evaluation plans (one per distinct requirement list)
+_MAX_CACHED_PLANS = 64
+
+
+@lru_cache(maxsize=4096)
+def _element_keywords(element: str) -> Tuple[str, ...]:
+    """Cached keywords of a mandatory element (see _extract_keywords_from_element)."""
+    return tuple(ComplianceRuleEngine._extract_keywords_from_element(element))
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Cached compiled rule pack regex."""
+    return re.compile(pattern)
+
+
+class RequirementMatcher:
+    """
+    A requirement compiled with its framework's rule pack for repeated evaluation.
+    
+    Mandatory element keywords and the keywords of the clause-type checks are
+    deduplicated into one keyword list, with an incidence matrix mapping
+    keywords to the elements they satisfy; check regexes go into one pattern
+    list. Checks are incidence matrices over those lists, so the checks of
+    many clauses are decided by two matrix products.
+    """
+    
+    def __init__(self, requirement: RegulatoryRequirement, rule_pack: RulePack):
+        """
+        Compile a requirement.
+        
+        Args:
+            requirement: Requirement to compile
+            rule_pack: Rule pack of the framework whose rules apply
+        """
+        self.requirement = requirement
+        self.rule_pack = rule_pack
+        self.framework = rule_pack.framework
+        
+        columns: Dict[str, int] = {}
+        pattern_columns: Dict[str, int] = {}
+        
+        self.elements = list(requirement.mandatory_elements)
+        self._element_columns = [
+            tuple(
+                columns.setdefault(keyword, len(columns))
+                for keyword in rule_pack.element_keywords.get(element) or _element_keywords(element)
+            )
+            for element in self.elements
+        ]
+        
+        # (keyword columns, pattern columns, min_count) per check
+        checks = rule_pack.checks.get(requirement.clause_type, [])
+        self._check_columns = [
+            (
+                [columns.setdefault(keyword, len(columns)) for keyword in check.keywords],
+                [pattern_columns.setdefault(pattern, len(pattern_columns)) for pattern in check.patterns],
+                check.min_count
+            )
+            for check in checks
+        ]
+        
+        self.keywords = list(columns)
+        self.patterns = list(pattern_columns)
+        self._compiled_patterns = [_compile_pattern(pattern) for pattern in self.patterns]
+        
+        # incidence[k, e] is 1 when keyword k satisfies element e
+        self.incidence = np.zeros((len(self.keywords), len(self.elements)), dtype=np.int32)
+        for element_index, element_columns in enumerate(self._element_columns):
+            self.incidence[list(element_columns), element_index] = 1
+        
+        # A check passes when its keyword hits plus pattern hits reach min_count
+        self.check_issues = [check.issue for check in checks]
+        self.check_min_counts = np.array([check.min_count for check in checks], dtype=np.int32)
+        self.check_keyword_incidence = np.zeros((len(self.keywords), len(checks)), dtype=np.int32)
+        self.check_pattern_incidence = np.zeros((len(self.patterns), len(checks)), dtype=np.int32)
+        for check_index, (keyword_columns, check_pattern_columns, _) in enumerate(self._check_columns):
+            self.check_keyword_incidence[keyword_columns, check_index] = 1
+            self.check_pattern_incidence[check_pattern_columns, check_index] = 1
+    
+    def scan(self, clause_text_lower: str) -> Tuple[List[bool], List[bool]]:
+        """
+        Search a clause for the matcher's keywords and patterns.
+        
+        Args:
+            clause_text_lower: Lowercased clause text
+        
+        Returns:
+            Tuple of (keyword found flags, pattern matched flags)
+        """
+        found = [keyword in clause_text_lower for keyword in self.keywords]
+        matched = [pattern.search(clause_text_lower) is not None for pattern in self._compiled_patterns]
+        return found, matched
+    
+    def missing_elements(self, clause_text_lower: str) -> List[str]:
+        """
+        Find the mandatory elements a clause does not mention.
+        
+        Args:
+            clause_text_lower: Lowercased clause text
+        
+        Returns:
+            Missing elements, in requirement order
+        """
+        found = self.scan(clause_text_lower)[0]
+        return [
+            element for element, element_columns in zip(self.elements, self._element_columns)
+            if not any(found[col] for col in element_columns)
+        ]
+    
+    def failed_checks(self, found: np.ndarray, matched: np.ndarray) -> np.ndarray:
+        """
+        Decide the clause-type checks of one or more clauses.
+        
+        Args:
+            found: Keyword flags from scan(), shape (len(keywords),) or (n, len(keywords))
+            matched: Pattern flags from scan(), shape (len(patterns),) or (n, len(patterns))
+        
+        Returns:
+            Boolean array, True where a check fails, shape (len(check_issues),) or (n, ...)
+        """
+        hits = (
+            np.asarray(found, dtype=np.int32) @ self.check_keyword_incidence
+            + np.asarray(matched, dtype=np.int32) @ self.check_pattern_incidence
+        )
+        return hits < self.check_min_counts
+    
+    def evaluate(
+        self,
+        clause_text_lower: str,
+        similarity_score: float,
+        missing_elements: Optional[List[str]] = None,
+        failed_checks: Optional[List[bool]] = None
+    ) -> Tuple[ComplianceStatus, RiskLevel, List[str]]:
+        """
+        Evaluate a clause against the requirement.
+        
+        Args:
+            clause_text_lower: Lowercased clause text
+            similarity_score: Semantic similarity score
+            missing_elements: Precomputed result of missing_elements() (optional, with failed_checks)
+            failed_checks: Precomputed result of failed_checks() (optional, with missing_elements)
+        
+        Returns:
+            Tuple of (compliance_status, risk_level, issues)
+        """
+        if missing_elements is None or failed_checks is None:
+            found, matched = self.scan(clause_text_lower)
+            missing_elements = [
+                element for element, element_columns in zip(self.elements, self._element_columns)
+                if not any(found[col] for col in element_columns)
+            ]
+            failed_checks = [
+                sum(found[col] for col in keyword_columns) + sum(matched[col] for col in check_pattern_columns) < min_count
+                for keyword_columns, check_pattern_columns, min_count in self._check_columns
+            ]
+        
+        pack = self.rule_pack
+        templates = pack.issue_templates
+        template_fields = {
+            'elements': ', '.join(missing_elements),
+            'description': self.requirement.description
+        }
+        issues = []
+        
+        if similarity_score >= pack.compliant_threshold and not missing_elements:
+            # High similarity and all elements present
+            status = ComplianceStatus.COMPLIANT
+            risk = pack.risk_levels['compliant']
+        
+        elif similarity_score >= pack.partial_threshold:
+            status = ComplianceStatus.PARTIAL
+            risk = pack.risk_levels['partial']
+            if pack.missing_ratio is not None:
+                # Good similarity; grade by how many elements are missing
+                if len(missing_elements) <= len(self.elements) * pack.missing_ratio:
+                    template = templates.get('partial_few_missing')
+                else:
+                    template = templates.get('partial_missing')
+                if template:
+                    issues.append(template.format(**template_fields))
+            elif missing_elements and templates.get('partial_missing'):
+                issues.append(templates['partial_missing'].format(**template_fields))
+        
+        else:
+            # Low similarity
+            status = ComplianceStatus.NON_COMPLIANT
+            risk = pack.risk_levels['non_compliant']
+            if templates.get('non_compliant'):
+                issues.append(templates['non_compliant'].format(**template_fields))
+            if missing_elements and templates.get('non_compliant_missing'):
+                issues.append(templates['non_compliant_missing'].format(**template_fields))
+        
+        # Clause-type specific checks
+        if self.check_issues:
+            issues.extend(issue for issue, failed in zip(self.check_issues, failed_checks) if failed)
+        
+        # Adjust risk based on issues found
+        if issues and status == ComplianceStatus.COMPLIANT:
+            status = ComplianceStatus.PARTIAL
+            risk = pack.risk_levels['partial']
+        
+        return status, risk, issues
+
+
+class EvaluationPlan:
+    """
+    Flat evaluation plan for a list of requirements from any frameworks.
+    
+    The keywords and patterns of all matchers are merged into one table each,
+    so every clause's lowercased text is scanned once for all requirements
+    and frameworks instead of once per framework.
+    """
+    
+    def __init__(self, matchers: List[Optional[RequirementMatcher]]):
+        """
+        Build a plan.
+        
+        Args:
+            matchers: Matcher per requirement (None for requirements without a rule pack)
+        """
+        self.matchers = matchers
+        
+        keyword_columns: Dict[str, int] = {}
+        pattern_columns: Dict[str, int] = {}
+        # Position of each matcher's keywords and patterns in the merged tables
+        self._keyword_maps: List[Optional[np.ndarray]] = []
+        self._pattern_maps: List[Optional[np.ndarray]] = []
+        
+        for matcher in matchers:
+            if matcher is None:
+                self._keyword_maps.append(None)
+                self._pattern_maps.append(None)
+                continue
+            self._keyword_maps.append(np.array(
+                [keyword_columns.setdefault(keyword, len(keyword_columns)) for keyword in matcher.keywords],
+                dtype=np.int64
+            ))
+            self._pattern_maps.append(np.array(
+                [pattern_columns.setdefault(pattern, len(pattern_columns)) for pattern in matcher.patterns],
+                dtype=np.int64
+            ))
+        
+        self.keywords = list(keyword_columns)
+        self.patterns = [_compile_pattern(pattern) for pattern in pattern_columns]
+        
+        # Which merged keywords and patterns each requirement needs
+        self._keyword_incidence = np.zeros((len(matchers), len(self.keywords)), dtype=np.float32)
+        self._pattern_incidence = np.zeros((len(matchers), len(self.patterns)), dtype=np.float32)
+        for col, matcher in enumerate(matchers):
+            if matcher is not None:
+                self._keyword_incidence[col, self._keyword_maps[col]] = 1
+                self._pattern_incidence[col, self._pattern_maps[col]] = 1
+    
+    def scan(
+        self,
+        texts: List[str],
+        requirements_by_text: Optional[List[List[int]]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search lowercased clause texts for the keywords and patterns of the plan.
+        
+        Args:
+            texts: Lowercased clause texts
+            requirements_by_text: Requirement indices to scan each text for
+                (default: all); keywords shared between them are searched once
+        
+        Returns:
+            Tuple of boolean matrices (keywords found, patterns matched), one row
+            per text; entries not scanned for are False
+        """
+        if requirements_by_text is not None:
+            return self._scan_selected(texts, requirements_by_text)
+        
+        presence = np.array(
+            [[keyword in text for keyword in self.keywords] for text in texts],
+            dtype=bool
+        ).reshape(len(texts), len(self.keywords))
+        matched = np.array(
+            [[pattern.search(text) is not None for pattern in self.patterns] for text in texts],
+            dtype=bool
+        ).reshape(len(texts), len(self.patterns))
+        return presence, matched
+    
+    def _scan_selected(
+        self,
+        texts: List[str],
+        requirements_by_text: List[List[int]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Scan each text only for the keywords and patterns its requirements need."""
+        needed = np.zeros((len(texts), len(self.matchers)), dtype=np.float32)
+        for row, requirement_indices in enumerate(requirements_by_text):
+            needed[row, requirement_indices] = 1
+        
+        # Each (text, keyword) pair is searched once, however many requirements share it
+        presence = np.zeros((len(texts), len(self.keywords)), dtype=bool)
+        rows, cols = np.nonzero(needed @ self._keyword_incidence)
+        presence[rows, cols] = [
+            self.keywords[col] in texts[row] for row, col in zip(rows.tolist(), cols.tolist())
+        ]
+        
+        matched = np.zeros((len(texts), len(self.patterns)), dtype=bool)
+        rows, cols = np.nonzero(needed @ self._pattern_incidence)
+        matched[rows, cols] = [
+            self.patterns[col].search(texts[row]) is not None for row, col in zip(rows.tolist(), cols.tolist())
+        ]
+        
+        return presence, matched
+    
+    def evaluate(
+        self,
+        texts: List[str],
+        similarity_matrix: np.ndarray
+    ) -> Tuple[List[List[ComplianceStatus]], List[List[RiskLevel]], List[List[List[str]]]]:
+        """
+        Evaluate every clause against every requirement of the plan.
+        
+        Args:
+            texts: Lowercased clause texts
+            similarity_matrix: Similarity scores of shape (len(texts), len(matchers))
+        
+        Returns:
+            Tuple of (statuses, risk levels, issues), each indexed [clause][requirement]
+        """
+        n_requirements = len(self.matchers)
+        scores = np.asarray(similarity_matrix, dtype=np.float64).reshape(len(texts), n_requirements)
+        presence, matched = self.scan(texts)
+        rows = list(range(len(texts)))
+        
+        statuses = [[ComplianceStatus.NOT_APPLICABLE] * n_requirements for _ in texts]
+        risks = [[RiskLevel.LOW] * n_requirements for _ in texts]
+        issues: List[List[List[str]]] = [[[] for _ in range(n_requirements)] for _ in texts]
+        
+        for col, matcher in enumerate(self.matchers):
+            if matcher is None:
+                continue
+            
+            column_results = self._evaluate_column(col, texts, presence, matched, rows, scores[:, col].tolist())
+            for row, (status, risk, row_issues) in enumerate(column_results):
+                statuses[row][col], risks[row][col], issues[row][col] = status, risk, row_issues
+        
+        return statuses, risks, issues
+    
+    def evaluate_pairs(
+        self,
+        texts: List[str],
+        pairs: List[Tuple[int, int, float]]
+    ) -> List[Tuple[ComplianceStatus, RiskLevel, List[str]]]:
+        """
+        Evaluate selected (clause, requirement) pairs.
+        
+        Every text is scanned once for the merged keywords and patterns of
+        its paired requirements (e.g. one best match per framework).
+        
+        Args:
+            texts: Lowercased clause texts
+            pairs: (text index, requirement index, similarity score) tuples
+        
+        Returns:
+            (status, risk level, issues) per pair, in pair order
+        """
+        requirements_by_text: List[List[int]] = [[] for _ in texts]
+        for row, col, _ in pairs:
+            requirements_by_text[row].append(col)
+        
+        presence, matched = self.scan(texts, requirements_by_text)
+        results: List[Tuple[ComplianceStatus, RiskLevel, List[str]]] = [None] * len(pairs)
+        
+        positions_by_column: Dict[int, List[int]] = {}
+        for position, (_, col, _) in enumerate(pairs):
+            positions_by_column.setdefault(col, []).append(position)
+        
+        for col, positions in positions_by_column.items():
+            if self.matchers[col] is None:
+                for position in positions:
+                    results[position] = (ComplianceStatus.NOT_APPLICABLE, RiskLevel.LOW, [])
+                continue
+            
+            column_results = self._evaluate_column(
+                col,
+                texts,
+                presence,
+                matched,
+                [pairs[position][0] for position in positions],
+                [float(pairs[position][2]) for position in positions]
+            )
+            for position, result in zip(positions, column_results):
+                results[position] = result
+        
+        return results
+    
+    def _evaluate_column(
+        self,
+        col: int,
+        texts: List[str],
+        presence: np.ndarray,
+        matched: np.ndarray,
+        rows: List[int],
+        scores: List[float]
+    ) -> List[Tuple[ComplianceStatus, RiskLevel, List[str]]]:
+        """Evaluate one requirement against the given scanned texts."""
+        matcher = self.matchers[col]
+        found = presence[np.ix_(rows, self._keyword_maps[col])].astype(np.int32)
+        element_present = ((found @ matcher.incidence) > 0).tolist()
+        failed_checks = matcher.failed_checks(found, matched[np.ix_(rows, self._pattern_maps[col])]).tolist()
+        
+        results = []
+        for index, row in enumerate(rows):
+            missing = [
+                element for element, present in zip(matcher.elements, element_present[index])
+                if not present
+            ]
+            results.append(matcher.evaluate(texts[row], scores[index], missing, failed_checks[index]))
+        return results
+
 
 class ComplianceRuleEngine:
     """
     Evaluates clauses against regulatory framework rules.
-    Implements framework-specific logic for GDPR, HIPAA, CCPA, and SOX.
+    Applies the rule pack of each framework (GDPR, HIPAA, CCPA and SOX ship in data/).
     """
     
-    def __init__(self):
-        """Initialize Compliance Rule Engine."""
-        logger.info("Compliance Rule Engine initialized")
+    def __init__(self, rule_packs: Optional[Dict[str, RulePack]] = None):
+        """
+        Initialize Compliance Rule Engine.
+        
+        Args:
+            rule_packs: Rule packs by framework (default: loaded from config.compliance.rule_pack_dir)
+        """
+        if rule_packs is None:
+            rule_packs = load_rule_packs(config.compliance.rule_pack_dir)
+        self.rule_packs = {framework.upper(): pack for framework, pack in rule_packs.items()}
+        
+        # Compiled requirements by (framework, requirement_id)
+        self._matchers: Dict[Tuple[str, str], RequirementMatcher] = {}
+        # Evaluation plans by the identities of their matchers
+        self._plans: Dict[Tuple[int, ...], EvaluationPlan] = {}
+        self._rule_packs_version: Optional[Tuple[Tuple, str]] = None
+        logger.info(f"Compliance Rule Engine initialized ({', '.join(self.rule_packs)})")
+    
+    @property
+    def supported_frameworks(self) -> List[str]:
+        """Get the frameworks that have a rule pack."""
+        return list(self.rule_packs)
+    
+    def get_rule_packs_version(self) -> str:
+        """
+        Get a version stamp of the loaded rule packs (thresholds, templates and checks).
+        
+        Returns:
+            Hex SHA-256 digest of the rule packs
+        """
+        signature = tuple((framework, id(pack)) for framework, pack in sorted(self.rule_packs.items()))
+        if self._rule_packs_version is None or self._rule_packs_version[0] != signature:
+            payload = json.dumps(
+                {framework: pack.to_dict() for framework, pack in self.rule_packs.items()},
+                sort_keys=True
+            )
+            self._rule_packs_version = (signature, hashlib.sha256(payload.encode('utf-8')).hexdigest())
+        return self._rule_packs_version[1]
+    
+    def get_matcher(
+        self,
+        requirement: RegulatoryRequirement,
+        framework: Optional[str] = None
+    ) -> RequirementMatcher:
+        """
+        Get the compiled form of a requirement, compiling it on first use.
+        
+        Args:
+            requirement: Regulatory requirement
+            framework: Framework whose rules apply (default: the requirement's)
+        
+        Returns:
+            RequirementMatcher for the requirement
+        
+        Raises:
+            ValueError: If the framework has no rule pack
+        """
+        framework = (framework or requirement.framework).upper()
+        key = (framework, requirement.requirement_id)
+        matcher = self._matchers.get(key)
+        
+        # A different object under the same ID means the requirement was replaced
+        if matcher is None or matcher.requirement is not requirement:
+            if framework not in self.rule_packs:
+                raise ValueError(f"No rule pack for framework: {framework}")
+            matcher = RequirementMatcher(requirement, self.rule_packs[framework])
+            self._matchers[key] = matcher
+        return matcher
+    
+    def compile_requirements(self, requirements: List[RegulatoryRequirement]):
+        """
+        Compile requirements ahead of evaluation.
+        
+        Args:
+            requirements: Requirements to compile (frameworks without a rule pack are skipped)
+        """
+        compiled = 0
+        for requirement in requirements:
+            if requirement.framework.upper() in self.rule_packs:
+                self.get_matcher(requirement)
+                compiled += 1
+        logger.debug(f"Compiled {compiled} requirement matchers")
+    
+    def compile_plan(self, requirements: List[RegulatoryRequirement]) -> EvaluationPlan:
+        """
+        Get the evaluation plan for a list of requirements, building it on first use.
+        
+        Args:
+            requirements: Requirements, in the column order of the similarity matrix
+        
+        Returns:
+            EvaluationPlan over the requirements
+        """
+        matchers: List[Optional[RequirementMatcher]] = []
+        for requirement in requirements:
+            framework = requirement.framework.upper()
+            if framework in self.rule_packs:
+                matchers.append(self.get_matcher(requirement, framework))
+            else:
+                logger.warning(f"Unknown framework: {framework}")
+                matchers.append(None)
+        
+        # Cached plans hold their matchers, so the identities cannot be reused
+        key = tuple(id(matcher) for matcher in matchers)
+        plan = self._plans.get(key)
+        if plan is None:
+            if len(self._plans) >= _MAX_CACHED_PLANS:
+                self._plans.clear()
+            plan = EvaluationPlan(matchers)
+            self._plans[key] = plan
+        return plan
     
     def evaluate_compliance(
         self,
@@ -39,24 +576,74 @@ class ComplianceRuleEngine:
             clause: Analyzed clause
             requirement: Regulatory requirement to check against
             similarity_score: Semantic similarity score between clause and requirement
-            
+        
         Returns:
             Tuple of (compliance_status, risk_level, issues)
         """
         framework = requirement.framework.upper()
         
-        # Route to framework-specific evaluation
-        if framework == 'GDPR':
-            return self.evaluate_gdpr_compliance(clause, requirement, similarity_score)
-        elif framework == 'HIPAA':
-            return self.evaluate_hipaa_compliance(clause, requirement, similarity_score)
-        elif framework == 'CCPA':
-            return self.evaluate_ccpa_compliance(clause, requirement, similarity_score)
-        elif framework == 'SOX':
-            return self.evaluate_sox_compliance(clause, requirement, similarity_score)
-        else:
+        if framework not in self.rule_packs:
             logger.warning(f"Unknown framework: {framework}")
             return ComplianceStatus.NOT_APPLICABLE, RiskLevel.LOW, []
+        
+        return self.get_matcher(requirement, framework).evaluate(clause.clause_text.lower(), similarity_score)
+    
+    def evaluate_batch(
+        self,
+        clauses: List[ClauseAnalysis],
+        requirements: List[RegulatoryRequirement],
+        similarity_matrix: np.ndarray
+    ) -> Tuple[List[List[ComplianceStatus]], List[List[RiskLevel]], List[List[List[str]]]]:
+        """
+        Evaluate every clause against every requirement at once.
+        
+        Requirements may come from several frameworks: each clause is scanned
+        once for the keywords and patterns of all of them (see EvaluationPlan),
+        and missing elements come from one matrix product per requirement.
+        Results equal evaluate_compliance() on each pair.
+        
+        Args:
+            clauses: Analyzed clauses
+            requirements: Regulatory requirements
+            similarity_matrix: Similarity scores of shape (len(clauses), len(requirements))
+        
+        Returns:
+            Tuple of (statuses, risk levels, issues), each indexed [clause][requirement]
+        """
+        plan = self.compile_plan(requirements)
+        return plan.evaluate([clause.clause_text.lower() for clause in clauses], similarity_matrix)
+    
+    def evaluate_pairs(
+        self,
+        clauses: List[ClauseAnalysis],
+        pairs: List[Tuple[int, RegulatoryRequirement, float]]
+    ) -> List[Tuple[ComplianceStatus, RiskLevel, List[str]]]:
+        """
+        Evaluate selected clause/requirement pairs, from any mix of frameworks.
+        
+        One plan covers the union of the pairs' requirements, so each clause is
+        lowercased and scanned once for all of its frameworks (see EvaluationPlan).
+        Results equal evaluate_compliance() on each pair.
+        
+        Args:
+            clauses: Analyzed clauses
+            pairs: (clause index, requirement, similarity score) tuples
+        
+        Returns:
+            (status, risk level, issues) per pair, in pair order
+        """
+        columns: Dict[int, int] = {}
+        requirements: List[RegulatoryRequirement] = []
+        for _, requirement, _ in pairs:
+            if id(requirement) not in columns:
+                columns[id(requirement)] = len(requirements)
+                requirements.append(requirement)
+        
+        plan = self.compile_plan(requirements)
+        return plan.evaluate_pairs(
+            [clause.clause_text.lower() for clause in clauses],
+            [(row, columns[id(requirement)], similarity) for row, requirement, similarity in pairs]
+        )
     
     def evaluate_gdpr_compliance(
         self,
@@ -71,62 +658,11 @@ class ComplianceRuleEngine:
             clause: Analyzed clause
             requirement: GDPR requirement
             similarity_score: Semantic similarity score
-            
+        
         Returns:
             Tuple of (compliance_status, risk_level, issues)
         """
-        issues = []
-        clause_text_lower = clause.clause_text.lower()
-        
-        # Check mandatory elements presence
-        missing_elements = []
-        for element in requirement.mandatory_elements:
-            element_keywords = self._extract_keywords_from_element(element)
-            if not any(keyword in clause_text_lower for keyword in element_keywords):
-                missing_elements.append(element)
-        
-        # Determine compliance status based on similarity and missing elements
-        if similarity_score >= 0.85 and not missing_elements:
-            # High similarity and all elements present
-            status = ComplianceStatus.COMPLIANT
-            risk = RiskLevel.LOW
-            
-        elif similarity_score >= 0.75 and len(missing_elements) <= len(requirement.mandatory_elements) * 0.3:
-            # Good similarity with most elements present
-            status = ComplianceStatus.PARTIAL
-            risk = RiskLevel.MEDIUM
-            issues.append(f"Missing or unclear elements: {', '.join(missing_elements)}")
-            
-        elif similarity_score >= 0.75:
-            # Good similarity but many missing elements
-            status = ComplianceStatus.PARTIAL
-            risk = RiskLevel.MEDIUM
-            issues.append(f"Missing mandatory elements: {', '.join(missing_elements)}")
-            
-        else:
-            # Low similarity
-            status = ComplianceStatus.NON_COMPLIANT
-            risk = RiskLevel.HIGH
-            issues.append(f"Clause does not adequately address requirement: {requirement.description}")
-            if missing_elements:
-                issues.append(f"Missing mandatory elements: {', '.join(missing_elements)}")
-        
-        # GDPR-specific checks
-        if requirement.clause_type == "Data Processing":
-            issues.extend(self._check_gdpr_data_processing(clause_text_lower))
-        elif requirement.clause_type == "Sub-processor Authorization":
-            issues.extend(self._check_gdpr_subprocessor(clause_text_lower))
-        elif requirement.clause_type == "Data Subject Rights":
-            issues.extend(self._check_gdpr_data_subject_rights(clause_text_lower))
-        elif requirement.clause_type == "Breach Notification":
-            issues.extend(self._check_gdpr_breach_notification(clause_text_lower))
-        
-        # Adjust risk based on issues found
-        if issues and status == ComplianceStatus.COMPLIANT:
-            status = ComplianceStatus.PARTIAL
-            risk = RiskLevel.MEDIUM
-        
-        return status, risk, issues
+        return self.get_matcher(requirement, 'GDPR').evaluate(clause.clause_text.lower(), similarity_score)
     
     def evaluate_hipaa_compliance(
         self,
@@ -141,56 +677,11 @@ class ComplianceRuleEngine:
             clause: Analyzed clause
             requirement: HIPAA requirement
             similarity_score: Semantic similarity score
-            
+        
         Returns:
             Tuple of (compliance_status, risk_level, issues)
         """
-        issues = []
-        clause_text_lower = clause.clause_text.lower()
-        
-        # Check mandatory elements presence
-        missing_elements = []
-        for element in requirement.mandatory_elements:
-            element_keywords = self._extract_keywords_from_element(element)
-            if not any(keyword in clause_text_lower for keyword in element_keywords):
-                missing_elements.append(element)
-        
-        # Determine compliance status
-        if similarity_score >= 0.85 and not missing_elements:
-            status = ComplianceStatus.COMPLIANT
-            risk = RiskLevel.LOW
-            
-        elif similarity_score >= 0.75 and len(missing_elements) <= len(requirement.mandatory_elements) * 0.3:
-            status = ComplianceStatus.PARTIAL
-            risk = RiskLevel.MEDIUM
-            issues.append(f"Missing or unclear elements: {', '.join(missing_elements)}")
-            
-        elif similarity_score >= 0.75:
-            status = ComplianceStatus.PARTIAL
-            risk = RiskLevel.MEDIUM
-            issues.append(f"Missing mandatory elements: {', '.join(missing_elements)}")
-            
-        else:
-            status = ComplianceStatus.NON_COMPLIANT
-            risk = RiskLevel.HIGH
-            issues.append(f"Clause does not adequately address requirement: {requirement.description}")
-            if missing_elements:
-                issues.append(f"Missing mandatory elements: {', '.join(missing_elements)}")
-        
-        # HIPAA-specific checks
-        if requirement.clause_type == "Security Safeguards":
-            issues.extend(self._check_hipaa_safeguards(clause_text_lower))
-        elif requirement.clause_type == "Breach Notification":
-            issues.extend(self._check_hipaa_breach_notification(clause_text_lower))
-        elif requirement.clause_type == "Permitted Uses and Disclosures":
-            issues.extend(self._check_hipaa_permitted_uses(clause_text_lower))
-        
-        # Adjust risk based on issues found
-        if issues and status == ComplianceStatus.COMPLIANT:
-            status = ComplianceStatus.PARTIAL
-            risk = RiskLevel.MEDIUM
-        
-        return status, risk, issues
+        return self.get_matcher(requirement, 'HIPAA').evaluate(clause.clause_text.lower(), similarity_score)
     
     def evaluate_ccpa_compliance(
         self,
@@ -205,35 +696,11 @@ class ComplianceRuleEngine:
             clause: Analyzed clause
             requirement: CCPA requirement
             similarity_score: Semantic similarity score
-            
+        
         Returns:
             Tuple of (compliance_status, risk_level, issues)
         """
-        issues = []
-        clause_text_lower = clause.clause_text.lower()
-        
-        # Check mandatory elements
-        missing_elements = []
-        for element in requirement.mandatory_elements:
-            element_keywords = self._extract_keywords_from_element(element)
-            if not any(keyword in clause_text_lower for keyword in element_keywords):
-                missing_elements.append(element)
-        
-        # Determine compliance status
-        if similarity_score >= 0.85 and not missing_elements:
-            status = ComplianceStatus.COMPLIANT
-            risk = RiskLevel.LOW
-        elif similarity_score >= 0.75:
-            status = ComplianceStatus.PARTIAL
-            risk = RiskLevel.MEDIUM
-            if missing_elements:
-                issues.append(f"Missing elements: {', '.join(missing_elements)}")
-        else:
-            status = ComplianceStatus.NON_COMPLIANT
-            risk = RiskLevel.HIGH
-            issues.append(f"Clause does not adequately address requirement: {requirement.description}")
-        
-        return status, risk, issues
+        return self.get_matcher(requirement, 'CCPA').evaluate(clause.clause_text.lower(), similarity_score)
     
     def evaluate_sox_compliance(
         self,
@@ -248,35 +715,11 @@ class ComplianceRuleEngine:
             clause: Analyzed clause
             requirement: SOX requirement
             similarity_score: Semantic similarity score
-            
+        
         Returns:
             Tuple of (compliance_status, risk_level, issues)
         """
-        issues = []
-        clause_text_lower = clause.clause_text.lower()
-        
-        # Check mandatory elements
-        missing_elements = []
-        for element in requirement.mandatory_elements:
-            element_keywords = self._extract_keywords_from_element(element)
-            if not any(keyword in clause_text_lower for keyword in element_keywords):
-                missing_elements.append(element)
-        
-        # Determine compliance status
-        if similarity_score >= 0.85 and not missing_elements:
-            status = ComplianceStatus.COMPLIANT
-            risk = RiskLevel.LOW
-        elif similarity_score >= 0.75:
-            status = ComplianceStatus.PARTIAL
-            risk = RiskLevel.MEDIUM
-            if missing_elements:
-                issues.append(f"Missing elements: {', '.join(missing_elements)}")
-        else:
-            status = ComplianceStatus.NON_COMPLIANT
-            risk = RiskLevel.HIGH
-            issues.append(f"Clause does not adequately address requirement: {requirement.description}")
-        
-        return status, risk, issues
+        return self.get_matcher(requirement, 'SOX').evaluate(clause.clause_text.lower(), similarity_score)
     
     def detect_missing_mandatory_elements(
         self,
@@ -289,7 +732,7 @@ class ComplianceRuleEngine:
         Args:
             clause_text: Text of the clause
             mandatory_elements: List of mandatory elements to check
-            
+        
         Returns:
             List of missing elements
         """
@@ -297,128 +740,12 @@ class ComplianceRuleEngine:
         missing = []
         
         for element in mandatory_elements:
-            element_keywords = self._extract_keywords_from_element(element)
+            element_keywords = _element_keywords(element)
             if not any(keyword in clause_text_lower for keyword in element_keywords):
                 missing.append(element)
         
         return missing
     
-    # GDPR-specific checks
-    
-    def _check_gdpr_data_processing(self, clause_text: str) -> List[str]:
-        """Check GDPR Data Processing clause requirements."""
-        issues = []
-        
-        required_terms = {
-            'instructions': ['instruction', 'instruct', 'directed'],
-            'confidentiality': ['confidential', 'confidentiality', 'secret'],
-            'security': ['security', 'secure', 'safeguard', 'protect'],
-            'controller': ['controller', 'data controller']
-        }
-        
-        for term_type, keywords in required_terms.items():
-            if not any(keyword in clause_text for keyword in keywords):
-                issues.append(f"Missing reference to {term_type}")
-        
-        return issues
-    
-    def _check_gdpr_subprocessor(self, clause_text: str) -> List[str]:
-        """Check GDPR Sub-processor Authorization requirements."""
-        issues = []
-        
-        if 'authorization' not in clause_text and 'authorisation' not in clause_text:
-            issues.append("Missing explicit authorization requirement")
-        
-        if 'notification' not in clause_text and 'notify' not in clause_text:
-            issues.append("Missing notification requirement")
-        
-        # Check for timeframe (e.g., "30 days", "prior notice")
-        if not re.search(r'\d+\s*(day|week|month)', clause_text):
-            if 'prior' not in clause_text and 'advance' not in clause_text:
-                issues.append("Missing notification timeframe")
-        
-        return issues
-    
-    def _check_gdpr_data_subject_rights(self, clause_text: str) -> List[str]:
-        """Check GDPR Data Subject Rights requirements."""
-        issues = []
-        
-        rights_keywords = ['access', 'rectification', 'erasure', 'deletion', 'portability']
-        found_rights = sum(1 for keyword in rights_keywords if keyword in clause_text)
-        
-        if found_rights < 2:
-            issues.append("Insufficient coverage of data subject rights")
-        
-        if 'assist' not in clause_text and 'support' not in clause_text:
-            issues.append("Missing assistance obligation")
-        
-        return issues
-    
-    def _check_gdpr_breach_notification(self, clause_text: str) -> List[str]:
-        """Check GDPR Breach Notification requirements."""
-        issues = []
-        
-        if 'breach' not in clause_text:
-            issues.append("Missing breach reference")
-        
-        if 'notification' not in clause_text and 'notify' not in clause_text:
-            issues.append("Missing notification obligation")
-        
-        # Check for timeframe (72 hours for GDPR)
-        if not re.search(r'\d+\s*hour', clause_text):
-            issues.append("Missing or unclear notification timeframe")
-        
-        return issues
-    
-    # HIPAA-specific checks
-    
-    def _check_hipaa_safeguards(self, clause_text: str) -> List[str]:
-        """Check HIPAA Safeguards requirements."""
-        issues = []
-        
-        safeguard_types = {
-            'administrative': ['administrative', 'management', 'policy'],
-            'physical': ['physical', 'facility', 'access control'],
-            'technical': ['technical', 'encryption', 'authentication']
-        }
-        
-        for safeguard_type, keywords in safeguard_types.items():
-            if not any(keyword in clause_text for keyword in keywords):
-                issues.append(f"Missing {safeguard_type} safeguards reference")
-        
-        return issues
-    
-    def _check_hipaa_breach_notification(self, clause_text: str) -> List[str]:
-        """Check HIPAA Breach Notification requirements."""
-        issues = []
-        
-        if 'breach' not in clause_text:
-            issues.append("Missing breach reference")
-        
-        if 'notification' not in clause_text and 'notify' not in clause_text:
-            issues.append("Missing notification obligation")
-        
-        # HIPAA requires notification within 60 days
-        if not re.search(r'\d+\s*(day|calendar day)', clause_text):
-            issues.append("Missing or unclear notification timeframe")
-        
-        return issues
-    
-    def _check_hipaa_permitted_uses(self, clause_text: str) -> List[str]:
-        """Check HIPAA Permitted Uses and Disclosures requirements."""
-        issues = []
-        
-        if 'permitted' not in clause_text and 'authorized' not in clause_text:
-            issues.append("Missing permitted uses specification")
-        
-        if 'disclosure' not in clause_text and 'disclose' not in clause_text:
-            issues.append("Missing disclosure terms")
-        
-        if 'minimum necessary' not in clause_text:
-            issues.append("Missing minimum necessary standard")
-        
-        return issues
-    
     # Helper methods
     
     @staticmethod
@@ -428,7 +755,7 @@ class ComplianceRuleEngine:
         
         Args:
             element: Mandatory element description
-            
+        
         Returns:
             List of keywords to search for
         """
@@ -436,9 +763,8 @@ class ComplianceRuleEngine:
         element_lower = element.lower()
         
         # Remove common words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'of', 'to', 'in', 'for', 'on', 'with'}
         words = element_lower.split()
-        keywords = [word.strip('.,;:()[]{}') for word in words if word not in stop_words]
+        keywords = [word.strip('.,;:()[]{}') for word in words if word not in _ELEMENT_STOP_WORDS]
         
         # Also include the full phrase
         keywords.append(element_lower)
@@ -4,7 +4,7 @@ import logging
 import time
 import uuid
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import mimetypes
 
 from models.clause import Clause
@@ -13,6 +13,8 @@ from services.pdf_extractor import PDFExtractor, PDFExtractionError, PasswordPro
 from services.ocr_extractor import OCRExtractor, OCRError
 from services.clause_segmenter import ClauseSegmenter
 from services.google_sheets_service import GoogleSheetsService, GoogleSheetsError
+from services.extraction_cache import ExtractionCache
+from config.settings import config
 from utils.error_handler import (
     DocumentProcessingError,
     UnsupportedFormatError,
@@ -36,20 +38,47 @@ class DocumentProcessor:
         'docx': ['.docx']
     }
     
-    def __init__(self):
-        """Initialize document processor with all required services."""
+    def __init__(self, extraction_workers: Optional[int] = None):
+        """
+        Initialize document processor with all required services.
+        
+        Args:
+            extraction_workers: Workers for PDF page extraction and OCR of one
+                document (default from config, falling back to CPU count).
+                Callers that already process documents in parallel pass 1.
+        """
         self.logger = logging.getLogger(__name__)
-        self.pdf_extractor = PDFExtractor()
+        self.extraction_workers = extraction_workers
+        self.pdf_extractor = PDFExtractor(max_workers=extraction_workers)
         self._ocr_extractor = None  # Lazy initialization
         self.clause_segmenter = ClauseSegmenter()
         self._google_sheets_service = None  # Lazy initialization
+        self.extraction_cache = self._open_extraction_cache()
+    
+    def _open_extraction_cache(self) -> Optional[ExtractionCache]:
+        """Open the configured extraction cache, or None if disabled."""
+        if not config.processing.extraction_cache_enabled:
+            return None
+        
+        cache_dir = config.processing.extraction_cache_dir or (config.temp_dir / "extraction_cache")
+        try:
+            return ExtractionCache(
+                cache_dir,
+                max_bytes=config.processing.extraction_cache_max_mb * 1024 * 1024
+            )
+        except Exception as e:
+            self.logger.warning(f"Extraction cache unavailable, continuing without it: {e}")
+            return None
     
     @property
     def ocr_extractor(self) -> OCRExtractor:
         """Lazy initialization of OCR extractor."""
         if self._ocr_extractor is None:
             try:
-                self._ocr_extractor = OCRExtractor(verify_installation=True)
+                self._ocr_extractor = OCRExtractor(
+                    verify_installation=True,
+                    max_workers=self.extraction_workers
+                )
             except OCRError as e:
                 self.logger.warning(f"OCR not available: {e}")
                 raise
@@ -108,33 +137,13 @@ class DocumentProcessor:
         self.logger.info(f"Processing document: {file_path.name} (type: {file_type})")
         
         try:
-            # Extract text based on file type
-            extracted_text, metadata = self._extract_text(
+            # Extract, clean and segment text, reusing a previous extraction of the same content
+            cleaned_text, clauses, metadata = self._extract_and_segment(
                 file_path,
                 file_type,
                 use_ocr
             )
             
-            # Validate extracted text
-            if not extracted_text or not extracted_text.strip():
-                raise EmptyDocumentError(
-                    "No text could be extracted from the document",
-                    details={'file_name': file_path.name, 'file_type': file_type}
-                )
-            
-            # Clean the extracted text
-            cleaned_text = self._clean_text(extracted_text)
-            
-            # Validate cleaned text has minimum content
-            if len(cleaned_text.strip()) < 50:
-                raise EmptyDocumentError(
-                    f"Document contains insufficient text ({len(cleaned_text.strip())} characters)",
-                    details={'file_name': file_path.name, 'text_length': len(cleaned_text.strip())}
-                )
-            
-            # Segment into clauses
-            clauses = self.clause_segmenter.segment(cleaned_text)
-            
             # Validate we got some clauses
             if not clauses:
                 self.logger.warning(f"No clauses extracted from {file_path.name}")
@@ -361,6 +370,135 @@ class DocumentProcessor:
                 details={'url': url}
             )
     
+    def _extract_and_segment(
+        self,
+        file_path: Path,
+        file_type: str,
+        use_ocr: bool
+    ) -> Tuple[str, List[Clause], dict]:
+        """
+        Extract, clean and segment text, served from the extraction cache when possible.
+        
+        Text PDFs are segmented page by page while later pages are still
+        being extracted (pdf_stream_segmentation); other documents are
+        segmented once their whole text is extracted.
+        
+        Args:
+            file_path: Path to file
+            file_type: Type of file (pdf, image, text, docx)
+            use_ocr: Whether to force OCR extraction
+        
+        Returns:
+            Tuple of (cleaned_text, clauses, metadata)
+        
+        Raises:
+            EmptyDocumentError: If no text could be extracted
+        """
+        cache_key = None
+        if self.extraction_cache is not None:
+            try:
+                cache_key = ExtractionCache.make_key(str(file_path), {
+                    'file_type': file_type,
+                    'use_ocr': use_ocr,
+                    'ocr_language': config.processing.ocr_language,
+                    'ocr_initial_dpi': config.processing.ocr_initial_dpi,
+                    'ocr_max_dpi': config.processing.ocr_max_dpi
+                })
+                cached = self.extraction_cache.get(cache_key)
+                if cached is not None:
+                    cleaned_text, metadata = cached
+                    self.logger.info(f"Extraction cache hit for {file_path.name}")
+                    self._check_text_length(cleaned_text, file_path)
+                    return (
+                        cleaned_text,
+                        self._segment_text(cleaned_text, metadata),
+                        {**metadata, 'extraction_cached': True}
+                    )
+            except OSError as e:
+                self.logger.warning(f"Extraction cache lookup failed: {e}")
+        
+        streamed = None
+        if file_type == 'pdf' and not use_ocr and config.processing.pdf_stream_segmentation:
+            streamed = self._stream_pdf(file_path)
+        
+        if streamed is not None:
+            cleaned_text, clauses = streamed
+            metadata = {'extraction_method': 'text_extraction', 'segmentation': 'stream'}
+            if cache_key is not None:
+                self.extraction_cache.put(cache_key, cleaned_text, metadata)
+            return cleaned_text, clauses, metadata
+        
+        extracted_text, metadata = self._extract_text(file_path, file_type, use_ocr)
+        
+        # Validate extracted text
+        if not extracted_text or not extracted_text.strip():
+            raise EmptyDocumentError(
+                "No text could be extracted from the document",
+                details={'file_name': file_path.name, 'file_type': file_type}
+            )
+        
+        # Clean the extracted text
+        cleaned_text = self._clean_text(extracted_text)
+        
+        if cache_key is not None:
+            self.extraction_cache.put(cache_key, cleaned_text, metadata)
+        
+        self._check_text_length(cleaned_text, file_path)
+        return cleaned_text, self._segment_text(cleaned_text, metadata), metadata
+    
+    def _stream_pdf(self, file_path: Path) -> Optional[Tuple[str, List[Clause]]]:
+        """
+        Extract a text PDF page by page, segmenting clauses as pages arrive.
+        
+        Each page is cleaned on its own and the cleaned text is the pages
+        joined with ClauseSegmenter.PAGE_SEPARATOR, which the clause positions
+        refer to.
+        
+        Args:
+            file_path: Path to PDF file
+        
+        Returns:
+            Tuple of (cleaned_text, clauses), or None if the pages hold too
+            little text (the caller falls back to whole-document extraction)
+        """
+        pages: List[str] = []
+        
+        def cleaned_pages():
+            for page in self.pdf_extractor.iter_pages(str(file_path)):
+                cleaned = self._clean_text(page)
+                if cleaned:
+                    pages.append(cleaned)
+                    yield cleaned
+        
+        try:
+            clauses = list(self.clause_segmenter.segment_stream(cleaned_pages()))
+        except PDFExtractionError as e:
+            self.logger.info(f"Page extraction failed, falling back to whole-document extraction: {e}")
+            return None
+        
+        cleaned_text = ClauseSegmenter.PAGE_SEPARATOR.join(pages)
+        if len(cleaned_text.strip()) <= 50:
+            return None
+        
+        self.logger.info(f"Segmented {len(pages)} PDF pages as they were extracted: {len(clauses)} clauses")
+        return cleaned_text, clauses
+    
+    def _segment_text(self, cleaned_text: str, metadata: dict) -> List[Clause]:
+        """Segment extracted text the way it was segmented when first extracted."""
+        if metadata.get('segmentation') == 'stream':
+            # A single page holding the joined pages segments exactly like the pages did
+            return list(self.clause_segmenter.segment_stream([cleaned_text]))
+        return self.clause_segmenter.segment(cleaned_text)
+    
+    @staticmethod
+    def _check_text_length(cleaned_text: str, file_path: Path):
+        """Raise EmptyDocumentError if the cleaned text has too little content."""
+        if len(cleaned_text.strip()) < 50:
+            raise EmptyDocumentError(
+                f"Document contains insufficient text ({len(cleaned_text.strip())} characters)",
+                details={'file_name': file_path.name, 'text_length': len(cleaned_text.strip())}
+            )
+    
     def _extract_text(
         self,
         file_path: Path,
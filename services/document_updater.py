@@ -249,6 +249,38 @@ class DocumentUpdater:
         else:
             return self._create_text_with_markers(original_text, generated_clauses)
     
+    def create_updated_text(
+        self,
+        original_text: str,
+        generated_clauses: List[MissingClauseGeneration]
+    ) -> str:
+        """
+        Create the updated contract as plain text, for re-analysis.
+        
+        Each generated clause is inserted as its own paragraph, without
+        markers, so the original clauses keep their text.
+        
+        Args:
+            original_text: Original contract text
+            generated_clauses: Clauses to insert
+            
+        Returns:
+            Updated contract text
+        """
+        sorted_clauses = sorted(generated_clauses, key=lambda x: x.insertion_position)
+        
+        updated_text = []
+        current_pos = 0
+        
+        for clause in sorted_clauses:
+            updated_text.append(original_text[current_pos:clause.insertion_position])
+            updated_text.append(f"\n\n{clause.generated_text.strip()}\n\n")
+            current_pos = clause.insertion_position
+        
+        updated_text.append(original_text[current_pos:])
+        
+        return "".join(updated_text)
+    
     def _create_docx_with_highlights(
         self,
         original_text: str,
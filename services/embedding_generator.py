@@ -1,9 +1,16 @@
 """
 Semantic embedding generation service using Sentence Transformers.
 """
+import re
+import threading
 import streamlit as st
 import numpy as np
-from typing import List, Dict
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Tuple
+from config.settings import config
+from services.embedding_store import EmbeddingStore
+from services.onnx_embedding_backend import ONNX_AVAILABLE, OnnxSentenceEncoder, default_model_dir
+from utils.cache import LRUCache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,24 +24,119 @@ except (ImportError, AttributeError) as e:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
     SentenceTransformer = None
 
+# Characters every supported tokenizer treats as a plain word separator
+# (space, tab, newline, carriage return and the Unicode space separators)
+_WHITESPACE_RUN_RE = re.compile('[ \t\n\r\u00a0\u1680\u2000-\u200a\u202f\u205f\u3000]+')
+
+
+@dataclass
+class EmbeddingStats:
+    """Counters for embedding requests and how they were served."""
+    texts: int = 0  # texts requested
+    unique: int = 0  # distinct normalized texts among them
+    cache_hits: int = 0  # unique texts served from the in-memory cache
+    store_hits: int = 0  # unique texts served from the persistent store
+    shared: int = 0  # unique texts encoded by a concurrent request
+    encoded: int = 0  # unique texts run through the model
+    
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of requested texts that did not need a model pass."""
+        return (self.texts - self.encoded) / self.texts if self.texts else 0.0
+    
+    def add(self, other: 'EmbeddingStats'):
+        """Fold another set of counters into this one."""
+        for name, value in asdict(other).items():
+            setattr(self, name, getattr(self, name) + value)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert counters (and hit ratio) to a dictionary."""
+        return {**asdict(self), 'hit_ratio': self.hit_ratio}
+
 
 class EmbeddingGenerator:
-    """Generate semantic embeddings for clauses using Sentence Transformers."""
+    """
+    Generate semantic embeddings for clauses using Sentence Transformers.
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    The 'torch' backend runs the SentenceTransformer model directly. The
+    'onnx' backend runs an exported (optionally int8-quantized) copy through
+    onnxruntime; its embeddings agree with the torch backend within the
+    tolerances documented in services.onnx_embedding_backend.
+    """
+    
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        store: Optional[EmbeddingStore] = None,
+        cache: Optional[LRUCache] = None,
+        backend: Optional[str] = None
+    ):
         """
         Initialize embedding generator.
         
         Args:
             model_name: Sentence Transformer model name
+            store: Persistent embedding store (default from config, if configured)
+            cache: In-memory embedding cache (default: LRU bounded by ModelConfig limits)
+            backend: 'torch' or 'onnx' (default from config)
         """
         self.model_name = model_name
-        if SENTENCE_TRANSFORMERS_AVAILABLE:
-            self.model = self._load_model()
+        self.backend = (backend or config.models.embedding_backend).lower()
+        self.model = None
+        
+        if self.backend == 'onnx':
+            if ONNX_AVAILABLE:
+                self.model = self._load_onnx_model(
+                    str(config.models.onnx_model_dir or default_model_dir(config.models.cache_dir, model_name)),
+                    config.models.onnx_quantize,
+                    config.models.onnx_threads
+                )
+            else:
+                logger.warning("ONNX backend requested but onnxruntime is not installed")
+            if self.model is None:
+                logger.warning("Falling back to the torch embedding backend")
+                self.backend = 'torch'
+        
+        if self.backend == 'onnx' and config.models.onnx_quantize:
+            # int8 embeddings differ slightly, so keep them apart from fp32 ones
+            self.store_model_name = f"{model_name}@onnx-int8"
         else:
-            self.model = None
+            self.store_model_name = model_name
+        
+        if self.model is None and SENTENCE_TRANSFORMERS_AVAILABLE:
+            self.model = self._load_model()
+        if self.model is None:
             logger.warning("EmbeddingGenerator running in fallback mode - embeddings will be zeros")
-        self._embedding_cache: Dict[str, np.ndarray] = {}
+        self._embedding_cache = cache if cache is not None else create_embedding_cache()
+        self.store = store or self._open_default_store()
+        
+        # Cache keys fold case only where the tokenizer does (see normalize_text)
+        tokenizer = getattr(self.model, 'tokenizer', None)
+        self._case_insensitive = bool(getattr(tokenizer, 'do_lower_case', False))
+        self._special_tokens = tuple(token.lower() for token in getattr(tokenizer, 'all_special_tokens', []))
+        
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+        self.embedding_stats = EmbeddingStats()
+        self._stats_lock = threading.Lock()
+    
+    @staticmethod
+    def _open_default_store() -> Optional[EmbeddingStore]:
+        """
+        Open the persistent embedding store configured in ModelConfig.
+        
+        Returns:
+            EmbeddingStore, or None if not configured or unavailable
+        """
+        store_path = config.models.embedding_store_path
+        if not store_path:
+            return None
+        
+        try:
+            return EmbeddingStore(store_path)
+        except Exception as e:
+            logger.warning(f"Could not open embedding store at {store_path}: {e}")
+            return None
     
     @st.cache_resource
     def _load_model(_self):
@@ -58,6 +160,54 @@ class EmbeddingGenerator:
             logger.warning("Falling back to dummy embeddings")
             return None
     
+    @st.cache_resource
+    def _load_onnx_model(_self, model_dir: str, quantized: bool, num_threads: Optional[int]):
+        """
+        Load (exporting on first use) the ONNX embedding model with Streamlit caching.
+        
+        Args:
+            model_dir: Directory holding the ONNX export
+            quantized: Use the int8-quantized graph
+            num_threads: onnxruntime intra-op threads (None = usable CPUs)
+        
+        Returns:
+            Loaded OnnxSentenceEncoder, or None on failure
+        """
+        try:
+            logger.info(f"Loading ONNX embedding model: {_self.model_name}")
+            return OnnxSentenceEncoder.load_or_export(
+                _self.model_name,
+                model_dir,
+                quantized=quantized,
+                num_threads=num_threads
+            )
+        except Exception as e:
+            logger.error(f"Error loading ONNX embedding model: {e}")
+            return None
+    
+    def normalize_text(self, text: str) -> str:
+        """
+        Reduce a text to the form the model sees, for use as a cache key.
+        
+        Whitespace runs collapse to a single space and, for uncased
+        tokenizers, letters are lowercased. The tokenizer discards both
+        differences anyway, so texts with the same normalized form have
+        identical embeddings.
+        
+        Args:
+            text: Text to normalize
+        
+        Returns:
+            Normalized text
+        """
+        normalized = _WHITESPACE_RUN_RE.sub(' ', text).strip(' ')
+        if self._case_insensitive:
+            lowered = normalized.lower()
+            # Special tokens are matched case-sensitively, so leave texts containing them alone
+            if not any(token in lowered for token in self._special_tokens):
+                return lowered
+        return normalized
+    
     def generate_embedding(self, text: str, use_cache: bool = True) -> np.ndarray:
         """
         Generate semantic embedding for a single text.
@@ -70,23 +220,12 @@ class EmbeddingGenerator:
             Embedding vector as numpy array
         """
         # Fallback if model not available
-        if not SENTENCE_TRANSFORMERS_AVAILABLE or self.model is None:
+        if self.model is None:
             logger.debug("Using fallback zero embedding")
             return np.zeros(384)  # all-MiniLM-L6-v2 dimension
             
         try:
-            # Check cache first
-            if use_cache and text in self._embedding_cache:
-                logger.debug("Using cached embedding")
-                return self._embedding_cache[text]
-            
-            # Generate embedding
-            embedding = self.model.encode(text, convert_to_numpy=True)
-            
-            # Cache the result
-            if use_cache:
-                self._embedding_cache[text] = embedding
-            
+            embedding = self._embed_texts([text], use_cache, batch_size=1)[0]
             logger.debug(f"Generated embedding with shape: {embedding.shape}")
             return embedding
             
@@ -99,54 +238,32 @@ class EmbeddingGenerator:
         self, 
         texts: List[str], 
         use_cache: bool = True,
-        batch_size: int = 32
+        batch_size: int = 32,
+        stats: Optional[EmbeddingStats] = None
     ) -> List[np.ndarray]:
         """
         Generate embeddings for multiple texts efficiently.
         
+        Texts are deduplicated by normalize_text() first, so each distinct
+        normalized text is looked up or encoded once and its embedding is
+        shared by every text that maps to it.
+        
         Args:
             texts: List of texts to embed
             use_cache: Whether to use cached embeddings
             batch_size: Batch size for encoding
-            
+            stats: Optional counters to add this call's statistics to
+        
         Returns:
             List of embedding vectors
         """
         # Fallback if model not available
-        if not SENTENCE_TRANSFORMERS_AVAILABLE or self.model is None:
+        if self.model is None:
             logger.debug(f"Using fallback zero embeddings for {len(texts)} texts")
             return [np.zeros(384) for _ in texts]
             
         try:
-            embeddings = []
-            texts_to_encode = []
-            text_indices = []
-            
-            # Check cache for each text
-            for idx, text in enumerate(texts):
-                if use_cache and text in self._embedding_cache:
-                    embeddings.append(self._embedding_cache[text])
-                else:
-                    texts_to_encode.append(text)
-                    text_indices.append(idx)
-                    embeddings.append(None)  # Placeholder
-            
-            # Encode uncached texts in batch
-            if texts_to_encode:
-                logger.info(f"Encoding {len(texts_to_encode)} texts in batch")
-                new_embeddings = self.model.encode(
-                    texts_to_encode,
-                    convert_to_numpy=True,
-                    batch_size=batch_size,
-                    show_progress_bar=len(texts_to_encode) > 10
-                )
-                
-                # Update cache and results
-                for idx, text, embedding in zip(text_indices, texts_to_encode, new_embeddings):
-                    if use_cache:
-                        self._embedding_cache[text] = embedding
-                    embeddings[idx] = embedding
-            
+            embeddings = self._embed_texts(texts, use_cache, batch_size, stats)
             logger.info(f"Generated {len(embeddings)} embeddings")
             return embeddings
             
@@ -155,6 +272,145 @@ class EmbeddingGenerator:
             # Return zero vectors as fallback
             return [np.zeros(384) for _ in texts]
     
+    def _embed_texts(
+        self,
+        texts: List[str],
+        use_cache: bool,
+        batch_size: int,
+        stats: Optional[EmbeddingStats] = None
+    ) -> List[np.ndarray]:
+        """
+        Embed texts through the cache, the store and the model, one pass per distinct text.
+        
+        Args:
+            texts: Texts to embed
+            use_cache: Read and fill the cache and store
+            batch_size: Batch size for encoding
+            stats: Optional counters to add this call's statistics to
+        
+        Returns:
+            List of embedding vectors, one per text
+        """
+        call_stats = EmbeddingStats(texts=len(texts))
+        keys = [self.normalize_text(text) for text in texts]
+        
+        # First original text of each normalized form is the one encoded
+        unique: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            unique.setdefault(key, text)
+        call_stats.unique = len(unique)
+        
+        found: Dict[str, np.ndarray] = {}
+        if use_cache:
+            for key in unique:
+                cached = self._embedding_cache.get(key)
+                if cached is not None:
+                    found[key] = cached
+            call_stats.cache_hits = len(found)
+            
+            # Then the persistent store
+            missing = [key for key in unique if key not in found]
+            if missing and self.store is not None:
+                stored = self.store.get_many(self.store_model_name, missing)
+                if stored:
+                    logger.debug(f"Loaded {len(stored)} embeddings from store")
+                for key, embedding in stored.items():
+                    self._embedding_cache.put(key, embedding)
+                    found[key] = embedding
+                call_stats.store_hits = len(stored)
+        
+        missing = [key for key in unique if key not in found]
+        if use_cache:
+            owned, waiting = self._claim(missing)
+        else:
+            owned, waiting = missing, []
+        
+        try:
+            if owned:
+                found.update(self._encode_keys(owned, unique, use_cache, batch_size))
+                call_stats.encoded += len(owned)
+        finally:
+            if use_cache:
+                self._release(owned)
+        
+        # Texts a concurrent call was already encoding
+        unresolved = []
+        for key, event in waiting:
+            event.wait()
+            embedding = self._embedding_cache.get(key)
+            if embedding is None:
+                unresolved.append(key)
+            else:
+                found[key] = embedding
+                call_stats.shared += 1
+        
+        if unresolved:
+            found.update(self._encode_keys(unresolved, unique, use_cache, batch_size))
+            call_stats.encoded += len(unresolved)
+        
+        with self._stats_lock:
+            self.embedding_stats.add(call_stats)
+        if stats is not None:
+            stats.add(call_stats)
+        
+        return [found[key] for key in keys]
+    
+    def _encode_keys(
+        self,
+        keys: List[str],
+        unique: Dict[str, str],
+        use_cache: bool,
+        batch_size: int
+    ) -> Dict[str, np.ndarray]:
+        """Run the model over the texts behind keys, caching and storing the results."""
+        texts_to_encode = [unique[key] for key in keys]
+        logger.info(f"Encoding {len(texts_to_encode)} texts in batch")
+        new_embeddings = dict(zip(keys, self.model.encode(
+            texts_to_encode,
+            convert_to_numpy=True,
+            batch_size=batch_size,
+            show_progress_bar=len(texts_to_encode) > 10
+        )))
+        
+        if use_cache:
+            for key, embedding in new_embeddings.items():
+                self._embedding_cache.put(key, embedding)
+            if self.store is not None:
+                self.store.put_many(self.store_model_name, new_embeddings)
+        
+        return new_embeddings
+    
+    def _claim(self, keys: List[str]) -> Tuple[List[str], List[Tuple[str, threading.Event]]]:
+        """
+        Claim keys for encoding so concurrent calls do not encode them twice.
+        
+        Args:
+            keys: Normalized texts missing from the cache and store
+        
+        Returns:
+            Tuple of (keys this call must encode, (key, event) pairs for keys
+            another call is already encoding)
+        """
+        owned = []
+        waiting = []
+        with self._inflight_lock:
+            for key in keys:
+                event = self._inflight.get(key)
+                if event is None:
+                    self._inflight[key] = threading.Event()
+                    owned.append(key)
+                else:
+                    waiting.append((key, event))
+        return owned, waiting
+    
+    def _release(self, keys: List[str]):
+        """Release claimed keys and wake the calls waiting on them."""
+        with self._inflight_lock:
+            for key in keys:
+                event = self._inflight.pop(key, None)
+                if event is not None:
+                    event.set()
+    
     def compute_similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
         """
         Compute cosine similarity between two embeddings.
@@ -225,3 +481,26 @@ class EmbeddingGenerator:
     def get_cache_size(self) -> int:
         """Get the number of cached embeddings."""
         return len(self._embedding_cache)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get size, limits, and hit/miss/eviction counters of the embedding cache."""
+        return self._embedding_cache.get_stats()
+    
+    def get_embedding_stats(self) -> Dict[str, Any]:
+        """Get request, dedup and encode counters accumulated by this generator."""
+        with self._stats_lock:
+            return self.embedding_stats.to_dict()
+
+
+def create_embedding_cache() -> LRUCache:
+    """
+    Create an LRU embedding cache bounded by the ModelConfig limits.
+    
+    Returns:
+        Configured LRUCache
+    """
+    max_mb = config.models.embedding_cache_max_mb
+    return LRUCache(
+        max_entries=config.models.embedding_cache_max_entries,
+        max_bytes=max_mb * 1024 * 1024 if max_mb else None
+    )
@@ -0,0 +1,213 @@
+"""
+Persistent embedding store backed by SQLite.
+Keeps sentence embeddings across process restarts, keyed by model and text hash.
+"""
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class EmbeddingStore:
+    """
+    On-disk embedding store keyed by (model_name, sha256(text)).
+    
+    Uses SQLite in WAL mode so several processes can read while one writes.
+    Each thread gets its own connection.
+    """
+    
+    def __init__(self, db_path: str, timeout: float = 30.0):
+        """
+        Initialize embedding store.
+        
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+            timeout: Seconds to wait on a locked database
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        self._local = threading.local()
+        
+        conn = self._get_connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model_name TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (model_name, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        conn.commit()
+        logger.info(f"Embedding store opened at {self.db_path}")
+    
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """
+        Compute the store key for a text.
+        
+        Args:
+            text: Text to hash
+        
+        Returns:
+            Hex SHA-256 digest of the UTF-8 encoded text
+        """
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    
+    def get(self, model_name: str, text: str) -> Optional[np.ndarray]:
+        """
+        Look up a single embedding.
+        
+        Args:
+            model_name: Embedding model name
+            text: Original text
+        
+        Returns:
+            Embedding vector, or None if not stored
+        """
+        return self.get_many(model_name, [text]).get(text)
+    
+    def get_many(self, model_name: str, texts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up embeddings for several texts.
+        
+        Args:
+            model_name: Embedding model name
+            texts: Texts to look up
+        
+        Returns:
+            Dictionary mapping each found text to its embedding
+        """
+        if not texts:
+            return {}
+        
+        hash_to_texts: Dict[str, List[str]] = {}
+        for text in texts:
+            hash_to_texts.setdefault(self.hash_text(text), []).append(text)
+        
+        found: Dict[str, np.ndarray] = {}
+        hashes = list(hash_to_texts.keys())
+        
+        try:
+            conn = self._get_connection()
+            # Stay below SQLite's default host parameter limit
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT text_hash, dim, vector FROM embeddings "
+                    f"WHERE model_name = ? AND text_hash IN ({placeholders})",
+                    [model_name, *chunk]
+                ).fetchall()
+                
+                for text_hash, dim, blob in rows:
+                    vector = np.frombuffer(blob, dtype=np.float32, count=dim)
+                    for text in hash_to_texts[text_hash]:
+                        found[text] = vector
+        
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding store read failed: {e}")
+        
+        return found
+    
+    def put(self, model_name: str, text: str, embedding: np.ndarray):
+        """
+        Store a single embedding.
+        
+        Args:
+            model_name: Embedding model name
+            text: Original text
+            embedding: Embedding vector
+        """
+        self.put_many(model_name, {text: embedding})
+    
+    def put_many(self, model_name: str, embeddings: Dict[str, np.ndarray]):
+        """
+        Store several embeddings in one transaction.
+        
+        Args:
+            model_name: Embedding model name
+            embeddings: Dictionary mapping text to embedding vector
+        """
+        if not embeddings:
+            return
+        
+        rows = []
+        for text, embedding in embeddings.items():
+            vector = np.asarray(embedding, dtype=np.float32).ravel()
+            rows.append((model_name, self.hash_text(text), vector.size, vector.tobytes()))
+        
+        try:
+            conn = self._get_connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings "
+                    "(model_name, text_hash, dim, vector) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+            logger.debug(f"Stored {len(rows)} embeddings for {model_name}")
+        
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding store write failed: {e}")
+    
+    def count(self, model_name: Optional[str] = None) -> int:
+        """
+        Count stored embeddings.
+        
+        Args:
+            model_name: Optional model to restrict the count to
+        
+        Returns:
+            Number of stored embeddings
+        """
+        conn = self._get_connection()
+        if model_name:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM embeddings WHERE model_name = ?",
+                (model_name,)
+            ).fetchone()
+        else:
+            row = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return int(row[0])
+    
+    def clear(self, model_name: Optional[str] = None):
+        """
+        Delete stored embeddings.
+        
+        Args:
+            model_name: Optional model to restrict deletion to
+        """
+        conn = self._get_connection()
+        with conn:
+            if model_name:
+                conn.execute("DELETE FROM embeddings WHERE model_name = ?", (model_name,))
+            else:
+                conn.execute("DELETE FROM embeddings")
+        logger.info("Embedding store cleared")
+    
+    def close(self):
+        """Close this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get (or open) the SQLite connection for the current thread."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
@@ -0,0 +1,200 @@
+"""
+Extraction Cache - content-addressed on-disk cache of extracted document text.
+"""
+import hashlib
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the cached text format changes so old entries are ignored
+CACHE_FORMAT_VERSION = 1
+
+
+class ExtractionCache:
+    """
+    Disk cache of cleaned document text keyed by file content and extractor settings.
+    
+    Each entry is one JSON file named by its key. Reads refresh the file's
+    mtime, and writes evict the least recently used entries once the cache
+    exceeds max_bytes. Writes are atomic renames, so concurrent processes can
+    share the directory.
+    """
+    
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Initialize extraction cache.
+        
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            max_bytes: Maximum total size of cache entries in bytes
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = sum(size for _, _, size in self._scan_entries())
+        
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(file_path: str, settings: Dict[str, Any], chunk_size: int = 1024 * 1024) -> str:
+        """
+        Compute the cache key for a file and the settings used to extract it.
+        
+        Args:
+            file_path: Path to the source document
+            settings: Extractor settings that affect the output text
+            chunk_size: Read size in bytes
+        
+        Returns:
+            Hex SHA-256 digest of the file contents and settings
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        
+        digest.update(json.dumps(
+            {'version': CACHE_FORMAT_VERSION, **settings},
+            sort_keys=True,
+            default=str
+        ).encode('utf-8'))
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Look up cached text and metadata.
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            Tuple of (cleaned_text, metadata), or None on a miss
+        """
+        entry_path = self._entry_path(key)
+        
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(entry_path)  # mark as recently used
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable extraction cache entry {entry_path.name}: {e}")
+            self._remove(entry_path)
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return entry['text'], entry['metadata']
+    
+    def put(self, key: str, text: str, metadata: Dict[str, Any]):
+        """
+        Store cleaned text and metadata, evicting old entries if over budget.
+        
+        Args:
+            key: Cache key from make_key()
+            text: Cleaned document text
+            metadata: Extraction metadata
+        """
+        payload = json.dumps({'text': text, 'metadata': metadata}, ensure_ascii=False, default=str)
+        data = payload.encode('utf-8')
+        
+        if len(data) > self.max_bytes:
+            return
+        
+        entry_path = self._entry_path(key)
+        tmp_path = entry_path.with_name(f".{entry_path.name}.{uuid.uuid4().hex}.tmp")
+        
+        try:
+            previous_size = entry_path.stat().st_size if entry_path.exists() else 0
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            logger.warning(f"Extraction cache write failed: {e}")
+            self._remove(tmp_path)
+            return
+        
+        with self._lock:
+            self._total_bytes += len(data) - previous_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+    
+    def clear(self):
+        """Delete all cache entries."""
+        with self._lock:
+            for entry_path, _, _ in self._scan_entries():
+                self._remove(entry_path)
+            self._total_bytes = 0
+        logger.info(f"Extraction cache cleared: {self.cache_dir}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with size, limit, and hit/miss counters
+        """
+        lookups = self.hits + self.misses
+        return {
+            'bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0
+        }
+    
+    def _evict(self):
+        """Remove least recently used entries until under budget. Caller must hold the lock."""
+        # Rescan so entries written by other processes are counted too
+        entries = sorted(self._scan_entries(), key=lambda entry: entry[1])
+        self._total_bytes = sum(size for _, _, size in entries)
+        
+        evicted = 0
+        for entry_path, _, size in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            if self._remove(entry_path):
+                self._total_bytes -= size
+                evicted += 1
+        
+        if evicted:
+            logger.debug(f"Evicted {evicted} extraction cache entries")
+    
+    def _scan_entries(self):
+        """List (path, mtime, size) for every cache entry on disk."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.json') and entry.is_file():
+                try:
+                    stat = entry.stat()
+                    entries.append((Path(entry.path), stat.st_mtime, stat.st_size))
+                except FileNotFoundError:
+                    continue
+        return entries
+    
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / f"{key}.json"
+    
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        """Delete a file, ignoring one that is already gone."""
+        try:
+            path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Failed to remove extraction cache file {path}: {e}")
+            return False
@@ -0,0 +1,358 @@
+"""
+Incremental Analyzer - re-analyze an edited contract by clause-level diffing.
+"""
+import hashlib
+import time
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Tuple
+
+from models.clause import Clause
+from models.clause_analysis import ClauseAnalysis
+from models.processed_document import ProcessedDocument
+from models.regulatory_requirement import (
+    ClauseComplianceResult,
+    ComplianceReport,
+    RegulatoryRequirement,
+    RequirementMatchPlan
+)
+from services.compliance_checker import ComplianceChecker
+from services.nlp_analyzer import NLPAnalyzer
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def clause_content_hash(text: str) -> str:
+    """
+    Compute the content hash used to recognize unchanged clauses.
+    
+    Args:
+        text: Clause text
+    
+    Returns:
+        Hex SHA-256 digest of the UTF-8 encoded text
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class ClauseDiff:
+    """Outcome of diffing a document's clauses against the previous run."""
+    total_clauses: int = 0
+    reused_clauses: int = 0
+    analyzed_clauses: int = 0
+    removed_clauses: int = 0
+    full_run: bool = False
+
+
+@dataclass
+class _ClauseEntry:
+    """Cached per-clause results, shared by all clauses with the same text."""
+    analysis: ClauseAnalysis
+    matches: Dict[str, List[Tuple[RegulatoryRequirement, float]]] = field(default_factory=dict)
+    results: Dict[str, ClauseComplianceResult] = field(default_factory=dict)
+
+
+class IncrementalAnalyzer:
+    """
+    Re-analyzes a document by recomputing only added or modified clauses.
+    
+    Clauses are identified by a hash of their text. The NLP analysis, ranked
+    requirement matches and per-framework compliance results of each distinct
+    text are kept from the previous run, so an edited contract only pays for
+    its new clause texts. Requirement coverage per framework is kept as
+    counts over the current clauses and updated as clauses come and go, which
+    gives the missing requirements without rescanning the whole match plan.
+    
+    Cached results are dropped when the frameworks, the similarity threshold,
+    the embedding model, the knowledge base requirements or the rule packs
+    change. Clauses whose analysis failed
+    (fallback analyses without embeddings) are not kept, so the next run
+    analyzes them again. One instance tracks one
+    document at a time and is not thread-safe.
+    """
+    
+    def __init__(
+        self,
+        nlp_analyzer: Optional[NLPAnalyzer] = None,
+        compliance_checker: Optional[ComplianceChecker] = None
+    ):
+        """
+        Initialize Incremental Analyzer.
+        
+        Args:
+            nlp_analyzer: NLP analyzer (optional, will create if not provided)
+            compliance_checker: Compliance checker (optional, will create if not provided)
+        """
+        self.nlp_analyzer = nlp_analyzer or NLPAnalyzer()
+        self.compliance_checker = compliance_checker or ComplianceChecker()
+        self.last_diff: Optional[ClauseDiff] = None
+        
+        self._signature: Optional[Tuple] = None
+        self._entries: Dict[str, _ClauseEntry] = {}
+        self._clause_hashes: List[str] = []
+        self._coverage: Dict[str, Counter] = {}
+        self._top_k = 5
+    
+    def analyze(
+        self,
+        document: ProcessedDocument,
+        frameworks: List[str]
+    ) -> Tuple[List[ClauseAnalysis], ComplianceReport]:
+        """
+        Analyze a document and check its compliance, reusing unchanged clauses.
+        
+        Args:
+            document: Processed document (a new version of the previous one, or any document)
+            frameworks: List of frameworks to check (e.g., ['GDPR', 'HIPAA'])
+        
+        Returns:
+            Tuple of (clause analyses, compliance report), equal to a full analysis
+        """
+        start_time = time.time()
+        clauses = document.clauses
+        
+        supported = set(self.compliance_checker.get_supported_frameworks())
+        valid_frameworks = []
+        for framework in frameworks:
+            framework_upper = framework.upper().strip()
+            if framework_upper in supported and framework_upper not in valid_frameworks:
+                valid_frameworks.append(framework_upper)
+        
+        # Empty documents and invalid framework lists get the checker's own reports
+        if not clauses or not valid_frameworks or len(valid_frameworks) != len(frameworks):
+            return self._full_run(document, frameworks)
+        
+        try:
+            signature = self._compute_signature(valid_frameworks)
+            if signature != self._signature:
+                if self._signature is not None:
+                    logger.info("Frameworks or knowledge base changed, discarding cached clause results")
+                self.reset()
+                self._signature = signature
+            
+            hashes = [clause_content_hash(clause.text) for clause in clauses]
+            diff = self._update_entries(document.document_id, clauses, hashes, valid_frameworks)
+            self._update_coverage(hashes, valid_frameworks)
+            self._clause_hashes = hashes
+            
+            # Drop texts that no longer occur in the document
+            current = set(hashes)
+            for text_hash in [h for h in self._entries if h not in current]:
+                del self._entries[text_hash]
+            
+            analyses, report = self._assemble(document.document_id, clauses, hashes, valid_frameworks)
+            self._discard_fallbacks(valid_frameworks)
+        
+        except Exception as e:
+            logger.error(f"Incremental analysis failed, running full analysis: {e}", exc_info=True)
+            return self._full_run(document, frameworks)
+        
+        self.last_diff = diff
+        logger.info(
+            f"Incremental analysis of {document.document_id} completed in "
+            f"{time.time() - start_time:.2f}s: {diff.analyzed_clauses} analyzed, "
+            f"{diff.reused_clauses} reused, {diff.removed_clauses} removed"
+        )
+        
+        return analyses, report
+    
+    def reset(self):
+        """Forget all cached clause results."""
+        self._signature = None
+        self._entries.clear()
+        self._clause_hashes = []
+        self._coverage = {}
+    
+    # Private helper methods
+    
+    def _full_run(
+        self,
+        document: ProcessedDocument,
+        frameworks: List[str]
+    ) -> Tuple[List[ClauseAnalysis], ComplianceReport]:
+        """Analyze the whole document without reuse and forget cached results."""
+        self.reset()
+        analyses = self.nlp_analyzer.analyze_clauses(document.clauses)
+        report = self.compliance_checker.check_compliance(
+            analyses,
+            frameworks,
+            document.document_id
+        )
+        self.last_diff = ClauseDiff(
+            total_clauses=len(document.clauses),
+            analyzed_clauses=len(document.clauses),
+            full_run=True
+        )
+        return analyses, report
+    
+    def _compute_signature(self, frameworks: List[str]) -> Tuple:
+        """Identify everything cached clause results depend on besides the clause text."""
+        # Same inputs as ComplianceChecker's report cache key, so both caches invalidate together
+        knowledge_base = self.compliance_checker.knowledge_base
+        embedding_generator = knowledge_base.embedding_generator
+        return (
+            tuple(frameworks),
+            knowledge_base.similarity_threshold,
+            getattr(
+                embedding_generator,
+                'store_model_name',
+                getattr(embedding_generator, 'model_name', type(embedding_generator).__name__)
+            ),
+            knowledge_base.get_requirements_version(),
+            self.compliance_checker.assessor.rule_engine.get_rule_packs_version()
+        )
+    
+    def _update_entries(
+        self,
+        document_id: str,
+        clauses: List[Clause],
+        hashes: List[str],
+        frameworks: List[str]
+    ) -> ClauseDiff:
+        """Analyze, match and assess the clause texts not seen in the previous run."""
+        new_positions: Dict[str, int] = {}
+        for position, text_hash in enumerate(hashes):
+            if text_hash not in self._entries and text_hash not in new_positions:
+                new_positions[text_hash] = position
+        
+        previous = Counter(self._clause_hashes)
+        current = Counter(hashes)
+        analyzed = sum(1 for text_hash in hashes if text_hash in new_positions)
+        diff = ClauseDiff(
+            total_clauses=len(clauses),
+            reused_clauses=len(clauses) - analyzed,
+            analyzed_clauses=analyzed,
+            removed_clauses=sum((previous - current).values())
+        )
+        
+        if not new_positions:
+            return diff
+        
+        new_clauses = [clauses[position] for position in new_positions.values()]
+        analyses = self.nlp_analyzer.analyze_clauses(new_clauses)
+        if len(analyses) != len(new_clauses):
+            raise RuntimeError(f"Expected {len(new_clauses)} clause analyses, got {len(analyses)}")
+        
+        match_plan = self.compliance_checker.knowledge_base.build_match_plan(
+            analyses,
+            frameworks,
+            document_id=document_id,
+            top_k=self._top_k
+        )
+        framework_results = self.compliance_checker.assessor.assess_frameworks(
+            analyses,
+            frameworks,
+            match_plan=match_plan
+        )
+        
+        for i, text_hash in enumerate(new_positions):
+            self._entries[text_hash] = _ClauseEntry(
+                analysis=analyses[i],
+                matches={
+                    framework: match_plan.get_framework_matches(framework)[i]
+                    for framework in frameworks
+                },
+                results={
+                    framework: framework_results[framework][i]
+                    for framework in frameworks
+                }
+            )
+        
+        return diff
+    
+    def _update_coverage(self, hashes: List[str], frameworks: List[str]):
+        """Adjust per-framework requirement coverage counts for added and removed clauses."""
+        previous = Counter(self._clause_hashes)
+        current = Counter(hashes)
+        
+        for framework in frameworks:
+            coverage = self._coverage.setdefault(framework, Counter())
+            
+            for text_hash, count in (current - previous).items():
+                for requirement_id in self._covered_ids(text_hash, framework):
+                    coverage[requirement_id] += count
+            
+            for text_hash, count in (previous - current).items():
+                for requirement_id in self._covered_ids(text_hash, framework):
+                    coverage[requirement_id] -= count
+                    if coverage[requirement_id] <= 0:
+                        del coverage[requirement_id]
+    
+    def _discard_fallbacks(self, frameworks: List[str]):
+        """Forget clause texts whose analysis fell back, as if they were never seen."""
+        failed = {
+            text_hash for text_hash, entry in self._entries.items()
+            if entry.analysis.embeddings is None
+        }
+        if not failed:
+            return
+        
+        remaining = [text_hash for text_hash in self._clause_hashes if text_hash not in failed]
+        self._update_coverage(remaining, frameworks)
+        self._clause_hashes = remaining
+        for text_hash in failed:
+            del self._entries[text_hash]
+        
+        logger.debug(f"Not caching {len(failed)} clause texts with fallback analyses")
+    
+    def _covered_ids(self, text_hash: str, framework: str) -> set:
+        """Get the requirement IDs matched by one clause text."""
+        return {req.requirement_id for req, _ in self._entries[text_hash].matches[framework]}
+    
+    def _assemble(
+        self,
+        document_id: str,
+        clauses: List[Clause],
+        hashes: List[str],
+        frameworks: List[str]
+    ) -> Tuple[List[ClauseAnalysis], ComplianceReport]:
+        """Build the document's analyses and report from the cached clause results."""
+        checker = self.compliance_checker
+        entries = [self._entries[text_hash] for text_hash in hashes]
+        
+        analyses = [
+            self._with_clause_id(entry.analysis, clause.clause_id)
+            for clause, entry in zip(clauses, entries)
+        ]
+        
+        all_results = []
+        for framework in frameworks:
+            all_results.extend(
+                self._with_clause_id(entry.results[framework], clause.clause_id)
+                for clause, entry in zip(clauses, entries)
+            )
+        
+        all_missing_requirements = []
+        for framework in frameworks:
+            coverage = self._coverage[framework]
+            all_missing_requirements.extend(
+                req for req in checker.knowledge_base.get_requirements(framework)
+                if req.mandatory and req.requirement_id not in coverage
+            )
+        
+        report = checker.scorer.generate_compliance_report(
+            document_id=document_id,
+            frameworks_checked=frameworks,
+            clause_results=all_results,
+            missing_requirements=all_missing_requirements
+        )
+        report.match_plan = RequirementMatchPlan(
+            document_id=document_id,
+            clause_ids=[clause.clause_id for clause in clauses],
+            top_k=self._top_k,
+            matches={
+                framework: [entry.matches[framework] for entry in entries]
+                for framework in frameworks
+            }
+        )
+        
+        return analyses, report
+    
+    @staticmethod
+    def _with_clause_id(item, clause_id: str):
+        """Return a clause analysis or result carrying the given clause ID."""
+        if item.clause_id == clause_id:
+            return item
+        return replace(item, clause_id=clause_id)
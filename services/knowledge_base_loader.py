@@ -4,16 +4,34 @@ Loads and indexes legal contract data for regulatory analysis.
 """
 import json
 import csv
+import gc
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional, Set
+import os
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property
+from typing import List, Dict, Any, Optional, Set, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 import re
 
+import numpy as np
+
+from config.settings import config
+from services.clause_index import DEFAULT_N_PROBE, IVFFlatIndex
+from services.knowledge_base_snapshot import ColumnarSnapshot, source_signature
+
 
 logger = logging.getLogger(__name__)
 
 
+# Search text is tokenized into runs of lowercase letters and digits
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
 @dataclass
 class ContractKnowledge:
     """Represents knowledge from a contract in the dataset."""
@@ -24,32 +42,326 @@ class ContractKnowledge:
     keywords: List[str]
     split: str  # train/test
     
+    @cached_property
+    def search_text(self) -> str:
+        """Lowercased clause type and text that keyword searches match against."""
+        return f"{self.clause_type} {self.clause_text}".lower()
+    
     def matches_keywords(self, keywords: List[str]) -> bool:
         """Check if contract matches any of the keywords."""
-        text_lower = f"{self.clause_type} {self.clause_text}".lower()
+        text_lower = self.search_text
         return any(kw.lower() in text_lower for kw in keywords)
 
 
+class InvertedIndex:
+    """
+    Posting lists over a fixed list of contracts, keyed by row position.
+    
+    Keyword lookups keep the substring semantics of
+    ContractKnowledge.matches_keywords(): a keyword's tokens are expanded
+    against the token vocabulary (a keyword token may sit inside a longer
+    token), and candidates are verified against the text only when the
+    expansion alone is not exact. Results per keyword are memoized.
+    """
+    
+    def __init__(self, contracts: List[ContractKnowledge]):
+        """
+        Build the index.
+        
+        Args:
+            contracts: Contracts to index; row i is contracts[i]
+        """
+        self.contracts = contracts
+        
+        token_rows: Dict[str, List[int]] = defaultdict(list)
+        type_rows: Dict[str, List[int]] = defaultdict(list)
+        for row, contract in enumerate(contracts):
+            for token in set(_TOKEN_RE.findall(contract.search_text)):
+                token_rows[token].append(row)
+            type_rows[contract.clause_type].append(row)
+        
+        self.postings: Dict[str, np.ndarray] = {
+            token: np.array(rows, dtype=np.int64) for token, rows in token_rows.items()
+        }
+        self.clause_type_rows: Dict[str, np.ndarray] = {
+            clause_type: np.array(rows, dtype=np.int64) for clause_type, rows in type_rows.items()
+        }
+        self.row_by_id: Dict[str, int] = {contract.contract_id: row for row, contract in enumerate(contracts)}
+        
+        # Sorted tokens (and reversed tokens) answer prefix (suffix) lookups by bisection;
+        # joined into one string, a substring search scans them all in C
+        self._tokens = sorted(self.postings)
+        self._reversed_tokens = sorted(token[::-1] for token in self._tokens)
+        self._vocabulary = '\n'.join(self._tokens)
+        self._token_starts = np.cumsum([0] + [len(token) + 1 for token in self._tokens[:-1]])
+        self._keyword_rows: Dict[str, np.ndarray] = {}
+    
+    def keyword_rows(self, keyword: str) -> np.ndarray:
+        """
+        Find the rows whose search text contains a keyword.
+        
+        Args:
+            keyword: Keyword or phrase (case-insensitive substring match)
+        
+        Returns:
+            Sorted array of row positions
+        """
+        keyword = keyword.lower()
+        rows = self._keyword_rows.get(keyword)
+        if rows is not None:
+            return rows
+        
+        parts = _TOKEN_RE.findall(keyword)
+        if not parts:
+            candidates = np.arange(len(self.contracts))
+        elif len(parts) == 1:
+            candidates = self._token_rows(self._matching_tokens(parts[0], 'contains'))
+        else:
+            # Inner tokens are whole words; the outer ones may be cut off mid-token
+            candidates = self._token_rows(self._matching_tokens(parts[0], 'suffix'))
+            for part in parts[1:-1]:
+                candidates = np.intersect1d(candidates, self.postings.get(part, candidates[:0]), assume_unique=True)
+            candidates = np.intersect1d(
+                candidates,
+                self._token_rows(self._matching_tokens(parts[-1], 'prefix')),
+                assume_unique=True
+            )
+        
+        if parts != [keyword]:
+            candidates = np.array(
+                [row for row in candidates if keyword in self.contracts[row].search_text],
+                dtype=np.int64
+            )
+        
+        self._keyword_rows[keyword] = candidates
+        return candidates
+    
+    def search(
+        self,
+        keywords: List[str],
+        clause_types: Optional[List[str]] = None,
+        limit: int = 10,
+        match_all: bool = False
+    ) -> List[int]:
+        """
+        Rank rows by how many keywords they contain.
+        
+        Args:
+            keywords: Keywords to search for
+            clause_types: Only rows with one of these clause types (exact match)
+            limit: Maximum rows to return
+            match_all: Require every keyword instead of any
+        
+        Returns:
+            Row positions, most keywords matched first, then in load order
+        """
+        keywords = list(dict.fromkeys(kw.lower() for kw in keywords))
+        if not keywords or limit <= 0:
+            return []
+        
+        counts = np.bincount(
+            np.concatenate([self.keyword_rows(kw) for kw in keywords]),
+            minlength=len(self.contracts)
+        )
+        selected = counts >= (len(keywords) if match_all else 1)
+        
+        if clause_types:
+            allowed = np.zeros(len(self.contracts), dtype=bool)
+            for clause_type in clause_types:
+                allowed[self.clause_type_rows.get(clause_type, [])] = True
+            selected &= allowed
+        
+        rows = np.flatnonzero(selected)
+        # Fewer keyword hits sort later; ties keep load order
+        rank = (len(keywords) - counts[rows]) * len(self.contracts) + rows
+        if len(rows) > limit:
+            keep = np.argpartition(rank, limit - 1)[:limit]
+            rows, rank = rows[keep], rank[keep]
+        return rows[np.argsort(rank)].tolist()
+    
+    def _matching_tokens(self, part: str, position: str) -> List[str]:
+        """List vocabulary tokens that contain, start with or end with a keyword token."""
+        if position == 'prefix':
+            return self._prefixed(self._tokens, part)
+        if position == 'suffix':
+            return [token[::-1] for token in self._prefixed(self._reversed_tokens, part[::-1])]
+        
+        offsets = [match.start() for match in re.finditer(re.escape(part), self._vocabulary)]
+        if not offsets:
+            return []
+        positions = np.unique(np.searchsorted(self._token_starts, offsets, side='right') - 1)
+        return [self._tokens[i] for i in positions]
+    
+    @staticmethod
+    def _prefixed(tokens: List[str], prefix: str) -> List[str]:
+        """Slice the tokens starting with prefix out of a sorted token list."""
+        # '{' sorts after every letter and digit
+        return tokens[bisect_left(tokens, prefix):bisect_left(tokens, prefix + '{')]
+    
+    def _token_rows(self, tokens: List[str]) -> np.ndarray:
+        """Union the posting lists of several tokens."""
+        if not tokens:
+            return np.empty(0, dtype=np.int64)
+        if len(tokens) == 1:
+            return self.postings[tokens[0]]
+        return np.unique(np.concatenate([self.postings[token] for token in tokens]))
+
+
+# Common clause type patterns in the CUAD dataset
+_CLAUSE_TYPE_PATTERNS = [
+    re.compile(r'related to "([^"]+)"', re.IGNORECASE),
+    re.compile(r'parts \(if any\) of this contract related to "([^"]+)"', re.IGNORECASE),
+    re.compile(r'contract related to "([^"]+)"', re.IGNORECASE)
+]
+
+_WORD_RE = re.compile(r'\b[a-z]+\b')
+
+# Common stop words left out of extracted keywords
+_STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'with', 'from', 'this',
+    'that', 'will', 'have', 'has', 'been', 'their', 'they', 'what',
+    'which', 'when', 'where', 'who', 'would', 'should', 'could'
+})
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Pause the cyclic garbage collector while building many small objects.
+    
+    Loaded records hold no reference cycles, but allocating them triggers
+    repeated collector passes over every live object.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _parse_jsonl_entry(entry: Dict[str, Any]) -> Tuple[Optional[str], str, List[str]]:
+    """
+    Extract the knowledge fields from one CUAD JSONL entry.
+    
+    Returns:
+        Tuple of (clause type or None, clause text, keywords)
+    """
+    instruction = entry.get('instruction', '')
+    input_text = entry.get('input', '')
+    
+    return (
+        KnowledgeBaseLoader._extract_clause_type(instruction),
+        input_text[:500],  # First 500 chars
+        KnowledgeBaseLoader._extract_keywords(instruction + input_text)
+    )
+
+
+def _split_on_lines(path: Path, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into about equal byte ranges that start at line starts.
+    
+    Returns:
+        List of non-empty (start, end) byte ranges covering the file
+    """
+    size = path.stat().st_size
+    bounds = [0]
+    
+    with open(path, 'rb') as f:
+        for part in range(1, parts):
+            target = max(size * part // parts, bounds[-1] + 1)
+            if target >= size:
+                break
+            # The line start at or after target
+            f.seek(target - 1)
+            f.readline()
+            if f.tell() >= size:
+                break
+            bounds.append(f.tell())
+    
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _parse_jsonl_range(
+    file_path: str,
+    start: int,
+    end: int
+) -> Tuple[int, List[Tuple[int, Optional[str], str, List[str]]], List[Tuple[int, str]]]:
+    """
+    Parse the JSONL lines in bytes [start, end) of a file.
+    
+    Module-level so it can run in a worker process. start and end must be
+    line starts (or the end of the file).
+    
+    Returns:
+        Tuple of (lines in range, entries as (line index in range, clause type,
+        clause text, keywords), parse errors as (line index in range, message))
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        lines = f.read(end - start).split(b'\n')
+    if lines[-1] == b'':
+        lines.pop()  # after the final newline
+    
+    entries = []
+    errors = []
+    for line_index, line in enumerate(lines):
+        try:
+            entries.append((line_index, *_parse_jsonl_entry(json.loads(line.decode('utf-8').strip()))))
+        except json.JSONDecodeError as e:
+            errors.append((line_index, str(e)))
+    
+    return len(lines), entries, errors
+
+
 class KnowledgeBaseLoader:
     """Loads and manages knowledge base from JSONL and CSV files."""
     
-    def __init__(self, base_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        embedding_generator: Optional[Any] = None,
+        index_path: Optional[Path] = None,
+        snapshot_dir: Optional[Path] = None
+    ):
         """
         Initialize knowledge base loader.
         
         Args:
             base_dir: Base directory containing knowledge base files
+            embedding_generator: EmbeddingGenerator for similarity search
+                (created on first use if None)
+            index_path: File for the persisted similarity index
+                (default: temp/kb_similarity_index.npz under base_dir)
+            snapshot_dir: Directory for parsed JSONL snapshots
+                (default from config, falling back to temp/kb_snapshots under base_dir)
         """
         self.base_dir = base_dir or Path(__file__).parent.parent
         self.contracts: List[ContractKnowledge] = []
         self.manifest: Dict[str, Dict[str, Any]] = {}
         self.clause_types: Set[str] = set()
-        self.frameworks: Dict[str, List[str]] = {
-            'GDPR': [],
-            'HIPAA': [],
-            'CCPA': [],
-            'SOX': []
+        self.frameworks: Dict[str, Set[str]] = {
+            'GDPR': set(),
+            'HIPAA': set(),
+            'CCPA': set(),
+            'SOX': set()
         }
+        self._framework_rows: Dict[str, np.ndarray] = {}
+        self._inverted_index: Optional[InvertedIndex] = None
+        
+        self.embedding_generator = embedding_generator
+        self.index_path = Path(index_path) if index_path else self.base_dir / "temp" / "kb_similarity_index.npz"
+        self.similarity_index: Optional[IVFFlatIndex] = None
+        self._filter_masks: Dict[Tuple[Optional[str], Optional[str]], np.ndarray] = {}
+        
+        self.load_workers = config.processing.kb_load_workers or os.cpu_count() or 1
+        self.parallel_min_bytes = config.processing.kb_parallel_min_mb * 1024 * 1024
+        self.snapshot_enabled = config.processing.kb_snapshot_enabled
+        self.snapshot_dir = Path(
+            snapshot_dir or config.processing.kb_snapshot_dir or self.base_dir / "temp" / "kb_snapshots"
+        )
         
         logger.info(f"Initializing KnowledgeBaseLoader with base_dir: {self.base_dir}")
     
@@ -96,6 +408,10 @@ class KnowledgeBaseLoader:
         """
         Load CUAD JSONL file with contract Q&A data.
         
+        Parsed entries come from a snapshot when one matches the file (see
+        _open_snapshot). Otherwise large files are split by byte offset and
+        parsed across worker processes, and a new snapshot is written.
+        
         Args:
             jsonl_path: Path to JSONL file (default: cuad_sft_train.jsonl)
             limit: Maximum number of entries to load (for large files)
@@ -112,86 +428,245 @@ class KnowledgeBaseLoader:
         
         logger.info(f"Loading JSONL from: {jsonl_path}")
         
-        count = 0
-        try:
-            with open(jsonl_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    if limit and count >= limit:
-                        break
-                    
-                    try:
-                        entry = json.loads(line.strip())
-                        
-                        # Extract information
-                        instruction = entry.get('instruction', '')
-                        input_text = entry.get('input', '')
-                        output_text = entry.get('output', '')
-                        
-                        # Extract clause type from instruction
-                        clause_type = self._extract_clause_type(instruction)
-                        if clause_type:
-                            self.clause_types.add(clause_type)
-                        
-                        # Create contract knowledge entry
-                        contract_id = f"jsonl_{line_num}"
-                        knowledge = ContractKnowledge(
-                            contract_id=contract_id,
-                            filename=f"line_{line_num}",
-                            clause_type=clause_type or "Unknown",
-                            clause_text=input_text[:500],  # First 500 chars
-                            keywords=self._extract_keywords(instruction + input_text),
-                            split="train"
-                        )
-                        
-                        self.contracts.append(knowledge)
-                        count += 1
-                        
-                        if count % 1000 == 0:
-                            logger.info(f"Loaded {count} entries from JSONL...")
-                    
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse JSONL line {line_num}: {e}")
-                        continue
+        snapshot = self._open_snapshot(jsonl_path, limit) if self.snapshot_enabled else None
+        if snapshot is not None:
+            try:
+                count = self._load_snapshot(snapshot, limit)
+            finally:
+                snapshot.close()
+            logger.info(f"Loaded {count} entries from snapshot {snapshot.path}")
+        else:
+            count = self._parse_jsonl(jsonl_path, limit)
         
-        except Exception as e:
-            logger.error(f"Error loading JSONL file: {e}")
+        if count:
+            self._invalidate_search_structures()
         
         logger.info(f"Loaded {count} entries from JSONL")
         logger.info(f"Found {len(self.clause_types)} unique clause types")
         return count
     
-    def _extract_clause_type(self, text: str) -> Optional[str]:
+    def _parse_jsonl(self, jsonl_path: Path, limit: Optional[int]) -> int:
+        """
+        Parse a JSONL file, in parallel when it is large, and snapshot the result.
+        
+        Args:
+            jsonl_path: Path to JSONL file
+            limit: Maximum number of entries to load
+        
+        Returns:
+            Number of entries loaded
+        """
+        entries: List[Tuple[int, Optional[str], str, List[str]]] = []
+        size = jsonl_path.stat().st_size
+        complete = False
+        
+        if limit is None and self.load_workers > 1 and size >= self.parallel_min_bytes:
+            try:
+                entries = self._parse_jsonl_parallel(jsonl_path)
+                complete = True
+            except Exception as e:
+                logger.warning(f"Parallel JSONL parse failed, parsing sequentially: {e}")
+                entries = []
+        
+        if not complete:
+            try:
+                with open(jsonl_path, 'r', encoding='utf-8') as f:
+                    for line_num, line in enumerate(f, 1):
+                        if limit and len(entries) >= limit:
+                            break
+                        
+                        try:
+                            entries.append((line_num, *_parse_jsonl_entry(json.loads(line.strip()))))
+                            
+                            if len(entries) % 1000 == 0:
+                                logger.info(f"Loaded {len(entries)} entries from JSONL...")
+                        
+                        except json.JSONDecodeError as e:
+                            logger.warning(f"Failed to parse JSONL line {line_num}: {e}")
+                            continue
+                complete = True
+            
+            except Exception as e:
+                logger.error(f"Error loading JSONL file: {e}")
+        
+        count = self._add_entries(
+            [entry[0] for entry in entries],
+            [entry[1] for entry in entries],
+            [entry[2] for entry in entries],
+            [entry[3] for entry in entries]
+        )
+        
+        if complete and self.snapshot_enabled:
+            self._write_snapshot(jsonl_path, entries, limit)
+        return count
+    
+    def _parse_jsonl_parallel(self, jsonl_path: Path) -> List[Tuple[int, Optional[str], str, List[str]]]:
+        """
+        Parse a JSONL file in byte ranges across worker processes.
+        
+        Args:
+            jsonl_path: Path to JSONL file
+        
+        Returns:
+            List of (line number, clause type, clause text, keywords) in file order
+        """
+        ranges = _split_on_lines(jsonl_path, self.load_workers)
+        entries = []
+        first_line = 1
+        
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            shards = executor.map(
+                _parse_jsonl_range,
+                [str(jsonl_path)] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges]
+            )
+            for num_lines, shard_entries, errors in shards:
+                for line_index, message in errors:
+                    logger.warning(f"Failed to parse JSONL line {first_line + line_index}: {message}")
+                entries.extend(
+                    (first_line + line_index, clause_type, clause_text, keywords)
+                    for line_index, clause_type, clause_text, keywords in shard_entries
+                )
+                first_line += num_lines
+        
+        logger.info(f"Parsed {len(entries)} JSONL entries in {len(ranges)} parallel shards")
+        return entries
+    
+    def _add_entries(
+        self,
+        line_nums: List[int],
+        clause_types: List[Optional[str]],
+        clause_texts: List[str],
+        keywords: List[List[str]]
+    ) -> int:
+        """Append parsed JSONL entries as ContractKnowledge records."""
+        self.clause_types.update(clause_type for clause_type in set(clause_types) if clause_type)
+        
+        with _gc_paused():
+            self.contracts.extend(
+                ContractKnowledge(
+                    contract_id=f"jsonl_{line_num}",
+                    filename=f"line_{line_num}",
+                    clause_type=clause_type or "Unknown",
+                    clause_text=clause_text,
+                    keywords=entry_keywords,
+                    split="train"
+                )
+                for line_num, clause_type, clause_text, entry_keywords in zip(line_nums, clause_types, clause_texts, keywords)
+            )
+        return len(line_nums)
+    
+    def _snapshot_path(self, jsonl_path: Path) -> Path:
+        """Get the snapshot file for a JSONL file."""
+        path_hash = hashlib.sha256(str(jsonl_path.resolve()).encode('utf-8')).hexdigest()[:12]
+        return self.snapshot_dir / f"{jsonl_path.stem}-{path_hash}.kbsnap"
+    
+    def _open_snapshot(self, jsonl_path: Path, limit: Optional[int]) -> Optional[ColumnarSnapshot]:
+        """
+        Open the snapshot of a JSONL file if it is still valid.
+        
+        A snapshot is valid while the file's size and mtime are unchanged. If
+        only the mtime moved (e.g. the file was copied or checked out again),
+        the file is hashed and the snapshot is kept if the contents match.
+        
+        Args:
+            jsonl_path: Path to JSONL file
+            limit: Entry limit of the current load
+        
+        Returns:
+            Open ColumnarSnapshot, or None if missing, stale or too short for limit
+        """
+        snapshot = ColumnarSnapshot.open(self._snapshot_path(jsonl_path))
+        if snapshot is None:
+            return None
+        
+        source = snapshot.metadata.get('source', {})
+        snapshot_limit = snapshot.metadata.get('limit')
+        current = source_signature(jsonl_path, with_hash=False)
+        
+        valid = snapshot_limit is None or (limit is not None and limit <= snapshot_limit)
+        if valid and current['size'] != source.get('size'):
+            valid = False
+        elif valid and current['mtime_ns'] != source.get('mtime_ns'):
+            valid = source_signature(jsonl_path)['sha256'] == source.get('sha256')
+        
+        if not valid:
+            logger.info(f"Ignoring stale knowledge base snapshot: {snapshot.path}")
+            snapshot.close()
+            return None
+        return snapshot
+    
+    def _load_snapshot(self, snapshot: ColumnarSnapshot, limit: Optional[int]) -> int:
+        """Append the entries stored in a snapshot (the first limit of them, if set)."""
+        with _gc_paused():
+            line_nums = snapshot.array('line_num').tolist()
+            count = len(line_nums) if limit is None else min(limit, len(line_nums))
+            
+            type_table = snapshot.strings('clause_type_table')
+            type_codes = snapshot.array('clause_type_code')[:count].tolist()
+            
+            return self._add_entries(
+                line_nums[:count],
+                [type_table[code] if code >= 0 else None for code in type_codes],
+                snapshot.strings('clause_text', count),
+                [keywords.split() for keywords in snapshot.strings('keywords', count)]
+            )
+    
+    def _write_snapshot(
+        self,
+        jsonl_path: Path,
+        entries: List[Tuple[int, Optional[str], str, List[str]]],
+        limit: Optional[int]
+    ):
+        """Write the parsed entries of a JSONL file to its snapshot."""
+        type_codes: Dict[str, int] = {}
+        for _, clause_type, _, _ in entries:
+            if clause_type is not None:
+                type_codes.setdefault(clause_type, len(type_codes))
+        
+        try:
+            ColumnarSnapshot.write(
+                self._snapshot_path(jsonl_path),
+                arrays={
+                    'line_num': np.array([entry[0] for entry in entries], dtype=np.int64),
+                    'clause_type_code': np.array(
+                        [type_codes[entry[1]] if entry[1] is not None else -1 for entry in entries],
+                        dtype=np.int32
+                    )
+                },
+                strings={
+                    'clause_type_table': list(type_codes),
+                    'clause_text': [entry[2] for entry in entries],
+                    # Keywords are single lowercase words, so they can be space-joined
+                    'keywords': [' '.join(entry[3]) for entry in entries]
+                },
+                metadata={'source': source_signature(jsonl_path), 'limit': limit}
+            )
+        except OSError as e:
+            logger.warning(f"Could not save knowledge base snapshot: {e}")
+    
+    @staticmethod
+    def _extract_clause_type(text: str) -> Optional[str]:
         """Extract clause type from instruction text."""
         # Common patterns in CUAD dataset
-        patterns = [
-            r'related to "([^"]+)"',
-            r'parts \(if any\) of this contract related to "([^"]+)"',
-            r'contract related to "([^"]+)"'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _CLAUSE_TYPE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         
         return None
     
-    def _extract_keywords(self, text: str, min_length: int = 4, max_keywords: int = 10) -> List[str]:
+    @staticmethod
+    def _extract_keywords(text: str, min_length: int = 4, max_keywords: int = 10) -> List[str]:
         """Extract important keywords from text."""
-        # Remove common stop words
-        stop_words = {
-            'the', 'and', 'for', 'are', 'but', 'not', 'with', 'from', 'this',
-            'that', 'will', 'have', 'has', 'been', 'their', 'they', 'what',
-            'which', 'when', 'where', 'who', 'would', 'should', 'could'
-        }
-        
         # Extract words
-        words = re.findall(r'\b[a-z]+\b', text.lower())
+        words = _WORD_RE.findall(text.lower())
         
         # Filter and count
         word_freq = {}
         for word in words:
-            if len(word) >= min_length and word not in stop_words:
+            if len(word) >= min_length and word not in _STOP_WORDS:
                 word_freq[word] = word_freq.get(word, 0) + 1
         
         # Sort by frequency and return top keywords
@@ -207,10 +682,12 @@ class KnowledgeBaseLoader:
             'SOX': ['financial', 'audit', 'sox', 'internal controls', 'financial reporting']
         }
         
-        for contract in self.contracts:
-            for framework, keywords in framework_keywords.items():
-                if contract.matches_keywords(keywords):
-                    self.frameworks[framework].append(contract.contract_id)
+        index = self.get_inverted_index()
+        for framework, keywords in framework_keywords.items():
+            rows = np.unique(np.concatenate([index.keyword_rows(kw) for kw in keywords]))
+            self._framework_rows[framework] = rows
+            self.frameworks[framework] = {self.contracts[row].contract_id for row in rows}
+        self._filter_masks.clear()
         
         logger.info("Categorized contracts by framework:")
         for framework, contracts in self.frameworks.items():
@@ -220,36 +697,50 @@ class KnowledgeBaseLoader:
         self,
         keywords: List[str],
         clause_types: Optional[List[str]] = None,
-        limit: int = 10
+        limit: int = 10,
+        match_all: bool = False
     ) -> List[ContractKnowledge]:
         """
         Search contracts by keywords and clause types.
         
         Args:
-            keywords: Keywords to search for
+            keywords: Keywords to search for (case-insensitive substrings)
             clause_types: Filter by clause types
             limit: Maximum results to return
+            match_all: Require every keyword instead of any
         
         Returns:
-            List of matching contracts
+            List of matching contracts, those matching the most keywords first
         """
-        results = []
+        rows = self.get_inverted_index().search(keywords, clause_types, limit, match_all)
+        results = [self.contracts[row] for row in rows]
         
-        for contract in self.contracts:
-            # Check clause type filter
-            if clause_types and contract.clause_type not in clause_types:
-                continue
-            
-            # Check keywords
-            if contract.matches_keywords(keywords):
-                results.append(contract)
-                
-                if len(results) >= limit:
-                    break
-        
-        logger.info(f"Found {len(results)} contracts matching search")
+        logger.debug(f"Found {len(results)} contracts matching search")
         return results
     
+    def get_contract(self, contract_id: str) -> Optional[ContractKnowledge]:
+        """
+        Look up a loaded contract by ID.
+        
+        Args:
+            contract_id: Contract ID (e.g. jsonl_12)
+        
+        Returns:
+            ContractKnowledge, or None if not loaded
+        """
+        row = self.get_inverted_index().row_by_id.get(contract_id)
+        return self.contracts[row] if row is not None else None
+    
+    def get_inverted_index(self) -> InvertedIndex:
+        """Get the keyword index over loaded contracts, building it on first use."""
+        if self._inverted_index is None:
+            self._inverted_index = InvertedIndex(self.contracts)
+            logger.info(
+                f"Built inverted index over {len(self.contracts)} contracts "
+                f"({len(self._inverted_index.postings)} tokens)"
+            )
+        return self._inverted_index
+    
     def get_clause_types(self) -> List[str]:
         """Get list of all known clause types."""
         return sorted(list(self.clause_types))
@@ -265,14 +756,147 @@ class KnowledgeBaseLoader:
         Returns:
             List of relevant contracts
         """
-        contract_ids = self.frameworks.get(framework, [])
+        rows = self._framework_rows.get(framework, [])
         if limit:
-            contract_ids = contract_ids[:limit]
+            rows = rows[:limit]
         
-        contracts = [c for c in self.contracts if c.contract_id in contract_ids]
+        contracts = [self.contracts[row] for row in rows]
         logger.info(f"Retrieved {len(contracts)} contracts for {framework}")
         return contracts
     
+    def build_similarity_index(self, rebuild: bool = False) -> Optional[IVFFlatIndex]:
+        """
+        Build (or load from disk) the embedding index over loaded clauses.
+        
+        The index file is reused while the loaded clauses and embedding model
+        are unchanged; otherwise every clause is embedded and the index is
+        rebuilt and saved.
+        
+        Args:
+            rebuild: Ignore any saved or in-memory index
+        
+        Returns:
+            IVFFlatIndex, or None if nothing is loaded or no embedding model is available
+        """
+        if self.similarity_index is not None and not rebuild:
+            return self.similarity_index
+        
+        if not self.contracts:
+            logger.warning("No contracts loaded; similarity index not built")
+            return None
+        
+        generator = self._get_embedding_generator()
+        if generator.model is None:
+            logger.warning("Embedding model unavailable; similarity index not built")
+            return None
+        
+        fingerprint = self._index_fingerprint(generator.store_model_name)
+        index = None if rebuild else IVFFlatIndex.load(self.index_path, fingerprint)
+        
+        if index is None:
+            logger.info(f"Embedding {len(self.contracts)} clauses for similarity index")
+            embeddings = generator.generate_embeddings_batch(
+                [contract.clause_text for contract in self.contracts],
+                use_cache=False
+            )
+            index = IVFFlatIndex.build(np.vstack(embeddings), fingerprint=fingerprint)
+            try:
+                index.save(self.index_path)
+            except OSError as e:
+                logger.warning(f"Could not save similarity index: {e}")
+        
+        self.similarity_index = index
+        return index
+    
+    def search_similar(
+        self,
+        clause_text: str,
+        k: int = 5,
+        clause_type: Optional[str] = None,
+        framework: Optional[str] = None,
+        n_probe: int = DEFAULT_N_PROBE
+    ) -> List[Tuple[ContractKnowledge, float]]:
+        """
+        Find precedent clauses semantically similar to a clause.
+        
+        Args:
+            clause_text: Clause to find precedents for
+            k: Maximum results to return
+            clause_type: Only return clauses of this type (case-insensitive)
+            framework: Only return clauses relevant to this framework
+                (see categorize_by_framework)
+            n_probe: Index lists to scan (higher is slower but more exact)
+        
+        Returns:
+            List of (contract, cosine similarity) tuples, most similar first
+        """
+        index = self.build_similarity_index()
+        if index is None:
+            return []
+        
+        allowed = self._filter_mask(clause_type, framework)
+        if allowed is not None and not allowed.any():
+            return []
+        
+        query = self._get_embedding_generator().generate_embedding(clause_text)
+        ids, scores = index.search(query, k=k, n_probe=n_probe, allowed=allowed)
+        return [(self.contracts[i], float(score)) for i, score in zip(ids, scores)]
+    
+    def _get_embedding_generator(self):
+        """Get the embedding generator, creating it on first use."""
+        if self.embedding_generator is None:
+            # Imported here so loading the knowledge base does not load the model
+            from services.embedding_generator import EmbeddingGenerator
+            self.embedding_generator = EmbeddingGenerator()
+        return self.embedding_generator
+    
+    def _index_fingerprint(self, model_key: str) -> str:
+        """Hash the embedding model and loaded clauses to detect a stale index file."""
+        digest = hashlib.sha256(model_key.encode('utf-8'))
+        for contract in self.contracts:
+            digest.update(f"\0{contract.contract_id}\0{contract.clause_text}".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _filter_mask(self, clause_type: Optional[str], framework: Optional[str]) -> Optional[np.ndarray]:
+        """
+        Build (and memoize) the boolean row mask for a search filter.
+        
+        Args:
+            clause_type: Clause type filter, or None
+            framework: Framework filter, or None
+        
+        Returns:
+            Boolean mask over self.contracts, or None when unfiltered
+        """
+        if clause_type is None and framework is None:
+            return None
+        
+        key = (clause_type.lower() if clause_type else None, framework.upper() if framework else None)
+        mask = self._filter_masks.get(key)
+        if mask is not None:
+            return mask
+        
+        mask = np.ones(len(self.contracts), dtype=bool)
+        if key[0] is not None:
+            mask &= np.fromiter(
+                (contract.clause_type.lower() == key[0] for contract in self.contracts),
+                dtype=bool,
+                count=len(self.contracts)
+            )
+        if key[1] is not None:
+            framework_mask = np.zeros(len(self.contracts), dtype=bool)
+            framework_mask[self._framework_rows.get(key[1], [])] = True
+            mask &= framework_mask
+        
+        self._filter_masks[key] = mask
+        return mask
+    
+    def _invalidate_search_structures(self):
+        """Drop the in-memory indexes and filter masks after the loaded clauses change."""
+        self.similarity_index = None
+        self._inverted_index = None
+        self._filter_masks.clear()
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about loaded knowledge base."""
         return {
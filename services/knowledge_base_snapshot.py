@@ -0,0 +1,213 @@
+"""
+Knowledge Base Snapshot - columnar binary file for fast knowledge base reloads.
+"""
+import hashlib
+import json
+import mmap
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the file layout changes so old snapshots are rewritten
+SNAPSHOT_FORMAT_VERSION = 1
+
+SNAPSHOT_MAGIC = b"KBSNAP\x00\x01"
+_ALIGNMENT = 64
+
+
+def source_signature(path: Union[str, Path], with_hash: bool = True, chunk_size: int = 1024 * 1024) -> Dict[str, Any]:
+    """
+    Describe a source file so a snapshot of it can be checked for staleness.
+    
+    Args:
+        path: Source file
+        with_hash: Also hash the file contents (reads the whole file)
+        chunk_size: Read size in bytes
+    
+    Returns:
+        Dictionary with size, mtime_ns and (if with_hash) sha256
+    """
+    stat = os.stat(path)
+    signature = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    
+    if with_hash:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        signature['sha256'] = digest.hexdigest()
+    
+    return signature
+
+
+class ColumnarSnapshot:
+    """
+    Read-only, memory-mapped file of named NumPy columns and string columns.
+    
+    Layout: magic, header length, JSON header, then each column at a 64-byte
+    aligned offset. Numeric columns are returned as zero-copy views of the
+    mapping. A string column is one UTF-8 blob plus int64 character offsets,
+    so it is decoded once and split by slicing instead of per string.
+    """
+    
+    def __init__(self, path: Path, mapping: mmap.mmap, header: Dict[str, Any]):
+        """
+        Initialize snapshot (see open()).
+        
+        Args:
+            path: Snapshot file
+            mapping: Read-only memory map of the file
+            header: Parsed JSON header
+        """
+        self.path = path
+        self.metadata: Dict[str, Any] = header['metadata']
+        self._mapping = mapping
+        self._columns: Dict[str, Dict[str, Any]] = header['columns']
+    
+    @staticmethod
+    def write(
+        path: Union[str, Path],
+        arrays: Dict[str, np.ndarray],
+        strings: Dict[str, List[str]],
+        metadata: Dict[str, Any]
+    ):
+        """
+        Write a snapshot (atomically).
+        
+        Args:
+            path: Destination file
+            arrays: Numeric columns by name
+            strings: String columns by name
+            metadata: JSON-serializable metadata stored in the header
+        """
+        payload: Dict[str, np.ndarray] = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+        for name, values in strings.items():
+            lengths = np.fromiter((len(value) for value in values), dtype=np.int64, count=len(values))
+            offsets = np.zeros(len(values) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            payload[f"{name}.offsets"] = offsets
+            payload[f"{name}.blob"] = np.frombuffer(''.join(values).encode('utf-8'), dtype=np.uint8)
+        
+        # Column offsets are relative to the data section, which starts aligned
+        columns = {}
+        position = 0
+        for name, array in payload.items():
+            columns[name] = {
+                'dtype': array.dtype.str,
+                'shape': list(array.shape),
+                'offset': position
+            }
+            position += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+        
+        header = json.dumps({
+            'version': SNAPSHOT_FORMAT_VERSION,
+            'metadata': metadata,
+            'columns': columns
+        }).encode('utf-8')
+        prefix_size = len(SNAPSHOT_MAGIC) + 8 + len(header)
+        data_start = -(-prefix_size // _ALIGNMENT) * _ALIGNMENT
+        
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(SNAPSHOT_MAGIC)
+                f.write(len(header).to_bytes(8, 'little'))
+                f.write(header)
+                for name, array in payload.items():
+                    f.seek(data_start + columns[name]['offset'])
+                    f.write(array.tobytes())
+                f.truncate(data_start + position)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        
+        logger.info(f"Saved snapshot to {path} ({(data_start + position) / 1024 / 1024:.1f} MB)")
+    
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> Optional['ColumnarSnapshot']:
+        """
+        Map a snapshot written by write().
+        
+        Args:
+            path: Snapshot file
+        
+        Returns:
+            ColumnarSnapshot, or None if missing, from another format version or unreadable
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+        
+        try:
+            with open(path, 'rb') as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            
+            magic_end = len(SNAPSHOT_MAGIC)
+            if mapping[:magic_end] != SNAPSHOT_MAGIC:
+                raise ValueError("not a snapshot file")
+            header_size = int.from_bytes(mapping[magic_end:magic_end + 8], 'little')
+            header = json.loads(mapping[magic_end + 8:magic_end + 8 + header_size])
+            
+            if header.get('version') != SNAPSHOT_FORMAT_VERSION:
+                logger.info(f"Ignoring snapshot with old format: {path}")
+                mapping.close()
+                return None
+            
+            data_start = -(-(magic_end + 8 + header_size) // _ALIGNMENT) * _ALIGNMENT
+            for column in header['columns'].values():
+                column['offset'] += data_start
+            return cls(path, mapping, header)
+        
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not open snapshot {path}: {e}")
+            return None
+    
+    def array(self, name: str) -> np.ndarray:
+        """
+        Get a numeric column.
+        
+        Args:
+            name: Column name
+        
+        Returns:
+            Read-only array backed by the mapping
+        """
+        column = self._columns[name]
+        dtype = np.dtype(column['dtype'])
+        count = int(np.prod(column['shape']))
+        return np.frombuffer(self._mapping, dtype=dtype, count=count, offset=column['offset']).reshape(column['shape'])
+    
+    def strings(self, name: str, count: Optional[int] = None) -> List[str]:
+        """
+        Decode a string column.
+        
+        Args:
+            name: Column name
+            count: Decode only the first count strings
+        
+        Returns:
+            List of strings
+        """
+        offsets = self.array(f"{name}.offsets")
+        if count is not None:
+            offsets = offsets[:count + 1]
+        
+        blob = self.array(f"{name}.blob")
+        text = blob.tobytes().decode('utf-8')
+        bounds = offsets.tolist()
+        return [text[start:end] for start, end in zip(bounds, bounds[1:])]
+    
+    def close(self):
+        """Unmap the file (arrays returned by array() must no longer be in use)."""
+        self._mapping.close()
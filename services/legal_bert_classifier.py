@@ -2,9 +2,11 @@
 LegalBERT-based clause classification service.
 """
 import streamlit as st
-from typing import Tuple, List
+from typing import Dict, Tuple, List, Optional
 import numpy as np
+from config.settings import config
 from utils.logger import get_logger
+from utils.keyword_matcher import KeywordMatcher
 
 logger = get_logger(__name__)
 
@@ -24,14 +26,21 @@ except (ImportError, AttributeError) as e:
 class LegalBERTClassifier:
     """LegalBERT-based clause classification."""
     
-    def __init__(self, model_name: str = "nlpaueb/legal-bert-base-uncased"):
+    def __init__(
+        self,
+        model_name: str = "nlpaueb/legal-bert-base-uncased",
+        batch_size: Optional[int] = None
+    ):
         """
         Initialize LegalBERT classifier.
         
         Args:
             model_name: Hugging Face model identifier
+            batch_size: Texts per forward pass in batched inference (default from config)
         """
         self.model_name = model_name
+        self.batch_size = batch_size or config.models.inference_batch_size
+        self.max_length = config.models.max_length
         
         if TRANSFORMERS_AVAILABLE and torch is not None:
             self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
@@ -160,6 +169,22 @@ class LegalBERTClassifier:
             "agreement": 1.0,
             "party": 1.0
         }
+        
+        self._compile_keyword_scorer()
+    
+    def _compile_keyword_scorer(self):
+        """Precompute the keyword matcher, weights and per-type score maxima."""
+        self._keyword_matcher = KeywordMatcher(
+            keyword for keywords in self.clause_keywords.values() for keyword in keywords
+        )
+        self._keyword_weights = {
+            clause_type: [(kw, self.phrase_weights.get(kw, 1.0)) for kw in keywords]
+            for clause_type, keywords in self.clause_keywords.items()
+        }
+        self._max_possible_scores = {
+            clause_type: sum(weight for _, weight in weights)
+            for clause_type, weights in self._keyword_weights.items()
+        }
     
     @st.cache_resource
     def _load_model(_self):
@@ -217,34 +242,67 @@ class LegalBERTClassifier:
         Returns:
             List of (clause_type, score) tuples sorted by score
         """
-        text_lower = text.lower()
+        return self._score_keyword_matches(self._keyword_matcher.match(text.lower()))
+    
+    def _score_keyword_matches(self, matches: Dict[str, bool]) -> List[Tuple[str, float]]:
+        """
+        Score each clause type from the keywords found in a clause.
+        
+        Args:
+            matches: Keyword matches from KeywordMatcher.match()
+        
+        Returns:
+            List of (clause_type, score) tuples sorted by score
+        """
         scores = {}
         
-        for clause_type, keywords in self.clause_keywords.items():
+        for clause_type, weights in self._keyword_weights.items():
             total_score = 0.0
             
             # Check each keyword/phrase
-            for keyword in keywords:
-                if keyword in text_lower:
-                    # Apply weight if phrase is in weight dict
-                    weight = self.phrase_weights.get(keyword, 1.0)
-                    
+            for keyword, weight in weights:
+                if keyword in matches:
                     # Bonus for exact phrase match (not just substring)
-                    if f" {keyword} " in f" {text_lower} ":
-                        weight *= 1.5
-                    
-                    total_score += weight
+                    total_score += weight * 1.5 if matches[keyword] else weight
             
             # Normalize by total possible score for this category
-            max_possible_score = sum(self.phrase_weights.get(kw, 1.0) for kw in keywords)
-            normalized_score = total_score / max_possible_score if max_possible_score > 0 else 0.0
-            
-            scores[clause_type] = normalized_score
+            max_possible_score = self._max_possible_scores[clause_type]
+            scores[clause_type] = total_score / max_possible_score if max_possible_score > 0 else 0.0
         
         # Sort by score descending
         sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
         return sorted_scores
     
+    def _prediction_from_scores(
+        self,
+        keyword_scores: List[Tuple[str, float]],
+        top_k: int
+    ) -> Tuple[str, float, List[Tuple[str, float]]]:
+        """
+        Turn sorted keyword scores into (predicted_type, confidence, alternatives).
+        
+        Args:
+            keyword_scores: Sorted (clause_type, score) tuples
+            top_k: Number of alternative predictions to return
+        
+        Returns:
+            Tuple of (predicted_type, confidence, alternatives)
+        """
+        if not keyword_scores or keyword_scores[0][1] == 0.0:
+            # No matches found, classify as "Other"
+            return "Other", 0.5, [("Other", 0.5)]
+        
+        predicted_type = keyword_scores[0][0]
+        # Scale confidence based on keyword match ratio
+        raw_score = keyword_scores[0][1]
+        confidence = min(0.95, 0.5 + (raw_score * 0.45))  # Scale to 0.5-0.95 range
+        
+        # Get top_k alternatives
+        alternatives = [(t, min(0.95, 0.5 + (s * 0.45)))
+                        for t, s in keyword_scores[:top_k]]
+        
+        return predicted_type, confidence, alternatives
+    
     def predict(self, text: str, top_k: int = 3) -> Tuple[str, float, List[Tuple[str, float]]]:
         """
         Predict clause type with confidence score.
@@ -261,42 +319,16 @@ class LegalBERTClassifier:
             # If transformers not available or model failed to load, use keyword-based only
             if not TRANSFORMERS_AVAILABLE or self.model is None or self.tokenizer is None:
                 logger.debug("Using keyword-based classification (transformers unavailable)")
-                keyword_scores = self._keyword_based_classification(text)
-                
-                if not keyword_scores or keyword_scores[0][1] == 0.0:
-                    predicted_type = "Other"
-                    confidence = 0.5
-                    alternatives = [("Other", 0.5)]
-                else:
-                    predicted_type = keyword_scores[0][0]
-                    raw_score = keyword_scores[0][1]
-                    confidence = min(0.95, 0.5 + (raw_score * 0.45))
-                    alternatives = [(t, min(0.95, 0.5 + (s * 0.45))) 
-                                   for t, s in keyword_scores[:top_k]]
-                
-                return predicted_type, confidence, alternatives
+                return self._prediction_from_scores(self._keyword_based_classification(text), top_k)
             
             # Use keyword-based classification
             # In a production system, this would use the actual LegalBERT model
             # for sequence classification. For now, we use keyword matching
             # as a practical implementation.
             
-            keyword_scores = self._keyword_based_classification(text)
-            
-            if not keyword_scores or keyword_scores[0][1] == 0.0:
-                # No matches found, classify as "Other"
-                predicted_type = "Other"
-                confidence = 0.5
-                alternatives = [("Other", 0.5)]
-            else:
-                predicted_type = keyword_scores[0][0]
-                # Scale confidence based on keyword match ratio
-                raw_score = keyword_scores[0][1]
-                confidence = min(0.95, 0.5 + (raw_score * 0.45))  # Scale to 0.5-0.95 range
-                
-                # Get top_k alternatives
-                alternatives = [(t, min(0.95, 0.5 + (s * 0.45))) 
-                               for t, s in keyword_scores[:top_k]]
+            predicted_type, confidence, alternatives = self._prediction_from_scores(
+                self._keyword_based_classification(text), top_k
+            )
             
             logger.info(f"Classified clause as '{predicted_type}' with confidence {confidence:.2f}")
             return predicted_type, confidence, alternatives
@@ -306,37 +338,142 @@ class LegalBERTClassifier:
             # Return safe default
             return "Other", 0.5, [("Other", 0.5)]
     
-    def get_embeddings(self, text: str) -> np.ndarray:
+    def predict_batch(
+        self,
+        texts: List[str],
+        top_k: int = 3
+    ) -> List[Tuple[str, float, List[Tuple[str, float]]]]:
         """
-        Generate embeddings for text using LegalBERT.
+        Predict clause types for many clauses at once.
+        
+        Gives the same results as calling predict() on each text.
         
         Args:
-            text: Text to embed
-            
+            texts: Clause texts to classify
+            top_k: Number of alternative predictions to return
+        
         Returns:
-            Embedding vector as numpy array
+            List of (predicted_type, confidence, alternatives) tuples, one per text
         """
         try:
-            # Tokenize
-            inputs = self.tokenizer(
-                text,
-                return_tensors="pt",
-                truncation=True,
-                max_length=512,
-                padding=True
-            )
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+            all_matches = self._keyword_matcher.match_batch([text.lower() for text in texts])
+            predictions = [
+                self._prediction_from_scores(self._score_keyword_matches(matches), top_k)
+                for matches in all_matches
+            ]
             
-            # Get embeddings
-            with torch.no_grad():
+            logger.info(f"Classified {len(predictions)} clauses in batch")
+            return predictions
+        
+        except Exception as e:
+            logger.error(f"Error in batch clause classification: {e}")
+            return [self.predict(text, top_k) for text in texts]
+    
+    def classify_batch(
+        self,
+        texts: List[str],
+        top_k: int = 3
+    ) -> Tuple[List[Tuple[str, float, List[Tuple[str, float]]]], Optional[np.ndarray]]:
+        """
+        Classify many clauses and embed them with LegalBERT in one batched pass.
+        
+        Predictions are those of predict() for each text. With a loaded model
+        the texts also go through embed_batch()'s length-bucketed inference,
+        and their [CLS] embeddings are returned in input order. The analysis
+        pipeline only needs labels and calls predict_batch(); use this when
+        the LegalBERT vectors are wanted as well.
+        
+        Args:
+            texts: Clause texts to classify
+            top_k: Number of alternative predictions to return
+        
+        Returns:
+            Tuple of (predictions, embeddings); embeddings is None if the model
+            is not loaded or inference fails
+        """
+        predictions = self.predict_batch(texts, top_k)
+        
+        if not texts or self.model is None or self.tokenizer is None:
+            return predictions, None
+        
+        try:
+            embeddings = self._embed_batch(texts)
+        except Exception as e:
+            logger.error(f"Error in LegalBERT batch inference: {e}")
+            return predictions, None
+        
+        return predictions, embeddings
+    
+    def embed_batch(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Generate LegalBERT [CLS] embeddings for many texts.
+        
+        Texts are tokenized once, sorted by token length and run in batches
+        padded only to the longest text in each batch, so short clauses do
+        not pay for long ones. Rows are returned in input order.
+        
+        Args:
+            texts: Texts to embed
+            batch_size: Texts per forward pass (default self.batch_size)
+        
+        Returns:
+            Array of shape (len(texts), hidden_size); zeros if inference fails
+        """
+        try:
+            return self._embed_batch(texts, batch_size)
+        except Exception as e:
+            logger.error(f"Error generating batch embeddings: {e}")
+            # Return zero vectors as fallback
+            return np.zeros((len(texts), self._hidden_size()), dtype=np.float32)
+    
+    def _embed_batch(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """Batched [CLS] embedding (see embed_batch); raises on failure."""
+        if self.model is None or self.tokenizer is None:
+            raise RuntimeError("LegalBERT model is not loaded")
+        
+        embeddings = np.zeros((len(texts), self._hidden_size()), dtype=np.float32)
+        if not texts:
+            return embeddings
+        
+        batch_size = batch_size or self.batch_size
+        
+        # Tokenize once without padding, then bucket by token length
+        encodings = self.tokenizer(list(texts), truncation=True, max_length=self.max_length)
+        lengths = [len(input_ids) for input_ids in encodings['input_ids']]
+        order = sorted(range(len(texts)), key=lengths.__getitem__)
+        
+        with torch.inference_mode():
+            for start in range(0, len(order), batch_size):
+                batch_indices = order[start:start + batch_size]
+                features = [
+                    {key: encodings[key][i] for key in encodings.keys()}
+                    for i in batch_indices
+                ]
+                
+                # Pad only to the longest sequence in this bucket
+                inputs = self.tokenizer.pad(features, padding=True, return_tensors="pt")
+                inputs = {k: v.to(self.device) for k, v in inputs.items()}
+                
                 outputs = self.model(**inputs)
                 # Use [CLS] token embedding (first token)
-                embeddings = outputs.last_hidden_state[:, 0, :].cpu().numpy()
-            
-            logger.debug(f"Generated embeddings with shape: {embeddings.shape}")
-            return embeddings[0]
+                embeddings[batch_indices] = outputs.last_hidden_state[:, 0, :].float().cpu().numpy()
+        
+        logger.debug(f"Generated embeddings for {len(texts)} texts with shape: {embeddings.shape}")
+        return embeddings
+    
+    def _hidden_size(self) -> int:
+        """Get the embedding dimension of the loaded model."""
+        model_config = getattr(self.model, 'config', None)
+        return getattr(model_config, 'hidden_size', 768)  # BERT base dimension
+    
+    def get_embeddings(self, text: str) -> np.ndarray:
+        """
+        Generate embeddings for text using LegalBERT.
+        
+        Args:
+            text: Text to embed
             
-        except Exception as e:
-            logger.error(f"Error generating embeddings: {e}")
-            # Return zero vector as fallback
-            return np.zeros(768)  # BERT base dimension
+        Returns:
+            Embedding vector as numpy array
+        """
+        return self.embed_batch([text])[0]
@@ -143,7 +143,8 @@ class NLPAnalyzer:
     def analyze_clauses(
         self,
         clauses: List[Clause],
-        batch_size: int = 32
+        batch_size: int = 32,
+        embedding_stats: Optional[object] = None
     ) -> List[ClauseAnalysis]:
         """
         Analyze multiple clauses with batch processing for efficiency.
@@ -151,7 +152,8 @@ class NLPAnalyzer:
         Args:
             clauses: List of clauses to analyze
             batch_size: Batch size for embedding generation
-            
+            embedding_stats: Optional EmbeddingStats to add embedding counters to
+        
         Returns:
             List of ClauseAnalysis results
         """
@@ -166,29 +168,24 @@ class NLPAnalyzer:
             
             # Step 1: Classify all clauses
             logger.info("Step 1: Classifying clauses...")
-            classifications = []
-            for clause in clauses:
-                try:
-                    clause_type, confidence, alternatives = self.classifier.predict(clause.text)
-                    classifications.append((clause_type, confidence, alternatives))
-                    
-                    # Log low confidence predictions
-                    if confidence < self.confidence_threshold:
-                        logger.warning(
-                            f"Low confidence ({confidence:.2f}) for clause {clause.clause_id}"
-                        )
-                except Exception as e:
-                    logger.error(f"Error classifying clause {clause.clause_id}: {e}")
-                    classifications.append(("Other", 0.5, [("Other", 0.5)]))
+            clause_texts = [clause.text for clause in clauses]
+            classifications = self._classify_batch(clauses, clause_texts)
+            
+            # Log low confidence predictions
+            for clause, (_, confidence, _) in zip(clauses, classifications):
+                if confidence < self.confidence_threshold:
+                    logger.warning(
+                        f"Low confidence ({confidence:.2f}) for clause {clause.clause_id}"
+                    )
             
             # Step 2: Generate embeddings in batch
             logger.info("Step 2: Generating embeddings in batch...")
-            clause_texts = [clause.text for clause in clauses]
             try:
                 embeddings = self.embedding_generator.generate_embeddings_batch(
                     clause_texts,
                     use_cache=True,
-                    batch_size=batch_size
+                    batch_size=batch_size,
+                    stats=embedding_stats
                 )
             except Exception as e:
                 logger.error(f"Error in batch embedding generation: {e}")
@@ -253,6 +250,33 @@ class NLPAnalyzer:
             # Return fallback analyses for all clauses
             return [self._create_fallback_analysis(clause, str(e)) for clause in clauses]
     
+    def _classify_batch(self, clauses: List[Clause], clause_texts: List[str]) -> List[tuple]:
+        """
+        Classify clauses with the classifier's batch API, falling back to per-clause calls.
+        
+        Args:
+            clauses: Clauses to classify
+            clause_texts: Text of each clause
+        
+        Returns:
+            List of (clause_type, confidence, alternatives) tuples
+        """
+        predict_batch = getattr(self.classifier, 'predict_batch', None)
+        if predict_batch is not None:
+            try:
+                return predict_batch(clause_texts)
+            except Exception as e:
+                logger.error(f"Error in batch classification, classifying individually: {e}")
+        
+        classifications = []
+        for clause in clauses:
+            try:
+                classifications.append(self.classifier.predict(clause.text))
+            except Exception as e:
+                logger.error(f"Error classifying clause {clause.clause_id}: {e}")
+                classifications.append(("Other", 0.5, [("Other", 0.5)]))
+        return classifications
+    
     def get_low_confidence_clauses(
         self,
         analyses: List[ClauseAnalysis]
@@ -1,6 +1,9 @@
 """OCR text extraction module for image-based documents."""
 
 import logging
+import os
+import queue
+import threading
 from typing import Optional, Tuple, List
 from pathlib import Path
 import numpy as np
@@ -9,8 +12,13 @@ from PIL import Image
 import pytesseract
 import pdfplumber
 
+from config.settings import config
+
 logger = logging.getLogger(__name__)
 
+# Sentinel that shuts down a pipeline stage
+_STOP = object()
+
 
 class OCRError(Exception):
     """Base exception for OCR errors."""
@@ -20,16 +28,30 @@ class OCRError(Exception):
 class OCRExtractor:
     """Extract text from image-based documents using Tesseract OCR."""
     
-    def __init__(self, min_confidence: float = 0.5, verify_installation: bool = True):
+    def __init__(
+        self,
+        min_confidence: float = 0.5,
+        verify_installation: bool = True,
+        max_workers: Optional[int] = None,
+        initial_dpi: Optional[int] = None,
+        max_dpi: Optional[int] = None
+    ):
         """
         Initialize OCR extractor.
         
         Args:
             min_confidence: Minimum confidence threshold for OCR results (0-1)
             verify_installation: Whether to verify Tesseract installation on init
+            max_workers: Threads per preprocessing and OCR stage
+                (default from config, falling back to CPU count)
+            initial_dpi: Resolution for the first OCR pass of each PDF page
+            max_dpi: Resolution for re-OCR of pages below min_confidence
         """
         self.logger = logging.getLogger(__name__)
         self.min_confidence = min_confidence
+        self.max_workers = max_workers or config.processing.ocr_max_workers or os.cpu_count() or 1
+        self.max_dpi = max_dpi or config.processing.ocr_max_dpi
+        self.initial_dpi = min(initial_dpi or config.processing.ocr_initial_dpi, self.max_dpi)
         self._tesseract_available = None
         
         # Verify Tesseract is available if requested
@@ -94,6 +116,11 @@ class OCRExtractor:
         """
         Extract text from image-based PDF using OCR.
         
+        Pages flow through a pipeline of rasterization, preprocessing and
+        Tesseract stages running concurrently. Each page is first OCRed at
+        initial_dpi and re-OCRed at max_dpi only if its confidence falls
+        below min_confidence.
+        
         Args:
             pdf_path: Path to PDF file
             
@@ -109,33 +136,32 @@ class OCRExtractor:
             raise OCRError(f"PDF file not found: {pdf_path}")
         
         try:
+            with pdfplumber.open(pdf_path) as pdf:
+                num_pages = len(pdf.pages)
+            
+            page_results = self._run_ocr_pipeline(pdf_path, num_pages)
+            
             text_parts = []
             confidences = []
             
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        # Convert PDF page to image
-                        pil_image = page.to_image(resolution=300).original
-                        
-                        # Convert PIL to OpenCV format
-                        image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-                        
-                        # Preprocess and OCR
-                        preprocessed = self._preprocess_image(image)
-                        page_text, confidence = self._ocr_with_confidence(preprocessed)
-                        
-                        if page_text.strip():
-                            text_parts.append(page_text)
-                            confidences.append(confidence)
-                            self.logger.debug(
-                                f"Page {page_num}: {len(page_text)} chars, "
-                                f"{confidence:.2%} confidence"
-                            )
-                        
-                    except Exception as e:
-                        self.logger.warning(f"Failed to OCR page {page_num}: {e}")
-                        continue
+            for page_num, page_result in enumerate(page_results, 1):
+                if page_result is None:
+                    continue
+                
+                page_text, confidence, dpi = page_result
+                if page_text.strip():
+                    text_parts.append(page_text)
+                    confidences.append(confidence)
+                    self.logger.debug(
+                        f"Page {page_num}: {len(page_text)} chars, "
+                        f"{confidence:.2%} confidence at {dpi} DPI"
+                    )
+                
+                if confidence < self.min_confidence:
+                    self.logger.warning(
+                        f"Page {page_num} OCR confidence {confidence:.2%} below threshold "
+                        f"{self.min_confidence:.2%}"
+                    )
             
             if not text_parts:
                 raise OCRError("No text extracted from PDF")
@@ -155,6 +181,170 @@ class OCRExtractor:
         except Exception as e:
             raise OCRError(f"PDF OCR extraction failed: {e}")
     
+    def _run_ocr_pipeline(
+        self,
+        pdf_path: Path,
+        num_pages: int
+    ) -> List[Optional[Tuple[str, float, int]]]:
+        """
+        OCR all pages of a PDF through the staged pipeline.
+        
+        A single thread rasterizes pages (the PDF handle is not shared),
+        feeding preprocessing and Tesseract worker threads through bounded
+        queues so only a few page images are in memory at once. OpenCV and
+        the Tesseract subprocess release the GIL, so both stages scale with
+        cores. This thread collects results and schedules max_dpi retries.
+        
+        Args:
+            pdf_path: Path to PDF file
+            num_pages: Number of pages in the document
+        
+        Returns:
+            Per-page (text, confidence, dpi) in page order; None for pages
+            that failed at every resolution
+        """
+        if num_pages == 0:
+            return []
+        
+        workers = min(self.max_workers, num_pages)
+        
+        render_queue: queue.Queue = queue.Queue()  # (page_index, dpi) requests
+        image_queue: queue.Queue = queue.Queue(maxsize=workers * 2)
+        preprocessed_queue: queue.Queue = queue.Queue(maxsize=workers * 2)
+        result_queue: queue.Queue = queue.Queue()
+        
+        rasterizer = threading.Thread(
+            target=self._rasterize_stage,
+            args=(pdf_path, render_queue, image_queue, result_queue),
+            daemon=True
+        )
+        preprocessors = [
+            threading.Thread(
+                target=self._preprocess_stage,
+                args=(image_queue, preprocessed_queue, result_queue),
+                daemon=True
+            )
+            for _ in range(workers)
+        ]
+        recognizers = [
+            threading.Thread(
+                target=self._ocr_stage,
+                args=(preprocessed_queue, result_queue),
+                daemon=True
+            )
+            for _ in range(workers)
+        ]
+        
+        for thread in [rasterizer, *preprocessors, *recognizers]:
+            thread.start()
+        
+        page_results: List[Optional[Tuple[str, float, int]]] = [None] * num_pages
+        
+        try:
+            for page_index in range(num_pages):
+                render_queue.put((page_index, self.initial_dpi))
+            
+            pending = num_pages
+            while pending:
+                page_index, dpi, page_text, confidence, error = result_queue.get()
+                
+                if page_index is None:
+                    raise OCRError(f"Failed to open PDF for OCR: {error}")
+                
+                if error is not None:
+                    self.logger.warning(f"Failed to OCR page {page_index + 1} at {dpi} DPI: {error}")
+                else:
+                    best = page_results[page_index]
+                    if best is None or confidence >= best[1]:
+                        page_results[page_index] = (page_text, confidence, dpi)
+                
+                best = page_results[page_index]
+                if dpi < self.max_dpi and (best is None or best[1] < self.min_confidence):
+                    render_queue.put((page_index, self.max_dpi))
+                else:
+                    pending -= 1
+        
+        finally:
+            # Every stage has drained by now (or is failing), so these puts
+            # cannot block for long
+            render_queue.put(_STOP)
+            rasterizer.join()
+            for _ in preprocessors:
+                image_queue.put(_STOP)
+            for thread in preprocessors:
+                thread.join()
+            for _ in recognizers:
+                preprocessed_queue.put(_STOP)
+            for thread in recognizers:
+                thread.join()
+        
+        return page_results
+    
+    def _rasterize_stage(
+        self,
+        pdf_path: Path,
+        render_queue: queue.Queue,
+        image_queue: queue.Queue,
+        result_queue: queue.Queue
+    ):
+        """Pipeline stage: render requested pages to OpenCV images."""
+        try:
+            pdf = pdfplumber.open(pdf_path)
+        except Exception as e:
+            result_queue.put((None, None, None, None, e))
+            while render_queue.get() is not _STOP:
+                pass
+            return
+        
+        with pdf:
+            while True:
+                request = render_queue.get()
+                if request is _STOP:
+                    return
+                
+                page_index, dpi = request
+                try:
+                    # Convert PDF page to image
+                    pil_image = pdf.pages[page_index].to_image(resolution=dpi).original
+                    
+                    # Convert PIL to OpenCV format
+                    image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+                    image_queue.put((page_index, dpi, image))
+                except Exception as e:
+                    result_queue.put((page_index, dpi, '', 0.0, e))
+    
+    def _preprocess_stage(
+        self,
+        image_queue: queue.Queue,
+        preprocessed_queue: queue.Queue,
+        result_queue: queue.Queue
+    ):
+        """Pipeline stage: clean up rendered page images for OCR."""
+        while True:
+            item = image_queue.get()
+            if item is _STOP:
+                return
+            
+            page_index, dpi, image = item
+            try:
+                preprocessed_queue.put((page_index, dpi, self._preprocess_image(image)))
+            except Exception as e:
+                result_queue.put((page_index, dpi, '', 0.0, e))
+    
+    def _ocr_stage(self, preprocessed_queue: queue.Queue, result_queue: queue.Queue):
+        """Pipeline stage: run Tesseract on preprocessed page images."""
+        while True:
+            item = preprocessed_queue.get()
+            if item is _STOP:
+                return
+            
+            page_index, dpi, image = item
+            try:
+                page_text, confidence = self._ocr_with_confidence(image, warn_low_confidence=False)
+                result_queue.put((page_index, dpi, page_text, confidence, None))
+            except Exception as e:
+                result_queue.put((page_index, dpi, '', 0.0, e))
+    
     def _preprocess_image(self, image: np.ndarray) -> np.ndarray:
         """
         Preprocess image to improve OCR accuracy.
@@ -237,13 +427,18 @@ class OCRExtractor:
         self.logger.debug(f"Deskewed image by {angle:.2f} degrees")
         return rotated
     
-    def _ocr_with_confidence(self, image: np.ndarray) -> Tuple[str, float]:
+    def _ocr_with_confidence(
+        self,
+        image: np.ndarray,
+        warn_low_confidence: bool = True
+    ) -> Tuple[str, float]:
         """
         Perform OCR and calculate confidence score.
         
         Args:
             image: Preprocessed image
-            
+            warn_low_confidence: Whether to log a warning below min_confidence
+        
         Returns:
             Tuple of (extracted_text, confidence_score)
         """
@@ -273,7 +468,7 @@ class OCRExtractor:
         avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
         
         # Warn if confidence is low
-        if avg_confidence < self.min_confidence:
+        if warn_low_confidence and avg_confidence < self.min_confidence:
             self.logger.warning(
                 f"OCR confidence {avg_confidence:.2%} below threshold "
                 f"{self.min_confidence:.2%}"
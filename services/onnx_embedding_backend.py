@@ -0,0 +1,343 @@
+"""
+ONNX Runtime backend for Sentence Transformer embeddings.
+
+Exports the transformer of a Sentence Transformer model to ONNX once,
+optionally quantizes its weights to int8, and runs inference through
+onnxruntime on CPU. Pooling and normalization are replayed in NumPy so the
+output matches SentenceTransformer.encode():
+
+- fp32 export: cosine similarity to the PyTorch embedding >= FP32_MIN_COSINE
+- int8 export: cosine similarity to the PyTorch embedding >= INT8_MIN_COSINE
+
+benchmark_embeddings.py measures both on the sample and CUAD contracts.
+"""
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Try to import onnxruntime and the tokenizer, make them optional
+try:
+    import onnxruntime as ort
+    from transformers import AutoTokenizer
+    ONNX_AVAILABLE = True
+except (ImportError, AttributeError) as e:
+    logger.warning(f"onnxruntime not available: {e}")
+    ONNX_AVAILABLE = False
+    ort = None
+    AutoTokenizer = None
+
+# Documented agreement with the PyTorch path (per-text cosine similarity)
+FP32_MIN_COSINE = 0.9999
+INT8_MIN_COSINE = 0.99
+
+FP32_MODEL_FILE = "model.onnx"
+INT8_MODEL_FILE = "model_int8.onnx"
+EXPORT_CONFIG_FILE = "export_config.json"
+ONNX_OPSET = 14
+
+
+def default_model_dir(cache_dir: str, model_name: str) -> Path:
+    """
+    Get the export directory for a model under the model cache.
+    
+    Args:
+        cache_dir: Model cache directory
+        model_name: Sentence Transformer model name
+    
+    Returns:
+        Directory for the exported ONNX files
+    """
+    return Path(cache_dir) / "onnx" / model_name.replace("/", "--")
+
+
+def available_cpus() -> int:
+    """
+    Count the CPUs this process may run on.
+    
+    Respects CPU affinity (container and taskset limits), which
+    os.cpu_count() ignores; oversubscribed intra-op threads are slower than
+    fewer threads.
+    
+    Returns:
+        Number of usable CPUs (at least 1)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def export_model(model_name: str, model_dir: Union[str, Path], quantize: bool = True) -> Path:
+    """
+    Export a Sentence Transformer model to ONNX.
+    
+    Writes the fp32 graph, the int8 graph (if quantize), the tokenizer and
+    the pooling settings into model_dir. The export is built in a scratch
+    directory and renamed into place, so concurrent exports are safe.
+    
+    Args:
+        model_name: Sentence Transformer model name
+        model_dir: Target directory
+        quantize: Also write a dynamically int8-quantized graph
+    
+    Returns:
+        Path to the export directory
+    
+    Raises:
+        ImportError: If torch, sentence_transformers or onnxruntime is missing
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+    
+    model_dir = Path(model_dir)
+    model_dir.parent.mkdir(parents=True, exist_ok=True)
+    scratch_dir = model_dir.with_name(f".{model_dir.name}.{uuid.uuid4().hex}.tmp")
+    scratch_dir.mkdir()
+    
+    try:
+        logger.info(f"Exporting {model_name} to ONNX")
+        st_model = SentenceTransformer(model_name, device="cpu")
+        transformer = st_model[0].auto_model.eval()
+        tokenizer = st_model.tokenizer
+        
+        sample = tokenizer(["An example clause."], return_tensors="pt")
+        input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+        
+        with torch.inference_mode():
+            torch.onnx.export(
+                transformer,
+                tuple(sample[name] for name in input_names),
+                str(scratch_dir / FP32_MODEL_FILE),
+                input_names=input_names,
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes,
+                opset_version=ONNX_OPSET,
+                do_constant_folding=True
+            )
+        
+        if quantize:
+            quantize_model(scratch_dir / FP32_MODEL_FILE, scratch_dir / INT8_MODEL_FILE)
+        
+        tokenizer.save_pretrained(str(scratch_dir))
+        with open(scratch_dir / EXPORT_CONFIG_FILE, "w", encoding="utf-8") as f:
+            json.dump(_pipeline_settings(st_model, model_name), f, indent=2)
+        
+        try:
+            os.replace(scratch_dir, model_dir)
+        except OSError:
+            # Another process finished first; keep its export
+            if not (model_dir / EXPORT_CONFIG_FILE).exists():
+                raise
+        
+        logger.info(f"ONNX export written to {model_dir}")
+        return model_dir
+    
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+
+def quantize_model(fp32_path: Union[str, Path], int8_path: Union[str, Path]):
+    """
+    Quantize an exported graph's weights to int8 (activations stay dynamic).
+    
+    Args:
+        fp32_path: Path to the fp32 ONNX graph
+        int8_path: Path to write the quantized graph
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    
+    quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+    logger.info(f"Quantized ONNX model written to {int8_path}")
+
+
+def _pipeline_settings(st_model: Any, model_name: str) -> Dict[str, Any]:
+    """Read the pooling and normalization steps of a Sentence Transformer pipeline."""
+    pooling_mode = "mean"
+    normalize = False
+    for module in st_model:
+        module_type = type(module).__name__
+        if module_type == "Pooling":
+            # sentence-transformers 6 exposes the mode directly
+            mode = getattr(module, "pooling_mode", None)
+            pooling_mode = mode if isinstance(mode, str) else module.get_pooling_mode_str()
+        elif module_type == "Normalize":
+            normalize = True
+    
+    return {
+        "model_name": model_name,
+        "pooling_mode": pooling_mode,
+        "normalize": normalize,
+        "max_seq_length": st_model.max_seq_length,
+        "dimension": st_model.get_sentence_embedding_dimension()
+    }
+
+
+class OnnxSentenceEncoder:
+    """
+    Drop-in replacement for SentenceTransformer.encode() backed by onnxruntime.
+    
+    Texts are sorted by token length before batching so each batch is padded
+    only to its own longest text, and results are returned in input order.
+    """
+    
+    def __init__(
+        self,
+        model_dir: Union[str, Path],
+        quantized: bool = True,
+        num_threads: Optional[int] = None
+    ):
+        """
+        Initialize ONNX encoder from an export directory.
+        
+        Args:
+            model_dir: Directory written by export_model()
+            quantized: Use the int8 graph instead of the fp32 graph
+            num_threads: Intra-op threads (default: available_cpus())
+        """
+        if not ONNX_AVAILABLE:
+            raise ImportError("onnxruntime and transformers are required for the ONNX backend")
+        
+        self.model_dir = Path(model_dir)
+        self.quantized = quantized
+        self.num_threads = num_threads or available_cpus()
+        
+        with open(self.model_dir / EXPORT_CONFIG_FILE, "r", encoding="utf-8") as f:
+            self.settings = json.load(f)
+        self.max_seq_length = self.settings["max_seq_length"]
+        
+        self.tokenizer = AutoTokenizer.from_pretrained(str(self.model_dir))
+        
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = self.num_threads
+        # One graph runs at a time, so inter-op threads would only compete
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        
+        model_file = INT8_MODEL_FILE if quantized else FP32_MODEL_FILE
+        self.session = ort.InferenceSession(
+            str(self.model_dir / model_file),
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self._input_names = [node.name for node in self.session.get_inputs()]
+        
+        logger.info(
+            f"ONNX encoder loaded: {model_file} "
+            f"({self.num_threads} threads, {self.settings['pooling_mode']} pooling)"
+        )
+    
+    @classmethod
+    def load_or_export(
+        cls,
+        model_name: str,
+        model_dir: Union[str, Path],
+        quantized: bool = True,
+        num_threads: Optional[int] = None
+    ) -> "OnnxSentenceEncoder":
+        """
+        Load an exported model, exporting it first if missing.
+        
+        Args:
+            model_name: Sentence Transformer model name
+            model_dir: Export directory
+            quantized: Use the int8 graph
+            num_threads: Intra-op threads (default: available_cpus())
+        
+        Returns:
+            Loaded OnnxSentenceEncoder
+        """
+        model_dir = Path(model_dir)
+        if not (model_dir / EXPORT_CONFIG_FILE).exists():
+            export_model(model_name, model_dir, quantize=quantized)
+        elif quantized and not (model_dir / INT8_MODEL_FILE).exists():
+            quantize_model(model_dir / FP32_MODEL_FILE, model_dir / INT8_MODEL_FILE)
+        
+        return cls(model_dir, quantized=quantized, num_threads=num_threads)
+    
+    def get_sentence_embedding_dimension(self) -> int:
+        """Get the embedding dimension."""
+        return self.settings["dimension"]
+    
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        show_progress_bar: bool = False
+    ) -> np.ndarray:
+        """
+        Embed one or more texts.
+        
+        Args:
+            sentences: Text or list of texts
+            batch_size: Texts per inference call
+            convert_to_numpy: Accepted for SentenceTransformer compatibility (always NumPy)
+            show_progress_bar: Accepted for SentenceTransformer compatibility (ignored)
+        
+        Returns:
+            float32 array of shape (dim,) for a single text, else (len(sentences), dim)
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        embeddings = np.zeros((len(texts), self.get_sentence_embedding_dimension()), dtype=np.float32)
+        
+        if texts:
+            encoded = self.tokenizer(
+                texts,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_attention_mask=True
+            )
+            order = np.argsort([len(ids) for ids in encoded["input_ids"]], kind="stable")
+            
+            for start in range(0, len(order), batch_size):
+                indices = order[start:start + batch_size]
+                embeddings[indices] = self._encode_batch(encoded, indices)
+        
+        return embeddings[0] if single else embeddings
+    
+    def _encode_batch(self, encoded: Dict[str, List[List[int]]], indices: np.ndarray) -> np.ndarray:
+        """Run one padded batch through the session and pool it."""
+        width = max(len(encoded["input_ids"][i]) for i in indices)
+        feeds = {}
+        for name in self._input_names:
+            batch = np.zeros((len(indices), width), dtype=np.int64)
+            if name == "input_ids" and self.tokenizer.pad_token_id:
+                batch.fill(self.tokenizer.pad_token_id)
+            if name not in encoded:
+                # e.g. token_type_ids from a tokenizer that does not emit them
+                feeds[name] = batch
+                continue
+            for row, i in enumerate(indices):
+                values = encoded[name][i]
+                batch[row, :len(values)] = values
+            feeds[name] = batch
+        
+        hidden = self.session.run(["last_hidden_state"], feeds)[0]
+        mask = feeds["attention_mask"]
+        
+        pooling_mode = self.settings["pooling_mode"]
+        if pooling_mode == "cls":
+            pooled = hidden[:, 0]
+        elif pooling_mode == "max":
+            pooled = np.where(mask[..., None] > 0, hidden, -1e9).max(axis=1)
+        else:
+            weights = mask[..., None].astype(np.float32)
+            pooled = (hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None)
+        
+        if self.settings["normalize"]:
+            norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+            pooled = pooled / np.clip(norms, 1e-12, None)
+        
+        return pooled.astype(np.float32)
@@ -1,13 +1,17 @@
 """PDF text extraction module for contract processing."""
 
 import logging
-from typing import Optional, Tuple
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple, List, Dict, Iterator
 from pathlib import Path
 import PyPDF2
 import pdfplumber
 from PIL import Image
 import pytesseract
 
+from config.settings import config
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,12 +30,58 @@ class PasswordProtectedError(PDFExtractionError):
     pass
 
 
+def _iter_page_range_with_pdfplumber(file_path: str, start: int, end: int) -> Iterator[Optional[str]]:
+    """
+    Extract pages [start, end) with pdfplumber, one at a time.
+    
+    Yields:
+        Page text, or None for a page that failed or came back empty
+    """
+    with pdfplumber.open(file_path) as pdf:
+        for page_num in range(start, end):
+            try:
+                page_text = pdf.pages[page_num].extract_text()
+                yield page_text if page_text and page_text.strip() else None
+            except Exception as e:
+                logger.warning(f"Failed to extract page {page_num + 1}: {e}")
+                yield None
+
+
+def _extract_page_range_with_pdfplumber(file_path: str, start: int, end: int) -> List[Optional[str]]:
+    """
+    Extract pages [start, end) with pdfplumber.
+    
+    Module-level so it can run in a worker process.
+    
+    Returns:
+        Page texts in order; None for pages that failed or came back empty
+    """
+    return list(_iter_page_range_with_pdfplumber(file_path, start, end))
+
+
 class PDFExtractor:
     """Extract text from PDF documents using multiple methods."""
     
-    def __init__(self):
-        """Initialize PDF extractor."""
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        parallel_min_pages: Optional[int] = None
+    ):
+        """
+        Initialize PDF extractor.
+        
+        Args:
+            max_workers: Worker processes for page-sharded extraction
+                (default from config, falling back to CPU count)
+            parallel_min_pages: Page count at which extraction is sharded
+                across processes (default from config)
+        """
         self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers or config.processing.pdf_max_workers or os.cpu_count() or 1
+        self.parallel_min_pages = (
+            parallel_min_pages if parallel_min_pages is not None
+            else config.processing.pdf_parallel_min_pages
+        )
     
     def extract_text(self, file_path: str) -> str:
         """
@@ -53,16 +103,16 @@ class PDFExtractor:
         if not file_path.exists():
             raise PDFExtractionError(f"File not found: {file_path}")
         
-        # Try pdfplumber first (better for structured PDFs)
+        # pdfplumber per page, with PyPDF2 retried only on the pages it missed
         try:
-            text = self._extract_with_pdfplumber(file_path)
+            text = "\n\n".join(self.extract_pages(file_path))
             if text and len(text.strip()) > 50:  # Minimum viable text
-                self.logger.info(f"Successfully extracted text using pdfplumber: {len(text)} chars")
+                self.logger.info(f"Successfully extracted text: {len(text)} chars")
                 return self._clean_text(text)
         except Exception as e:
             self.logger.warning(f"pdfplumber extraction failed: {e}")
         
-        # Fallback to PyPDF2
+        # Fallback to PyPDF2 for the whole document
         try:
             text = self._extract_with_pypdf2(file_path)
             if text and len(text.strip()) > 50:
@@ -77,35 +127,156 @@ class PDFExtractor:
             "Try using OCR extraction instead."
         )
     
-    def _extract_with_pdfplumber(self, file_path: Path) -> str:
+    def extract_pages(self, file_path: str) -> List[str]:
         """
-        Extract text using pdfplumber library.
+        Extract text page by page, in page order.
         
         Args:
             file_path: Path to PDF file
-            
+        
         Returns:
-            Extracted text
+            List of raw page texts (see iter_pages)
         """
-        text_parts = []
+        return list(self.iter_pages(file_path))
+    
+    def iter_pages(self, file_path: str) -> Iterator[str]:
+        """
+        Extract text page by page, yielding each page as soon as it is ready.
+        
+        Large documents are split into page ranges extracted in parallel
+        worker processes. Pages pdfplumber could not read are retried
+        individually with PyPDF2. Pages with no text in either are omitted.
+        
+        Args:
+            file_path: Path to PDF file
+        
+        Yields:
+            Raw page texts, in page order
+        
+        Raises:
+            PasswordProtectedError: If PDF is password protected
+            PDFExtractionError: If pdfplumber cannot open the file
+        """
+        file_path = Path(file_path)
         
         try:
             with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_parts.append(page_text)
-                            self.logger.debug(f"Extracted page {page_num}: {len(page_text)} chars")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to extract page {page_num}: {e}")
-                        continue
+                num_pages = len(pdf.pages)
         except Exception as e:
             if "password" in str(e).lower():
                 raise PasswordProtectedError("PDF is password protected")
             raise PDFExtractionError(f"pdfplumber error: {e}")
         
-        return "\n\n".join(text_parts)
+        self.logger.debug(f"PDF has {num_pages} pages")
+        
+        for first_page, page_texts in self._iter_page_batches(file_path, num_pages):
+            # Per-page fallback for pages pdfplumber missed
+            missing_pages = [
+                first_page + offset for offset, text in enumerate(page_texts) if text is None
+            ]
+            if missing_pages:
+                self.logger.info(f"Retrying {len(missing_pages)} pages with PyPDF2")
+                try:
+                    recovered = self._extract_pages_with_pypdf2(file_path, missing_pages)
+                    for page_num, text in recovered.items():
+                        page_texts[page_num - first_page] = text
+                except Exception as e:
+                    self.logger.warning(f"PyPDF2 page fallback failed: {e}")
+            
+            for text in page_texts:
+                if text:
+                    yield text
+    
+    def _iter_page_batches(
+        self,
+        file_path: Path,
+        num_pages: int
+    ) -> Iterator[Tuple[int, List[Optional[str]]]]:
+        """
+        Extract pages with pdfplumber in consecutive batches.
+        
+        Large documents are sharded across worker processes, one page range
+        per worker, and shards are yielded in order as they finish. Otherwise
+        pages are read sequentially in batches of parallel_min_pages.
+        
+        Args:
+            file_path: Path to PDF file
+            num_pages: Number of pages in the document
+        
+        Yields:
+            Tuple of (first page index, page texts); None marks pages that
+            failed or came back empty
+        """
+        workers = min(self.max_workers, num_pages)
+        next_page = 0
+        
+        if workers > 1 and num_pages >= self.parallel_min_pages:
+            shard_size = -(-num_pages // workers)  # ceiling division
+            ranges = [
+                (start, min(start + shard_size, num_pages))
+                for start in range(0, num_pages, shard_size)
+            ]
+            
+            try:
+                with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+                    shards = executor.map(
+                        _extract_page_range_with_pdfplumber,
+                        [str(file_path)] * len(ranges),
+                        [start for start, _ in ranges],
+                        [end for _, end in ranges]
+                    )
+                    for (start, end), shard in zip(ranges, shards):
+                        yield start, shard
+                        next_page = end
+                
+                self.logger.debug(f"Extracted {num_pages} pages in {len(ranges)} parallel shards")
+                return
+            
+            except Exception as e:
+                self.logger.warning(f"Parallel page extraction failed, extracting sequentially: {e}")
+        
+        batch_size = max(1, self.parallel_min_pages)
+        batch: List[Optional[str]] = []
+        
+        for text in _iter_page_range_with_pdfplumber(str(file_path), next_page, num_pages):
+            batch.append(text)
+            if len(batch) == batch_size:
+                yield next_page, batch
+                next_page += len(batch)
+                batch = []
+        
+        if batch:
+            yield next_page, batch
+    
+    def _extract_pages_with_pypdf2(self, file_path: Path, page_numbers: List[int]) -> Dict[int, str]:
+        """
+        Extract selected pages using PyPDF2.
+        
+        Args:
+            file_path: Path to PDF file
+            page_numbers: Zero-based page indices to extract
+        
+        Returns:
+            Dictionary mapping page index to extracted text (non-empty only)
+        """
+        recovered = {}
+        
+        with open(file_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            
+            if pdf_reader.is_encrypted:
+                raise PasswordProtectedError("PDF is password protected")
+            
+            for page_num in page_numbers:
+                try:
+                    page_text = pdf_reader.pages[page_num].extract_text()
+                    if page_text and page_text.strip():
+                        recovered[page_num] = page_text
+                        self.logger.debug(f"Recovered page {page_num + 1} with PyPDF2: {len(page_text)} chars")
+                except Exception as e:
+                    self.logger.warning(f"PyPDF2 failed on page {page_num + 1}: {e}")
+        
+        return recovered
     
     def _extract_with_pypdf2(self, file_path: Path) -> str:
         """
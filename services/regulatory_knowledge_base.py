@@ -3,16 +3,20 @@ Regulatory Knowledge Base service.
 Manages regulatory requirements and provides semantic similarity matching.
 """
 from typing import List, Dict, Tuple, Optional
+import hashlib
+import json
 import numpy as np
 from functools import lru_cache
 
-from models.regulatory_requirement import RegulatoryRequirement
+from config.settings import config
+from models.regulatory_requirement import RegulatoryRequirement, RequirementMatchPlan
 from models.clause_analysis import ClauseAnalysis
 from data.gdpr_requirements import get_gdpr_requirements
 from data.hipaa_requirements import get_hipaa_requirements
 from data.ccpa_requirements import get_ccpa_requirements
 from data.sox_requirements import get_sox_requirements
-from services.embedding_generator import EmbeddingGenerator
+from services.embedding_generator import EmbeddingGenerator, create_embedding_cache
+from services.rule_pack_loader import load_rule_packs
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -54,8 +58,27 @@ class RegulatoryKnowledgeBase:
             'SOX': self.sox_requirements
         }
         
-        # Cache for requirement embeddings
-        self._embedding_cache: Dict[str, np.ndarray] = {}
+        # Frameworks whose requirements are defined only in a rule pack
+        for framework, rule_pack in load_rule_packs(config.compliance.rule_pack_dir).items():
+            if rule_pack.requirements and framework not in self.framework_requirements:
+                self.framework_requirements[framework] = rule_pack.requirements
+                logger.info(f"Loaded {len(rule_pack.requirements)} {framework} requirements from {rule_pack.source}")
+        
+        # Bounded cache for requirement embeddings
+        self._embedding_cache = create_embedding_cache()
+        
+        # Stacked, L2-normalized requirement embeddings per framework
+        self._requirement_matrices: Dict[str, np.ndarray] = {}
+        
+        # Lookup indexes, rebuilt when the framework requirement lists change
+        self._requirements_by_id: Dict[str, RegulatoryRequirement] = {}
+        self._requirement_positions: Dict[str, Tuple[str, int]] = {}
+        self._requirements_by_type: Dict[Tuple[str, str], List[RegulatoryRequirement]] = {}
+        self._clause_type_columns: Dict[Tuple[str, str], np.ndarray] = {}
+        self._clause_type_matrices: Dict[Tuple[str, str], np.ndarray] = {}
+        self._index_signature: Optional[Tuple] = None
+        self._requirements_version: Optional[str] = None
+        self._build_indexes()
         
         logger.info(
             f"Regulatory Knowledge Base initialized with "
@@ -98,6 +121,18 @@ class RegulatoryKnowledgeBase:
         logger.debug(f"Retrieved {len(all_reqs)} total requirements")
         return all_reqs
     
+    def set_requirements(self, framework: str, requirements: List[RegulatoryRequirement]):
+        """
+        Replace the requirements of a framework (or add a new framework).
+        
+        Args:
+            framework: Framework name
+            requirements: Requirements for the framework
+        """
+        self.framework_requirements[framework.upper()] = list(requirements)
+        self._build_indexes()
+        logger.info(f"Loaded {len(requirements)} requirements for {framework.upper()}")
+    
     def get_requirements_by_clause_type(
         self,
         clause_type: str,
@@ -113,17 +148,17 @@ class RegulatoryKnowledgeBase:
         Returns:
             List of matching requirements
         """
-        if framework:
-            requirements = self.get_requirements(framework)
-        else:
-            requirements = self.get_all_requirements()
+        self._ensure_indexes()
+        if framework and framework.upper() not in self.framework_requirements:
+            return self.get_requirements(framework)
         
         # Use case-insensitive matching with whitespace normalization
-        clause_type_normalized = clause_type.strip().lower()
-        filtered = [
-            req for req in requirements 
-            if req.clause_type.strip().lower() == clause_type_normalized
-        ]
+        clause_type_normalized = self._normalize_clause_type(clause_type)
+        frameworks = [framework.upper()] if framework else list(self.framework_requirements)
+        filtered = []
+        for framework_upper in frameworks:
+            filtered.extend(self._requirements_by_type.get((framework_upper, clause_type_normalized), ()))
+        
         logger.debug(
             f"Found {len(filtered)} requirements for clause type '{clause_type}'"
             f"{' in ' + framework if framework else ''}"
@@ -150,22 +185,22 @@ class RegulatoryKnowledgeBase:
             return requirement.embeddings
         
         # Check cache
-        if use_cache and requirement.requirement_id in self._embedding_cache:
-            logger.debug(f"Using cached embedding for {requirement.requirement_id}")
-            return self._embedding_cache[requirement.requirement_id]
+        if use_cache:
+            cached = self._embedding_cache.get(requirement.requirement_id)
+            if cached is not None:
+                logger.debug(f"Using cached embedding for {requirement.requirement_id}")
+                return cached
         
         # Generate embedding from description and keywords
         text = f"{requirement.description} {' '.join(requirement.keywords)}"
         embedding = self.embedding_generator.generate_embedding(text)
         
-        # Cache the embedding
+        # Cache the embedding (not on the requirement object, so the
+        # cache limits actually bound memory)
         if use_cache:
-            self._embedding_cache[requirement.requirement_id] = embedding
+            self._embedding_cache.put(requirement.requirement_id, embedding)
             logger.debug(f"Cached embedding for {requirement.requirement_id}")
         
-        # Also store in requirement object
-        requirement.embeddings = embedding
-        
         return embedding
     
     def precompute_embeddings(self, frameworks: Optional[List[str]] = None):
@@ -198,8 +233,11 @@ class RegulatoryKnowledgeBase:
             
             # Store embeddings
             for req, embedding in zip(requirements, embeddings):
-                req.embeddings = embedding
-                self._embedding_cache[req.requirement_id] = embedding
+                self._embedding_cache.put(req.requirement_id, embedding)
+            
+            # Stale matrices would mix old and new embeddings
+            self._requirement_matrices.clear()
+            self._clause_type_matrices.clear()
             
             logger.info(f"Precomputed {len(embeddings)} requirement embeddings")
             
@@ -214,6 +252,63 @@ class RegulatoryKnowledgeBase:
                         f"Error generating embedding for {req.requirement_id}: {emb_error}"
                     )
     
+    def get_requirement_matrix(self, framework: str) -> np.ndarray:
+        """
+        Get the stacked requirement embedding matrix for a framework.
+        
+        Rows are L2-normalized float32 vectors in the same order as
+        get_requirements(framework), so a single matmul against normalized
+        clause embeddings yields cosine similarities.
+        
+        Args:
+            framework: Framework name (GDPR, HIPAA, CCPA, SOX)
+            
+        Returns:
+            Matrix of shape (num_requirements, embedding_dim)
+        """
+        self._ensure_indexes()
+        framework_upper = framework.upper()
+        matrix = self._requirement_matrices.get(framework_upper)
+        if matrix is not None:
+            return matrix
+        
+        requirements = self.get_requirements(framework_upper)
+        if not requirements:
+            return np.zeros((0, 0), dtype=np.float32)
+        
+        matrix = self._normalize_rows(
+            np.vstack([self.get_requirement_embedding(req) for req in requirements])
+        )
+        self._requirement_matrices[framework_upper] = matrix
+        logger.debug(f"Built {framework_upper} requirement matrix {matrix.shape}")
+        return matrix
+    
+    def get_clause_type_matrix(self, framework: str, clause_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the requirement embedding rows of one clause type in a framework.
+        
+        Args:
+            framework: Framework name (GDPR, HIPAA, CCPA, SOX)
+            clause_type: Clause type (case-insensitive, surrounding whitespace ignored)
+            
+        Returns:
+            Tuple of (positions in get_requirements(framework), matrix of
+            those requirements' rows of get_requirement_matrix(framework));
+            both empty if the framework has no requirements of this type
+        """
+        self._ensure_indexes()
+        key = (framework.upper(), self._normalize_clause_type(clause_type))
+        columns = self._clause_type_columns.get(key)
+        if columns is None:
+            return np.zeros(0, dtype=np.intp), np.zeros((0, 0), dtype=np.float32)
+        
+        matrix = self._clause_type_matrices.get(key)
+        if matrix is None:
+            # Contiguous copy, so matching a clause type reads only its rows
+            matrix = np.ascontiguousarray(self.get_requirement_matrix(key[0])[columns])
+            self._clause_type_matrices[key] = matrix
+        return columns, matrix
+    
     def match_clause_to_requirements(
         self,
         clause_analysis: ClauseAnalysis,
@@ -231,71 +326,138 @@ class RegulatoryKnowledgeBase:
         Returns:
             List of (requirement, similarity_score) tuples, sorted by score
         """
-        try:
-            # First try to get requirements for framework and clause type
-            requirements = self.get_requirements_by_clause_type(
-                clause_analysis.clause_type,
-                framework
-            )
+        return self.match_clauses_to_requirements(
+            [clause_analysis],
+            framework,
+            top_k=top_k
+        )[0]
+    
+    def match_clauses_to_requirements(
+        self,
+        clauses: List[ClauseAnalysis],
+        framework: str,
+        top_k: int = 3
+    ) -> List[List[Tuple[RegulatoryRequirement, float]]]:
+        """
+        Match many clauses against a framework with a single matrix product.
+        
+        Each clause is restricted to requirements of its own clause type,
+        falling back to all framework requirements when none exist.
+        
+        Args:
+            clauses: Analyzed clauses with embeddings
+            framework: Framework to match against
+            top_k: Number of top matches to return per clause
             
-            # If no requirements found for specific clause type, fall back to all framework requirements
-            if not requirements:
-                logger.info(
-                    f"No requirements found for {framework} / {clause_analysis.clause_type}, "
-                    f"searching all {framework} requirements"
-                )
-                requirements = self.get_requirements(framework)
-                
+        Returns:
+            One list of (requirement, similarity_score) tuples per clause,
+            in input order, each sorted by score
+        """
+        results: List[List[Tuple[RegulatoryRequirement, float]]] = [[] for _ in clauses]
+        
+        try:
+            requirements = self.get_requirements(framework)
             if not requirements:
-                logger.warning(
-                    f"No requirements found for {framework}"
-                )
-                return []
+                logger.warning(f"No requirements found for {framework}")
+                return results
             
-            # Check if clause has embeddings
-            if clause_analysis.embeddings is None:
-                logger.warning(f"Clause {clause_analysis.clause_id} has no embeddings")
-                return []
+            embedded = []
+            for idx, clause in enumerate(clauses):
+                if clause.embeddings is None:
+                    logger.warning(f"Clause {clause.clause_id} has no embeddings")
+                else:
+                    embedded.append(idx)
             
-            # Calculate similarity scores
-            matches = []
-            for req in requirements:
-                try:
-                    req_embedding = self.get_requirement_embedding(req)
-                    similarity = self._cosine_similarity(
-                        clause_analysis.embeddings,
-                        req_embedding
-                    )
-                    
-                    # Only include matches above threshold
-                    if similarity >= self.similarity_threshold:
-                        matches.append((req, similarity))
-                        
-                except Exception as e:
-                    logger.error(
-                        f"Error calculating similarity for {req.requirement_id}: {e}"
-                    )
-                    continue
+            if not embedded:
+                return results
             
-            # Sort by similarity score (descending) and return top_k
-            matches.sort(key=lambda x: x[1], reverse=True)
-            top_matches = matches[:top_k]
+            clause_matrix = self._normalize_rows(
+                np.vstack([clauses[idx].embeddings for idx in embedded])
+            )
+            
+            # Group clause rows by clause type so each group is scored
+            # against only its own requirements' embedding rows
+            rows_by_type: Dict[str, List[int]] = {}
+            for row, idx in enumerate(embedded):
+                rows_by_type.setdefault(clauses[idx].clause_type, []).append(row)
+            
+            all_columns = np.arange(len(requirements))
+            for clause_type, rows in rows_by_type.items():
+                columns, requirement_matrix = self.get_clause_type_matrix(framework, clause_type)
+                
+                if columns.size == 0:
+                    logger.info(
+                        f"No requirements found for {framework} / {clause_type}, "
+                        f"searching all {framework} requirements"
+                    )
+                    columns = all_columns
+                    requirement_matrix = self.get_requirement_matrix(framework)
+                
+                block = clause_matrix[rows] @ requirement_matrix.T
+                np.clip(block, 0.0, 1.0, out=block)
+                for row, block_row in zip(rows, block):
+                    results[embedded[row]] = [
+                        (requirements[columns[col]], score)
+                        for col, score in self._top_k_above_threshold(block_row, top_k)
+                    ]
             
             logger.debug(
-                f"Found {len(top_matches)} matches for clause {clause_analysis.clause_id} "
-                f"in {framework}"
+                f"Matched {len(embedded)} clauses against {len(requirements)} "
+                f"{framework} requirements"
             )
             
-            return top_matches
+            return results
             
         except Exception as e:
-            logger.error(f"Error matching clause to requirements: {e}")
-            return []
+            logger.error(f"Error matching clauses to requirements: {e}")
+            return [[] for _ in clauses]
+    
+    def build_match_plan(
+        self,
+        clauses: List[ClauseAnalysis],
+        frameworks: List[str],
+        document_id: str = "unknown",
+        top_k: int = 5
+    ) -> RequirementMatchPlan:
+        """
+        Compute ranked requirement matches for all clauses and frameworks once.
+        
+        Args:
+            clauses: Analyzed clauses with embeddings
+            frameworks: Frameworks to match against
+            document_id: Document identifier
+            top_k: Number of matches kept per clause (covers both assessment
+                and missing-requirement detection)
+            
+        Returns:
+            RequirementMatchPlan shared by downstream compliance steps
+        """
+        plan = RequirementMatchPlan(
+            document_id=document_id,
+            clause_ids=[clause.clause_id for clause in clauses],
+            top_k=top_k
+        )
+        
+        for framework in frameworks:
+            framework_upper = framework.upper()
+            plan.matches[framework_upper] = self.match_clauses_to_requirements(
+                clauses,
+                framework_upper,
+                top_k=top_k
+            )
+        
+        logger.debug(
+            f"Built match plan for {len(clauses)} clauses across "
+            f"{len(plan.matches)} frameworks"
+        )
+        
+        return plan
     
     def find_missing_requirements(
         self,
         analyzed_clauses: List[ClauseAnalysis],
-        framework: str
+        framework: str,
+        match_plan: Optional[RequirementMatchPlan] = None
     ) -> List[RegulatoryRequirement]:
         """
         Identify mandatory requirements that are not covered by any clause.
@@ -303,6 +465,7 @@ class RegulatoryKnowledgeBase:
         Args:
             analyzed_clauses: List of analyzed clauses
             framework: Framework to check
+            match_plan: Precomputed matches to reuse (optional)
             
         Returns:
             List of missing mandatory requirements
@@ -312,19 +475,15 @@ class RegulatoryKnowledgeBase:
             all_requirements = self.get_requirements(framework)
             mandatory_requirements = [req for req in all_requirements if req.mandatory]
             
-            # Track which requirements are covered
-            covered_requirement_ids = set()
-            
-            # Check each clause against requirements
-            for clause in analyzed_clauses:
-                matches = self.match_clause_to_requirements(
-                    clause,
-                    framework,
+            if match_plan is None or not match_plan.has_framework(framework):
+                match_plan = self.build_match_plan(
+                    analyzed_clauses,
+                    [framework],
                     top_k=5  # Check more matches to ensure coverage
                 )
-                
-                for req, score in matches:
-                    covered_requirement_ids.add(req.requirement_id)
+            
+            # Track which requirements are covered
+            covered_requirement_ids = match_plan.covered_requirement_ids(framework)
             
             # Find missing requirements
             missing = [
@@ -355,14 +514,32 @@ class RegulatoryKnowledgeBase:
         Returns:
             RegulatoryRequirement if found, None otherwise
         """
-        all_reqs = self.get_all_requirements()
-        for req in all_reqs:
-            if req.requirement_id == requirement_id:
-                return req
+        self._ensure_indexes()
+        requirement = self._requirements_by_id.get(requirement_id)
+        if requirement is not None:
+            return requirement
         
         logger.warning(f"Requirement not found: {requirement_id}")
         return None
     
+    def get_requirement_vector(self, requirement_id: str) -> Optional[np.ndarray]:
+        """
+        Get a requirement's row of its framework's requirement matrix.
+        
+        Args:
+            requirement_id: Requirement ID
+            
+        Returns:
+            L2-normalized float32 embedding, or None if the ID is unknown
+        """
+        self._ensure_indexes()
+        position = self._requirement_positions.get(requirement_id)
+        if position is None:
+            return None
+        
+        framework, col = position
+        return self.get_requirement_matrix(framework)[col]
+    
     def search_requirements_by_keyword(
         self,
         keyword: str,
@@ -419,9 +596,77 @@ class RegulatoryKnowledgeBase:
             }
         
         stats['cached_embeddings'] = len(self._embedding_cache)
+        stats['embedding_cache'] = self._embedding_cache.get_stats()
         
         return stats
     
+    def get_requirements_version(self) -> str:
+        """
+        Get a version stamp of the loaded requirements.
+        
+        The stamp is a hash of every framework's requirements, so results
+        computed against the knowledge base can be checked for staleness.
+        
+        Returns:
+            Hex SHA-256 digest of the requirements
+        """
+        self._ensure_indexes()
+        
+        if self._requirements_version is None:
+            payload = json.dumps(
+                {
+                    framework: [req.to_dict() for req in requirements]
+                    for framework, requirements in self.framework_requirements.items()
+                },
+                sort_keys=True
+            )
+            self._requirements_version = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        
+        return self._requirements_version
+    
+    def _build_indexes(self):
+        """Index requirements by ID and by (framework, clause type) and drop stale matrices."""
+        self._requirements_by_id = {}
+        self._requirement_positions = {}
+        self._requirements_by_type = {}
+        type_columns: Dict[Tuple[str, str], List[int]] = {}
+        
+        for framework, requirements in self.framework_requirements.items():
+            for col, req in enumerate(requirements):
+                # First occurrence wins, as with a scan in framework order
+                if req.requirement_id not in self._requirements_by_id:
+                    self._requirements_by_id[req.requirement_id] = req
+                    self._requirement_positions[req.requirement_id] = (framework, col)
+                key = (framework, self._normalize_clause_type(req.clause_type))
+                type_columns.setdefault(key, []).append(col)
+                self._requirements_by_type.setdefault(key, []).append(req)
+        
+        self._clause_type_columns = {
+            key: np.array(columns, dtype=np.intp) for key, columns in type_columns.items()
+        }
+        self._requirement_matrices.clear()
+        self._clause_type_matrices.clear()
+        self._requirements_version = None
+        self._index_signature = self._requirements_signature()
+    
+    def _ensure_indexes(self):
+        """Rebuild the indexes if a framework requirement list was replaced or resized."""
+        if self._requirements_signature() != self._index_signature:
+            logger.debug("Requirements changed, rebuilding indexes")
+            self._build_indexes()
+    
+    def _requirements_signature(self) -> Tuple:
+        """Identify the current framework requirement lists cheaply."""
+        return tuple(
+            (framework, id(requirements), len(requirements))
+            for framework, requirements in self.framework_requirements.items()
+        )
+    
+    @staticmethod
+    def _normalize_clause_type(clause_type: str) -> str:
+        """Normalize a clause type for case-insensitive lookups."""
+        return clause_type.strip().lower()
+    
     @staticmethod
     def _cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
         """
@@ -444,6 +689,48 @@ class RegulatoryKnowledgeBase:
         # Ensure result is in [0, 1] range
         return float(max(0.0, min(1.0, similarity)))
     
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize each row of a matrix as float32.
+        
+        Args:
+            matrix: 2-D array of embeddings (or a single 1-D vector)
+            
+        Returns:
+            Row-normalized float32 matrix
+        """
+        matrix = np.atleast_2d(np.asarray(matrix, dtype=np.float32))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / (norms + 1e-10)
+    
+    def _top_k_above_threshold(
+        self,
+        scores: np.ndarray,
+        top_k: int
+    ) -> List[Tuple[int, float]]:
+        """
+        Select the top_k scores that meet the similarity threshold.
+        
+        Args:
+            scores: 1-D array of similarity scores
+            top_k: Maximum number of entries to return
+            
+        Returns:
+            List of (index, score) tuples sorted by score descending,
+            ties broken by index
+        """
+        if top_k <= 0:
+            return []
+        
+        candidates = np.flatnonzero(scores >= self.similarity_threshold)
+        if candidates.size > top_k:
+            partition = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+            candidates = candidates[partition]
+        
+        order = np.lexsort((candidates, -scores[candidates]))
+        return [(int(idx), float(scores[idx])) for idx in candidates[order]]
+    
     def set_similarity_threshold(self, threshold: float):
         """
         Update the similarity threshold.
@@ -460,4 +747,6 @@ class RegulatoryKnowledgeBase:
     def clear_embedding_cache(self):
         """Clear the embedding cache."""
         self._embedding_cache.clear()
+        self._requirement_matrices.clear()
+        self._clause_type_matrices.clear()
         logger.info("Embedding cache cleared")
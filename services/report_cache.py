@@ -0,0 +1,348 @@
+"""
+Report Cache - on-disk cache of compliance reports.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from models.clause_analysis import ClauseAnalysis
+from models.regulatory_requirement import (
+    ClauseComplianceResult,
+    ComplianceReport,
+    ComplianceStatus,
+    ComplianceSummary,
+    RegulatoryRequirement,
+    RequirementMatchPlan,
+    RiskLevel
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the cached report format changes so old entries are ignored
+CACHE_FORMAT_VERSION = 1
+
+
+class ReportCache:
+    """
+    Disk cache of compliance reports keyed by clause content, frameworks and
+    knowledge base settings.
+    
+    Each entry is one JSON file named by its key. Requirements are stored by
+    framework and ID and resolved against the knowledge base on a hit, which
+    the key guarantees to hold the same requirements. Entries older than
+    ttl_seconds are misses. Reads refresh the file's mtime, and writes evict
+    the least recently used entries once the cache exceeds max_bytes. Writes
+    are atomic renames, so concurrent processes can share the directory.
+    """
+    
+    def __init__(self, cache_dir: str, max_bytes: int, ttl_seconds: Optional[float] = None):
+        """
+        Initialize report cache.
+        
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            max_bytes: Maximum total size of cache entries in bytes
+            ttl_seconds: Maximum age of an entry (None for no expiry)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._total_bytes = sum(size for _, _, size in self._scan_entries())
+        
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(clauses: List[ClauseAnalysis], frameworks: List[str], settings: Dict[str, Any]) -> str:
+        """
+        Compute the cache key for a compliance check.
+        
+        Args:
+            clauses: Analyzed clauses (IDs, texts, types and embeddings are hashed)
+            frameworks: Frameworks checked (order does not matter)
+            settings: Other inputs that affect the report, such as the similarity
+                threshold, embedding model and requirement versions
+        
+        Returns:
+            Hex SHA-256 digest of the clauses, frameworks and settings
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps(
+            {'version': CACHE_FORMAT_VERSION, 'frameworks': sorted(frameworks), **settings},
+            sort_keys=True,
+            default=str
+        ).encode('utf-8'))
+        
+        for clause in clauses:
+            embeddings = None if clause.embeddings is None else np.ascontiguousarray(clause.embeddings)
+            digest.update(json.dumps([
+                clause.clause_id,
+                clause.clause_type,
+                clause.clause_text,
+                None if embeddings is None else [embeddings.dtype.str, list(embeddings.shape)]
+            ]).encode('utf-8'))
+            if embeddings is not None:
+                digest.update(embeddings.tobytes())
+        
+        return digest.hexdigest()
+    
+    def get(self, key: str, requirements: Iterable[RegulatoryRequirement]) -> Optional[ComplianceReport]:
+        """
+        Look up a cached report.
+        
+        Args:
+            key: Cache key from make_key()
+            requirements: Knowledge base requirements to resolve stored references against
+        
+        Returns:
+            ComplianceReport, or None on a miss
+        """
+        entry_path = self._entry_path(key)
+        
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable report cache entry {entry_path.name}: {e}")
+            self._remove(entry_path)
+            self.misses += 1
+            return None
+        
+        if self.ttl_seconds is not None and time.time() - entry.get('created_at', 0) > self.ttl_seconds:
+            logger.debug(f"Report cache entry expired: {entry_path.name}")
+            self._remove(entry_path)
+            self.misses += 1
+            return None
+        
+        requirements_by_ref: Dict[Tuple[str, str], RegulatoryRequirement] = {}
+        for requirement in requirements:
+            requirements_by_ref.setdefault((requirement.framework, requirement.requirement_id), requirement)
+        
+        try:
+            report = self._decode_report(entry['report'], requirements_by_ref)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Discarding stale report cache entry {entry_path.name}: {e}")
+            self._remove(entry_path)
+            self.misses += 1
+            return None
+        
+        try:
+            os.utime(entry_path)  # mark as recently used
+        except OSError:
+            pass
+        
+        self.hits += 1
+        return report
+    
+    def put(self, key: str, report: ComplianceReport):
+        """
+        Store a report, evicting old entries if over budget.
+        
+        Args:
+            key: Cache key from make_key()
+            report: Compliance report to cache
+        """
+        try:
+            payload = json.dumps(
+                {'created_at': time.time(), 'report': self._encode_report(report)},
+                ensure_ascii=False
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Report not cached: {e}")
+            return
+        data = payload.encode('utf-8')
+        
+        if len(data) > self.max_bytes:
+            return
+        
+        entry_path = self._entry_path(key)
+        tmp_path = entry_path.with_name(f".{entry_path.name}.{uuid.uuid4().hex}.tmp")
+        
+        try:
+            previous_size = entry_path.stat().st_size if entry_path.exists() else 0
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            logger.warning(f"Report cache write failed: {e}")
+            self._remove(tmp_path)
+            return
+        
+        with self._lock:
+            self._total_bytes += len(data) - previous_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+    
+    def clear(self):
+        """Delete all cache entries."""
+        with self._lock:
+            for entry_path, _, _ in self._scan_entries():
+                self._remove(entry_path)
+            self._total_bytes = 0
+        logger.info(f"Report cache cleared: {self.cache_dir}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with size, limit, and hit/miss counters
+        """
+        lookups = self.hits + self.misses
+        return {
+            'bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0
+        }
+    
+    @staticmethod
+    def _encode_report(report: ComplianceReport) -> Dict[str, Any]:
+        """Convert a report to JSON data, storing requirements as (framework, ID) references."""
+        def ref(requirement: RegulatoryRequirement) -> List[str]:
+            return [requirement.framework, requirement.requirement_id]
+        
+        positions = {id(result): i for i, result in enumerate(report.clause_results)}
+        high_risk_positions = [positions[id(item)] for item in report.high_risk_items if id(item) in positions]
+        if len(high_risk_positions) != len(report.high_risk_items):
+            raise ValueError("high-risk items are not clause results of the report")
+        
+        match_plan = report.match_plan
+        return {
+            'document_id': report.document_id,
+            'frameworks_checked': report.frameworks_checked,
+            'overall_score': report.overall_score,
+            'clause_results': [
+                {
+                    **result.to_dict(),
+                    'matched_requirements': [ref(req) for req in result.matched_requirements]
+                }
+                for result in report.clause_results
+            ],
+            'missing_requirements': [ref(req) for req in report.missing_requirements],
+            'high_risk_items': high_risk_positions,
+            'summary': report.summary.to_dict() if report.summary else None,
+            'match_plan': {
+                'document_id': match_plan.document_id,
+                'clause_ids': match_plan.clause_ids,
+                'top_k': match_plan.top_k,
+                'matches': {
+                    framework: [
+                        [ref(req) + [score] for req, score in clause_matches]
+                        for clause_matches in framework_matches
+                    ]
+                    for framework, framework_matches in match_plan.matches.items()
+                }
+            } if match_plan else None
+        }
+    
+    @staticmethod
+    def _decode_report(
+        data: Dict[str, Any],
+        requirements_by_ref: Dict[Tuple[str, str], RegulatoryRequirement]
+    ) -> ComplianceReport:
+        """Rebuild a report from _encode_report() data (KeyError if a requirement is gone)."""
+        def resolve(ref: List[str]) -> RegulatoryRequirement:
+            return requirements_by_ref[(ref[0], ref[1])]
+        
+        clause_results = [
+            ClauseComplianceResult(
+                clause_id=item['clause_id'],
+                clause_text=item['clause_text'],
+                clause_type=item['clause_type'],
+                framework=item['framework'],
+                compliance_status=ComplianceStatus(item['compliance_status']),
+                risk_level=RiskLevel(item['risk_level']),
+                matched_requirements=[resolve(ref) for ref in item['matched_requirements']],
+                confidence=item['confidence'],
+                issues=item['issues']
+            )
+            for item in data['clause_results']
+        ]
+        
+        match_plan = None
+        if data['match_plan'] is not None:
+            plan = data['match_plan']
+            match_plan = RequirementMatchPlan(
+                document_id=plan['document_id'],
+                clause_ids=plan['clause_ids'],
+                top_k=plan['top_k'],
+                matches={
+                    framework: [
+                        [(resolve(match), match[2]) for match in clause_matches]
+                        for clause_matches in framework_matches
+                    ]
+                    for framework, framework_matches in plan['matches'].items()
+                }
+            )
+        
+        return ComplianceReport(
+            document_id=data['document_id'],
+            frameworks_checked=data['frameworks_checked'],
+            overall_score=data['overall_score'],
+            clause_results=clause_results,
+            missing_requirements=[resolve(ref) for ref in data['missing_requirements']],
+            high_risk_items=[clause_results[i] for i in data['high_risk_items']],
+            summary=ComplianceSummary(**data['summary']) if data['summary'] else None,
+            match_plan=match_plan
+        )
+    
+    def _evict(self):
+        """Remove least recently used entries until under budget. Caller must hold the lock."""
+        # Rescan so entries written by other processes are counted too
+        entries = sorted(self._scan_entries(), key=lambda entry: entry[1])
+        self._total_bytes = sum(size for _, _, size in entries)
+        
+        evicted = 0
+        for entry_path, _, size in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            if self._remove(entry_path):
+                self._total_bytes -= size
+                evicted += 1
+        
+        if evicted:
+            logger.debug(f"Evicted {evicted} report cache entries")
+    
+    def _scan_entries(self):
+        """List (path, mtime, size) for every cache entry on disk."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.json') and entry.is_file():
+                try:
+                    stat = entry.stat()
+                    entries.append((Path(entry.path), stat.st_mtime, stat.st_size))
+                except FileNotFoundError:
+                    continue
+        return entries
+    
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / f"{key}.json"
+    
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        """Delete a file, ignoring one that is already gone."""
+        try:
+            path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Failed to remove report cache file {path}: {e}")
+            return False
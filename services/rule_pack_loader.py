@@ -0,0 +1,116 @@
+"""
+Rule Pack Loader - reads declarative compliance rule packs.
+
+A rule pack is a JSON (or, with PyYAML installed, YAML) file named
+<framework>_rules.json next to the data/*_requirements.py modules. It holds a
+framework's status thresholds, issue templates, clause-type keyword and regex
+checks, and optionally the framework's requirements, so a framework can be
+added or tuned without Python changes.
+"""
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from models.rule_pack import ISSUE_TEMPLATE_FIELDS, RulePack
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Try to import PyYAML, make it optional
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+    yaml = None
+
+DEFAULT_RULE_PACK_DIR = Path(__file__).parent.parent / "data"
+
+RULE_PACK_PATTERNS = ("*_rules.json", "*_rules.yaml", "*_rules.yml")
+
+
+def load_rule_pack(path: Union[str, Path]) -> RulePack:
+    """
+    Load and validate one rule pack file.
+    
+    Args:
+        path: Rule pack file (.json, .yaml or .yml)
+    
+    Returns:
+        Parsed RulePack
+    
+    Raises:
+        ImportError: If the file is YAML and PyYAML is not installed
+        ValueError: If the file is not a valid rule pack
+    """
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix in ('.yaml', '.yml'):
+            if not YAML_AVAILABLE:
+                raise ImportError(f"PyYAML is required to load {path}")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    
+    try:
+        pack = RulePack.from_dict(data, source=str(path))
+    except (KeyError, TypeError, AttributeError, ValueError) as e:
+        raise ValueError(f"Invalid rule pack {path}: {e}") from e
+    
+    unknown_templates = set(pack.issue_templates) - set(ISSUE_TEMPLATE_FIELDS)
+    if unknown_templates:
+        raise ValueError(f"Invalid rule pack {path}: unknown issue templates {sorted(unknown_templates)}")
+    
+    if not 0 <= pack.partial_threshold <= pack.compliant_threshold <= 1:
+        raise ValueError(f"Invalid rule pack {path}: thresholds must satisfy 0 <= partial <= compliant <= 1")
+    
+    for clause_type, checks in pack.checks.items():
+        for check in checks:
+            if not check.keywords and not check.patterns:
+                raise ValueError(f"Invalid rule pack {path}: check for {clause_type} has no keywords or patterns")
+            for pattern in check.patterns:
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    raise ValueError(f"Invalid rule pack {path}: bad pattern {pattern!r}: {e}") from e
+    
+    return pack
+
+
+def load_rule_packs(directory: Optional[Union[str, Path]] = None) -> Dict[str, RulePack]:
+    """
+    Load every rule pack in a directory.
+    
+    Results are cached per directory; packs are read once per process.
+    
+    Args:
+        directory: Rule pack directory (default: data/)
+    
+    Returns:
+        Dictionary mapping framework name to RulePack
+    """
+    return dict(_load_rule_packs(str(Path(directory or DEFAULT_RULE_PACK_DIR).resolve())))
+
+
+@lru_cache(maxsize=8)
+def _load_rule_packs(directory: str) -> Dict[str, RulePack]:
+    """Load and cache the rule packs of a resolved directory (see load_rule_packs)."""
+    packs: Dict[str, RulePack] = {}
+    
+    for pattern in RULE_PACK_PATTERNS:
+        for path in sorted(Path(directory).glob(pattern)):
+            if path.suffix != '.json' and not YAML_AVAILABLE:
+                logger.warning(f"Skipping rule pack {path}: PyYAML not installed")
+                continue
+            
+            pack = load_rule_pack(path)
+            if pack.framework in packs:
+                raise ValueError(
+                    f"Duplicate rule pack for {pack.framework}: {packs[pack.framework].source} and {path}"
+                )
+            packs[pack.framework] = pack
+    
+    logger.info(f"Loaded {len(packs)} rule packs from {directory}")
+    return packs
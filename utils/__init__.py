@@ -1,8 +1,12 @@
 """Utilities package."""
 from .logger import get_logger, ComplianceLogger, SensitiveDataFilter
+from .cache import LRUCache
+from .keyword_matcher import KeywordMatcher
 
 __all__ = [
     'get_logger',
     'ComplianceLogger',
-    'SensitiveDataFilter'
+    'SensitiveDataFilter',
+    'LRUCache',
+    'KeywordMatcher'
 ]
@@ -0,0 +1,156 @@
+"""
+Bounded in-memory caches.
+"""
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+def _default_sizeof(value: Any) -> int:
+    """Estimate the memory footprint of a cached value in bytes."""
+    nbytes = getattr(value, 'nbytes', None)
+    if nbytes is not None:
+        return int(nbytes)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache bounded by entry count and bytes.
+    
+    Either limit may be None to disable it. Hit, miss and eviction counters
+    are exposed through get_stats().
+    """
+    
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = _default_sizeof
+    ):
+        """
+        Initialize LRU cache.
+        
+        Args:
+            max_entries: Maximum number of entries (None for unlimited)
+            max_bytes: Maximum total size of values in bytes (None for unlimited)
+            sizeof: Function returning the size of a value in bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a value and mark it as recently used.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+        
+        Returns:
+            Cached value, or default if not present
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+    
+    def put(self, key: Hashable, value: Any):
+        """
+        Insert or replace a value, evicting least-recently-used entries as needed.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        size = self._sizeof(value)
+        
+        with self._lock:
+            # A value larger than the whole budget is never cached
+            if self.max_bytes is not None and size > self.max_bytes:
+                self._discard(key)
+                return
+            
+            self._discard(key)
+            self._data[key] = value
+            self._sizes[key] = size
+            self._total_bytes += size
+            
+            while self._data and (
+                (self.max_entries is not None and len(self._data) > self.max_entries) or
+                (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+            ):
+                oldest_key = next(iter(self._data))
+                self._discard(oldest_key)
+                self.evictions += 1
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove a value from the cache.
+        
+        Args:
+            key: Cache key
+            default: Value returned if the key is absent
+        
+        Returns:
+            Removed value, or default
+        """
+        with self._lock:
+            value = self._data.get(key, default)
+            self._discard(key)
+            return value
+    
+    def clear(self):
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with size, limits, and hit/miss/eviction counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._data),
+                'bytes': self._total_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / lookups if lookups else 0.0
+            }
+    
+    def __contains__(self, key: Hashable) -> bool:
+        """Check membership without affecting recency or counters."""
+        with self._lock:
+            return key in self._data
+    
+    def __len__(self) -> int:
+        """Get the number of cached entries."""
+        return len(self._data)
+    
+    def _discard(self, key: Hashable):
+        """Remove a key if present. Caller must hold the lock."""
+        if key in self._data:
+            del self._data[key]
+            self._total_bytes -= self._sizes.pop(key)
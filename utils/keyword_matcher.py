@@ -0,0 +1,66 @@
+"""
+Precompiled multi-keyword matching.
+"""
+from typing import Dict, Iterable, List
+
+
+class KeywordMatcher:
+    """
+    Find which of a fixed set of keywords occur in a text.
+    
+    Keywords are compiled once into a search plan: duplicates are dropped and
+    shorter keywords are searched first, so a keyword is only searched for
+    when every other keyword it contains has already been found. Matching is
+    case-sensitive; lowercase texts and keywords beforehand if needed.
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Initialize keyword matcher.
+        
+        Args:
+            keywords: Keywords or phrases to match (duplicates are ignored)
+        """
+        self.keywords = list(dict.fromkeys(keyword for keyword in keywords if keyword))
+        
+        self._plan = []
+        for keyword in sorted(self.keywords, key=len):
+            contained = tuple(
+                other for other in self.keywords
+                if other != keyword and other in keyword
+            )
+            self._plan.append((keyword, contained, f" {keyword} "))
+    
+    def match(self, text: str) -> Dict[str, bool]:
+        """
+        Match all keywords against a text.
+        
+        Args:
+            text: Text to search
+        
+        Returns:
+            Dictionary mapping each keyword found to True if it also occurs
+            as a whole phrase delimited by spaces or the ends of the text
+        """
+        padded = f" {text} "
+        found: Dict[str, bool] = {}
+        
+        for keyword, contained, delimited in self._plan:
+            if contained and not all(other in found for other in contained):
+                continue
+            if keyword in text:
+                found[keyword] = delimited in padded
+        
+        return found
+    
+    def match_batch(self, texts: Iterable[str]) -> List[Dict[str, bool]]:
+        """
+        Match all keywords against several texts.
+        
+        Args:
+            texts: Texts to search
+        
+        Returns:
+            List of match dictionaries (see match()), one per text
+        """
+        return [self.match(text) for text in texts]